@@ -0,0 +1,211 @@
+"""
+端到端流水线基准：在合成谱面库上依次运行谱面校验、ROM 生成、ChartAnalyzer.analyze、
+各 ChartVisualizer.generate_* 图表、summary 写出与 generate_protocol，按阶段统计耗时。
+
+每个谱面库在独立的子进程（spawn）中运行，峰值 RSS 只反映该谱面库；所有输出写入临时目录，
+不会改动 charts/、verilog/ 与 outputs/。
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows 没有 resource 模块，峰值 RSS 记为 None
+    resource = None
+
+# 添加父目录到路径，以便导入 chart_engine / chart_analysis
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import numpy as np
+
+try:
+    from chart_analysis import chart_analysis as pipeline
+except ImportError:
+    # 以脚本方式运行时 chart_analysis 即同目录的 chart_analysis.py
+    import chart_analysis as pipeline
+from chart_engine.chart_engine import (
+    ROM_LEN, build_rom_image, build_sparse_image, chart_check, format_sparse_hex, parse_chart, write_rom,
+)
+from chart_engine.generator import ChartConstraints, random_chart, write_chart
+
+RESULTS_PATH = Path(__file__).parent / "outputs" / "pipeline_benchmark.json"
+RESULTS_VERSION = 1
+LIBRARY_SIZES = (10, 100, 1000)
+# 合成谱面的长度范围（tick），上限内的谱面可生成稠密 ROM，超出时改用稀疏编码
+MIN_TICKS = 200
+MAX_TICKS = 4000
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 单位为 KB，macOS 为字节
+    return round(peak / (1 << 20 if sys.platform == "darwin" else 1 << 10), 1)
+
+
+def build_library(charts_dir: Path, count: int, seed: Optional[int] = 0,
+                  min_ticks: int = MIN_TICKS, max_ticks: int = MAX_TICKS) -> List[str]:
+    """在 ``charts_dir`` 下生成 ``count`` 个长度、BPM 与密度各不相同的谱面，返回谱面名"""
+    names = []
+    for idx, chart_seed in enumerate(np.random.SeedSequence(seed).spawn(count)):
+        rng = np.random.default_rng(chart_seed)
+        name = f"Bench_{idx:04d}"
+        constraints = ChartConstraints(
+            density=float(rng.uniform(0.1, 0.6)),
+            hold_ratio=float(rng.uniform(0.0, 0.3)),
+            max_ticks=int(rng.integers(min_ticks, max_ticks + 1)),
+        )
+        chart = random_chart(rng, bpm=int(rng.integers(90, 240)), name=name, constraints=constraints)
+        write_chart(chart, charts_dir / name / f"{name}.txt")
+        names.append(name)
+    return names
+
+
+class StageTimer:
+    """按阶段累计耗时"""
+
+    def __init__(self):
+        self.totals: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.totals[name] = self.totals.get(name, 0.0) + time.perf_counter() - start
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+    def report(self, charts: int) -> Dict[str, dict]:
+        total = sum(self.totals.values()) or 1.0
+        return {
+            name: {
+                "total_s": round(seconds, 4),
+                "calls": self.counts[name],
+                "mean_ms": round(seconds / self.counts[name] * 1000, 3),
+                "charts_per_s": round(charts / seconds, 1) if seconds else None,
+                "share": round(seconds / total, 4),
+            }
+            for name, seconds in self.totals.items()
+        }
+
+
+def run_library(count: int, seed: Optional[int] = 0) -> dict:
+    """在临时目录中生成并处理一个谱面库，返回该谱面库的各阶段统计"""
+    rss_before = _peak_rss_mb()
+    timer = StageTimer()
+    failed = 0
+    with tempfile.TemporaryDirectory(prefix="pipeline_bench_") as tmp_dir:
+        root = Path(tmp_dir)
+        charts_dir = root / "charts"
+        verilog_dir = root / "verilog"
+        verilog_dir.mkdir()
+        build_start = time.perf_counter()
+        names = build_library(charts_dir, count, seed)
+        build_s = time.perf_counter() - build_start
+
+        # chart_analysis 通过模块级路径定位谱面与输出，指向临时目录
+        pipeline.CHARTS_DIR = charts_dir
+        pipeline.OUTPUT_DIR = root / "outputs"
+        pipeline.OUTPUT_DIR.mkdir()
+        cache = pipeline.AnalysisCache(pipeline.OUTPUT_DIR / "manifest.json")
+
+        events = 0
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for name in names:
+                chart_file = charts_dir / name / f"{name}.txt"
+                with timer.stage("validate"):
+                    ok = chart_check(name, chart_file)
+                if not ok:
+                    failed += 1
+                    continue
+
+                with timer.stage("rom"):
+                    chart, _ = parse_chart(name, chart_file, use_binary=False)
+                    if chart.duration < ROM_LEN:
+                        write_rom(build_rom_image(chart), verilog_dir / f"{name}_ROM.v", "hex")
+                    else:
+                        (verilog_dir / f"{name}_ROM.sparse.hex").write_text(
+                            format_sparse_hex(build_sparse_image(chart)), encoding="ascii")
+                events += len(chart)
+
+                with timer.stage("analyze"):
+                    stats = pipeline.analyze_chart(name)
+                if stats is None:
+                    failed += 1
+                    continue
+
+                for suffix, method_name in pipeline.CHART_FIGURES:
+                    with timer.stage(method_name):
+                        pipeline.render_figure(name, stats, suffix, method_name)
+
+                with timer.stage("write_summary"):
+                    pipeline.write_summary(name, stats)
+                    cache.record(name, cache.key_for(chart_file), stats)
+
+            with timer.stage("generate_protocol"):
+                cache.save()
+                pipeline.generate_protocol(cache)
+        elapsed = time.perf_counter() - start
+
+    return {
+        "charts": count,
+        "failed": failed,
+        "events": events,
+        "library_build_s": round(build_s, 3),
+        "pipeline_s": round(elapsed, 3),
+        "charts_per_s": round(count / elapsed, 2) if elapsed else None,
+        "peak_rss_mb": _peak_rss_mb(),
+        "baseline_rss_mb": rss_before,
+        "stages": timer.report(count),
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="谱面流水线端到端基准（各阶段耗时、峰值 RSS、每秒谱面数）")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(LIBRARY_SIZES),
+                        help="合成谱面库的谱面数（默认 10 100 1000）")
+    parser.add_argument("--seed", type=int, default=0, help="合成谱面库的随机种子")
+    parser.add_argument("--output", default=str(RESULTS_PATH), help="结果 JSON 路径")
+    args = parser.parse_args(argv)
+
+    report = {
+        "version": RESULTS_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "libraries": [],
+    }
+    context = multiprocessing.get_context("spawn")
+    for size in args.sizes:
+        # 每个谱面库使用新的子进程，峰值 RSS 互不影响
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            result = pool.submit(run_library, size, args.seed).result()
+        report["libraries"].append(result)
+        slowest = sorted(result["stages"].items(), key=lambda item: -item[1]["total_s"])[:3]
+        print(f"[benchmark] {size} 个谱面：{result['pipeline_s']:.2f}s，{result['charts_per_s']} 个/秒，"
+              f"峰值 RSS {result['peak_rss_mb']} MB；最慢阶段 "
+              + "，".join(f"{name} {stage['total_s']:.2f}s" for name, stage in slowest))
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"[benchmark] 结果已写入 {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,14 @@
 谱面分析工具：对 charts/ 目录下的谱面进行统计与可视化分析。
 """
 
+import argparse
+import contextlib
+import hashlib
+import io
 import json
-import re
+import os
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 import sys
 
 # 字体放大倍率
@@ -43,103 +47,167 @@ NOTE_TYPE_LABELS = {
 
 # 添加父目录到路径，以便导入 chart_engine
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from chart_engine.chart_engine import chart_check
-
-try:
-    import matplotlib
-    matplotlib.use('Agg')  # 使用非交互式后端
-    import matplotlib.pyplot as plt
-    import numpy as np
-    plt.rcParams.update({
-        'font.size': fs(11),
-        'font.sans-serif': ['Microsoft YaHei', 'SimHei', 'Arial'],
-        'axes.unicode_minus': False,
-    })
-except ImportError:
-    print("警告: matplotlib 或 numpy 未安装，请运行: pip install -r requirements.txt")
-    raise
-
-
-# 配置路径
+from chart_engine import instrument
+from chart_engine.chart_engine import (
+    HOLD_START, TAP, TYPE_NAMES, Chart, _replace_text, parse_chart, validate_chart,
+)
+
+# numpy / matplotlib 按需导入：--help、缓存命中与 --no-plots 都不加载绘图栈
+np = None
+plt = None
+
+
+def load_numpy():
+    """首次分析谱面时导入 numpy"""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            print("警告: numpy 未安装，请运行: pip install -r requirements.txt")
+            raise
+        np = numpy
+    return np
+
+
+def load_plotting():
+    """首次渲染图表时导入 matplotlib（Agg 后端）并设置全局样式；常驻进程可提前调用以预热"""
+    global plt
+    if plt is None:
+        load_numpy()
+        try:
+            import matplotlib
+            matplotlib.use('Agg')  # 使用非交互式后端
+            import matplotlib.pyplot as pyplot
+        except ImportError:
+            print("警告: matplotlib 未安装，请运行: pip install -r requirements.txt")
+            raise
+        pyplot.rcParams.update({
+            'font.size': fs(11),
+            'font.sans-serif': ['Microsoft YaHei', 'SimHei', 'Arial'],
+            'axes.unicode_minus': False,
+        })
+        plt = pyplot
+    return plt
+
+
+# 配置路径（输出目录在实际写出前才创建）
 CHARTS_DIR = Path(__file__).parent.parent / "charts"
 OUTPUT_DIR = Path(__file__).parent / "outputs"
-OUTPUT_DIR.mkdir(exist_ok=True)
+MANIFEST_PATH = OUTPUT_DIR / "manifest.json"
+
+# 分析 / 绘图逻辑版本号：修改统计口径或图表样式时递增，使缓存失效
+ANALYZER_VERSION = 1
+RENDERER_VERSION = 4
+
+# 原图 9x6 英寸 @200dpi（1800x1200）；缩略图 @60dpi（540x360），供前端悬停预览
+FIGURE_DPI = 200
+THUMBNAIL_DPI = 60
+THUMBNAIL_SUFFIX = '_thumb'
+
+
+def thumbnail_name(file_name: str) -> str:
+    """图表文件名对应的缩略图文件名：``A_note_count.png`` -> ``A_note_count_thumb.png``"""
+    stem, dot, ext = file_name.rpartition('.')
+    return f"{stem}{THUMBNAIL_SUFFIX}{dot}{ext}" if dot else f"{file_name}{THUMBNAIL_SUFFIX}"
+
+
+def _save_with_thumbnail(fig, output_path: Path, dpi: int):
+    """以 ``dpi`` 栅格化一次，原图与缩略图都取自同一块 Agg 缓冲区。
+
+    缩略图按 THUMBNAIL_DPI / dpi 做区域平均缩小，再量化为 256 色调色板 PNG，体积与单独以低 dpi 保存相当。
+    figure 背景不透明，因此丢弃 alpha 通道按 RGB 写出。
+    """
+    from PIL import Image  # matplotlib 自身依赖 Pillow
+    output_path = Path(output_path)
+    fig.set_dpi(dpi)
+    fig.canvas.draw()
+    image = Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert('RGB')
+    image.save(output_path, dpi=(dpi, dpi))
+    scale = THUMBNAIL_DPI / dpi
+    size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+    thumbnail = image.resize(size, Image.Resampling.BOX).quantize(256)
+    thumbnail.save(output_path.with_name(thumbnail_name(output_path.name)), dpi=(THUMBNAIL_DPI, THUMBNAIL_DPI))
 
 
 class ChartParser:
-    """谱面解析器"""
+    """谱面解析器：基于 chart_engine 的共享解析结果（Chart）"""
     
-    def __init__(self, chart_path: Path):
+    def __init__(self, chart_path: Path, chart: Optional[Chart] = None):
         self.chart_path = chart_path
-        self.bpm = None
-        self.notes: List[Tuple[int, str, int]] = []  # (time, type, track)
-        self.duration = 0
+        self.chart = chart
+        self.bpm = chart.bpm if chart is not None else None
+        self.duration = chart.duration if chart is not None else 0
+    
+    @classmethod
+    def from_chart(cls, chart: Chart) -> 'ChartParser':
+        """直接包装已解析的 Chart，避免重复读取文件"""
+        return cls(chart.path, chart)
+    
+    @property
+    def notes(self) -> List[Tuple[int, str, int]]:
+        """(time, type, track) 列表"""
+        if self.chart is None:
+            return []
+        return list(self.chart.events())
         
     def parse(self) -> bool:
         """解析谱面文件，返回是否成功"""
-        try:
-            with open(self.chart_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # 解析 BPM
-            if not lines or not lines[0].startswith('bpm='):
-                print(f"错误: {self.chart_path} 缺少 BPM 行")
-                return False
-            
-            bpm_match = re.match(r'bpm=(\d+)', lines[0].strip())
-            if not bpm_match:
-                print(f"错误: {self.chart_path} BPM 格式错误")
-                return False
-            self.bpm = int(bpm_match.group(1))
-            
-            # 解析音符
-            for line in lines[1:]:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # 匹配格式: (time,type,track)
-                match = re.match(r'\((\d+),(\w+),(\d+)\)', line)
-                if match:
-                    time = int(match.group(1))
-                    note_type = match.group(2)
-                    track = int(match.group(3))
-                    self.notes.append((time, note_type, track))
-                    self.duration = max(self.duration, time)
-            
-            return True
-        except Exception as e:
-            print(f"解析 {self.chart_path} 时出错: {e}")
+        chart, error = parse_chart(self.chart_path.stem, self.chart_path)
+        if chart is None:
+            print(f"错误: {self.chart_path} {error}")
             return False
+        self.chart = chart
+        self.bpm = chart.bpm
+        self.duration = chart.duration
+        return True
 
 
 class ChartAnalyzer:
-    """谱面分析器"""
+    """谱面分析器：音符以 NumPy 数组存储，所有统计量用 bincount/unique 批量计算"""
+    
+    # 按 type code 索引的难度权重：tap=1, hold_start=1.5, hold_mid=0.3
+    TYPE_WEIGHTS = (1.0, 1.0, 1.5, 0.3)
     
     def __init__(self, chart_name: str, parser: ChartParser):
+        load_numpy()
+        self.type_weights = np.array(self.TYPE_WEIGHTS)
         self.chart_name = chart_name
         self.parser = parser
         self.stats = {}
+        chart = parser.chart
+        if chart is not None and len(chart):
+            # array('i') / array('b') 直接作为缓冲区，无需逐元素拷贝
+            self.times = np.frombuffer(chart.times, dtype=np.intc).astype(np.int64)
+            self.types = np.frombuffer(chart.types, dtype=np.int8)
+            self.tracks = np.frombuffer(chart.tracks, dtype=np.int8)
+        else:
+            self.times = np.zeros(0, dtype=np.int64)
+            self.types = np.zeros(0, dtype=np.int8)
+            self.tracks = np.zeros(0, dtype=np.int8)
         
     def analyze(self):
         """执行统计分析"""
-        notes = self.parser.notes
+        times, types, tracks = self.times, self.types, self.tracks
         bpm = self.parser.bpm
         duration = self.parser.duration
         
         # 总音符数（只统计 tap 和 hold_start，不重复计算 hold_mid）
-        tap_count = sum(1 for _, nt, _ in notes if nt == 'tap')
-        hold_start_count = sum(1 for _, nt, _ in notes if nt == 'hold_start')
+        type_counts = np.bincount(types, minlength=len(self.TYPE_WEIGHTS))
+        tap_count = int(type_counts[TAP])
+        hold_start_count = int(type_counts[HOLD_START])
         total_note_count = tap_count + hold_start_count
         
-        # 类型分布
-        type_distribution = {}
-        for _, note_type, _ in notes:
-            type_distribution[note_type] = type_distribution.get(note_type, 0) + 1
+        # 类型分布（按首次出现顺序）
+        type_distribution = {
+            TYPE_NAMES[code]: int(type_counts[code]) for code in self._first_seen(types)
+        }
         
-        # 计算密度曲线（按时间窗口统计）
+        # 时间窗口编号，密度曲线与难度曲线共用
         window_size = max(100, duration // 100)  # 时间窗口大小
-        density_curve = self._calculate_density_curve(notes, duration, window_size)
+        windows = times // window_size
+        head_mask = (types == TAP) | (types == HOLD_START)
+        density_curve = self._calculate_density_curve(windows, head_mask, window_size)
         
         # 密度统计
         if density_curve:
@@ -150,17 +218,16 @@ class ChartAnalyzer:
             density_avg = 0
         
         # 轨道分布（使用字符串键以保持一致性）
-        track_distribution = {}
-        for _, _, track in notes:
-            track_key = str(track)
-            track_distribution[track_key] = track_distribution.get(track_key, 0) + 1
+        track_counts = np.bincount(tracks)
+        track_distribution = {
+            str(track): int(track_counts[track]) for track in self._first_seen(tracks)
+        }
         
         # 时间分布（用于直方图，只统计 tap 和 hold_start）
-        time_distribution = [time for time, note_type, _ in notes 
-                           if note_type in ['tap', 'hold_start']]
+        time_distribution = times[head_mask].tolist()
         
         # 计算难度曲线（基于密度和音符类型复杂度）
-        difficulty_curve = self._calculate_difficulty_curve(notes, duration, window_size)
+        difficulty_curve = self._calculate_difficulty_curve(windows, types, tracks, window_size)
         
         self.stats = {
             'title': self.chart_name,
@@ -177,58 +244,171 @@ class ChartAnalyzer:
             'time_distribution': time_distribution,
             'difficulty_curve': difficulty_curve
         }
-        
-    def _calculate_density_curve(self, notes: List[Tuple[int, str, int]], 
-                                  duration: int, window_size: int) -> Dict[int, int]:
-        """计算密度曲线：每个时间窗口内的音符数量"""
-        density = {}
-        for time, note_type, _ in notes:
-            # 只统计 tap 和 hold_start
-            if note_type in ['tap', 'hold_start']:
-                window = (time // window_size) * window_size
-                density[window] = density.get(window, 0) + 1
-        return density
-    
-    def _calculate_difficulty_curve(self, notes: List[Tuple[int, str, int]], 
-                                     duration: int, window_size: int) -> Dict[int, float]:
+    
+    @staticmethod
+    def _first_seen(values: 'np.ndarray') -> List[int]:
+        """返回去重后的取值，按首次出现顺序排列"""
+        uniq, first = np.unique(values, return_index=True)
+        return uniq[np.argsort(first, kind='stable')].tolist()
+        
+    def _calculate_density_curve(self, windows: 'np.ndarray', head_mask: 'np.ndarray',
+                                  window_size: int) -> Dict[int, int]:
+        """计算密度曲线：每个时间窗口内的音符数量（只统计 tap 和 hold_start）"""
+        uniq, first, counts = np.unique(windows[head_mask], return_index=True, return_counts=True)
+        order = np.argsort(first, kind='stable')
+        keys = (uniq[order] * window_size).tolist()
+        return dict(zip(keys, counts[order].tolist()))
+    
+    def _calculate_difficulty_curve(self, windows: 'np.ndarray', types: 'np.ndarray',
+                                     tracks: 'np.ndarray', window_size: int) -> Dict[int, float]:
         """计算难度曲线：综合考虑密度、音符类型复杂度、轨道分布"""
-        difficulty = {}
-        
-        # 音符类型权重：tap=1, hold_start=1.5, hold_mid=0.3
-        type_weights = {'tap': 1.0, 'hold_start': 1.5, 'hold_mid': 0.3, 'hold_end': 0.5}
-        
-        for time, note_type, track in notes:
-            window = (time // window_size) * window_size
-            weight = type_weights.get(note_type, 1.0)
-            
-            if window not in difficulty:
-                difficulty[window] = {'count': 0, 'weighted_sum': 0.0, 'tracks': set()}
-            
-            difficulty[window]['count'] += 1
-            difficulty[window]['weighted_sum'] += weight
-            difficulty[window]['tracks'].add(track)
-        
-        # 计算最终难度分数：加权和 * 轨道复杂度因子
-        difficulty_scores = {}
-        for window, data in difficulty.items():
-            # 轨道复杂度：多轨道同时出现增加难度
-            track_complexity = 1.0 + 0.2 * (len(data['tracks']) - 1)
-            # 密度因子：音符越多，难度增长越快（非线性）
-            density_factor = 1.0 + 0.1 * (data['count'] - 1)
-            # 最终难度 = 加权和 * 轨道复杂度 * 密度因子
-            difficulty_scores[window] = data['weighted_sum'] * track_complexity * density_factor
-        
-        return difficulty_scores
+        if not len(windows):
+            return {}
+        uniq, first, inverse = np.unique(windows, return_index=True, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        n_windows = len(uniq)
+        
+        # bincount 按输入顺序累加权重，与逐个音符累加的浮点结果一致
+        counts = np.bincount(inverse, minlength=n_windows)
+        weighted_sum = np.bincount(inverse, weights=self.type_weights[types], minlength=n_windows)
+        
+        # 每个窗口内出现过的不同轨道数
+        n_track_values = int(tracks.max()) + 1
+        pairs = np.unique(inverse * n_track_values + tracks)
+        track_kinds = np.bincount(pairs // n_track_values, minlength=n_windows)
+        
+        # 轨道复杂度：多轨道同时出现增加难度
+        track_complexity = 1.0 + 0.2 * (track_kinds - 1)
+        # 密度因子：音符越多，难度增长越快（非线性）
+        density_factor = 1.0 + 0.1 * (counts - 1)
+        # 最终难度 = 加权和 * 轨道复杂度 * 密度因子
+        scores = weighted_sum * track_complexity * density_factor
+        
+        order = np.argsort(first, kind='stable')
+        keys = (uniq[order] * window_size).tolist()
+        return dict(zip(keys, scores[order].tolist()))
+
+
+class FigureTemplate:
+    """预先布局好的图表模板：figure/axes、标题、坐标轴样式只在每个进程中创建一次。
+
+    使用固定边距（不调用 tight_layout，也不使用 bbox_inches='tight'），
+    每个谱面只替换数据相关的 artist 后直接保存。
+    """
+    
+    # 饼图与坐标轴图的固定边距（figure 坐标）
+    PIE_MARGINS = dict(left=0.04, right=0.96, bottom=0.04, top=0.86)
+    AXES_MARGINS = dict(left=0.15, right=0.97, bottom=0.17, top=0.88)
+    
+    def __init__(self, title: str, xlabel: Optional[str] = None, ylabel: Optional[str] = None,
+                 grid_axis: Optional[str] = None, pie: bool = False):
+        load_plotting()
+        self.fig, self.ax = plt.subplots(figsize=(9, 6), facecolor='white')
+        ax = self.ax
+        ax.set_title(title, fontsize=fs(16), fontweight='bold', pad=20, color='#2C3E50')
+        if pie:
+            self.fig.subplots_adjust(**self.PIE_MARGINS)
+        else:
+            self.fig.subplots_adjust(**self.AXES_MARGINS)
+            ax.set_xlabel(xlabel, fontsize=fs(13), fontweight='bold')
+            ax.set_ylabel(ylabel, fontsize=fs(13), fontweight='bold')
+            ax.grid(True, alpha=0.3, axis=grid_axis or 'both', linestyle='--')
+            ax.spines['top'].set_visible(False)
+            ax.spines['right'].set_visible(False)
+        # 每个谱面重新生成的 artist（填充区域、柱子、标注等），保存前替换
+        self.dynamic = []
+    
+    def reset(self):
+        """移除上一个谱面的动态 artist"""
+        for artist in self.dynamic:
+            artist.remove()
+        self.dynamic = []
+    
+    def rescale(self):
+        """按当前 artist 重新计算坐标范围"""
+        self.ax.relim()
+        self.ax.autoscale_view()
+    
+    def save(self, output_path: Path):
+        _save_with_thumbnail(self.fig, output_path, FIGURE_DPI)
+
+
+# 每个进程内复用的模板：{ChartVisualizer 方法名: FigureTemplate}
+_FIGURE_TEMPLATES: Dict[str, FigureTemplate] = {}
+
+
+def _get_template(key: str, **kwargs) -> FigureTemplate:
+    template = _FIGURE_TEMPLATES.get(key)
+    if template is None:
+        template = FigureTemplate(**kwargs)
+        _FIGURE_TEMPLATES[key] = template
+    return template
 
 
 class ChartVisualizer:
     """谱面可视化器"""
     
-    def __init__(self, chart_name: str, analyzer: ChartAnalyzer):
+    # 饼图配色
+    PIE_COLORS = {
+        'tap': '#FF6B6B',      # 红色
+        'hold_start': '#4ECDC4',  # 青色
+        'hold_end': '#45B7D1',    # 蓝色
+    }
+    
+    def __init__(self, chart_name: str, analyzer: Optional[ChartAnalyzer] = None,
+                 stats: Optional[dict] = None):
+        load_plotting()
         self.chart_name = chart_name
         self.analyzer = analyzer
-        self.stats = analyzer.stats
+        # 并行渲染时子进程只拿到 stats，不需要完整的 analyzer
+        self.stats = stats if stats is not None else analyzer.stats
+    
+    @staticmethod
+    def _render_empty(output_path: Path, title: str, xlabel: Optional[str] = None,
+                      ylabel: Optional[str] = None):
+        """无数据时输出占位图（少见情况，不走模板）"""
+        load_plotting()
+        fig, ax = plt.subplots(figsize=(9, 6))
+        ax.text(0.5, 0.5, '暂无数据', ha='center', va='center', fontsize=fs(16))
+        ax.set_title(title, fontsize=fs(16), fontweight='bold', pad=20)
+        if xlabel:
+            ax.set_xlabel(xlabel, fontsize=fs(13), fontweight='bold')
+        if ylabel:
+            ax.set_ylabel(ylabel, fontsize=fs(13), fontweight='bold')
+        _save_with_thumbnail(fig, output_path, 150)
+        plt.close(fig)
+    
+    def _render_pie(self, template: FigureTemplate, output_path: Path, type_keys: List[str],
+                    sizes: List[float], autopct, fallback_cmap):
+        """在饼图模板上重绘扇形（扇形数量随谱面变化，直接替换 wedge 与文字）"""
+        ax = template.ax
+        template.reset()
+        labels = [NOTE_TYPE_LABELS.get(label, label) for label in type_keys]
+        colors = [self.PIE_COLORS.get(label, fallback_cmap(i / len(type_keys)))
+                  for i, label in enumerate(type_keys)]
+        before = set(ax.patches) | set(ax.texts)
+        wedges, texts, autotexts = ax.pie(
+            sizes,
+            labels=labels,
+            autopct=autopct,
+            startangle=90,
+            colors=colors,
+            explode=[0.05] * len(labels),  # 分离各扇形
+            shadow=True,
+            textprops={'fontsize': fs(12), 'fontweight': 'bold'},
+            pctdistance=0.85
+        )
+        
+        # 优化数量/百分比文字样式
+        for autotext in autotexts:
+            autotext.set_color('white')
+            autotext.set_fontweight('bold')
+            autotext.set_fontsize(fs(11))
         
+        # 包含 shadow 在内的所有新增 artist，下一个谱面渲染前移除
+        template.dynamic = [a for a in list(ax.patches) + list(ax.texts) if a not in before]
+        template.save(output_path)
+    
     def generate_note_count_chart(self, output_path: Path):
         """生成音符类型数量饼图（优化版）"""
         type_dist = self.stats['note_types']
@@ -237,150 +417,43 @@ class ChartVisualizer:
         filtered_types = {k: v for k, v in type_dist.items() if k != 'hold_mid'}
         
         if not filtered_types:
-            # 如果没有数据，创建空图
-            fig, ax = plt.subplots(figsize=(9, 6))  # 正方形，适配饼图
-            ax.text(0.5, 0.5, '暂无数据', ha='center', va='center', fontsize=fs(16))
-            ax.set_title('物量', fontsize=fs(16), fontweight='bold', pad=20)
-            plt.savefig(output_path, dpi=150, bbox_inches=None)
-            plt.close()
+            self._render_empty(output_path, '物量')
             return
         
         type_keys = list(filtered_types.keys())
-        labels = [NOTE_TYPE_LABELS.get(label, label) for label in type_keys]
         sizes = [filtered_types[key] for key in type_keys]
         
-        # 使用更美观的配色方案
-        color_map = {
-            'tap': '#FF6B6B',      # 红色
-            'hold_start': '#4ECDC4',  # 青色
-            'hold_end': '#45B7D1',    # 蓝色
-        }
-        colors = [color_map.get(label, plt.cm.viridis(i/len(type_keys))) for i, label in enumerate(type_keys)]
-        
-        # 设置中文字体支持（如果需要）
-        plt.rcParams['font.size'] = fs(11)
-        
-        fig, ax = plt.subplots(figsize=(9, 6), facecolor='white')  # 正方形，适配饼图圆形显示
-        
         # 自定义格式化函数，显示数量而非百分比
         def format_count(pct):
             total = sum(sizes)
             count = int(round(pct/100. * total))
             return f'{count}'
         
-        # 绘制饼图，添加阴影和更好的样式
-        wedges, texts, autotexts = ax.pie(
-            sizes, 
-            labels=labels, 
-            autopct=format_count,  # 显示数量
-            startangle=90,
-            colors=colors,
-            explode=[0.05] * len(labels),  # 分离各扇形
-            shadow=True,
-            textprops={'fontsize': fs(12), 'fontweight': 'bold'},
-            pctdistance=0.85
-        )
-        
-        # 优化数量文字样式
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-            autotext.set_fontsize(fs(11))
-        
-        # 设置标题
-        ax.set_title(
-            '物量类型数量分布',
-            fontsize=fs(16),
-            fontweight='bold',
-            pad=20,
-            color='#2C3E50'
-        )
-        
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=200, bbox_inches=None, facecolor='white')
-        plt.close()
+        template = _get_template('generate_note_count_chart', title='物量类型数量分布', pie=True)
+        self._render_pie(template, output_path, type_keys, sizes, format_count, plt.cm.viridis)
         
     def generate_note_density_chart(self, output_path: Path):
         """生成音符类型占比饼图（优化版）"""
         type_dist = self.stats['note_types']
         filtered_types = {k: v for k, v in type_dist.items() if k != 'hold_mid'}
         
-        if not filtered_types:
-            fig, ax = plt.subplots(figsize=(9, 6))  # 正方形，适配饼图
-            ax.text(0.5, 0.5, '暂无数据', ha='center', va='center', fontsize=fs(16))
-            ax.set_title('物量类型占比', fontsize=fs(16), fontweight='bold', pad=20)
-            plt.savefig(output_path, dpi=150, bbox_inches=None)
-            plt.close()
-            return
-        
         total = sum(filtered_types.values())
-        if total == 0:
-            fig, ax = plt.subplots(figsize=(9, 6))  # 正方形，适配饼图
-            ax.text(0.5, 0.5, '暂无数据', ha='center', va='center', fontsize=fs(16))
-            ax.set_title('物量类型占比', fontsize=fs(16), fontweight='bold', pad=20)
-            plt.savefig(output_path, dpi=150, bbox_inches=None)
-            plt.close()
+        if not filtered_types or total == 0:
+            self._render_empty(output_path, '物量类型占比')
             return
         
         type_keys = list(filtered_types.keys())
-        labels = [NOTE_TYPE_LABELS.get(label, label) for label in type_keys]
         sizes = [filtered_types[key] / total * 100 for key in type_keys]
         
-        # 使用更美观的配色方案
-        color_map = {
-            'tap': '#FF6B6B',
-            'hold_start': '#4ECDC4',
-            'hold_end': '#45B7D1',
-        }
-        colors = [color_map.get(label, plt.cm.Pastel1(i/len(type_keys))) for i, label in enumerate(type_keys)]
-        
-        # 使用固定的画布尺寸，不使用 bbox_inches='tight' 以保持固定比例
-        fig, ax = plt.subplots(figsize=(9, 6), facecolor='white')  # 正方形，适配饼图圆形显示
-        
-        # 绘制饼图
-        wedges, texts, autotexts = ax.pie(
-            sizes,
-            labels=labels,
-            autopct='%1.1f%%',
-            startangle=90,
-            colors=colors,
-            explode=[0.05] * len(labels),
-            shadow=True,
-            textprops={'fontsize': fs(12), 'fontweight': 'bold'},
-            pctdistance=0.85
-        )
-        
-        # 优化百分比文字样式
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-            autotext.set_fontsize(fs(11))
-        
-        ax.set_title(
-            '物量类型占比',
-            fontsize=fs(16),
-            fontweight='bold',
-            pad=20,
-            color='#2C3E50'
-        )
-        
-        # 不使用 bbox_inches='tight'，保持固定画布尺寸
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=200, bbox_inches=None, facecolor='white', pad_inches=0.1)
-        plt.close()
+        template = _get_template('generate_note_density_chart', title='物量类型占比', pie=True)
+        self._render_pie(template, output_path, type_keys, sizes, '%1.1f%%', plt.cm.Pastel1)
         
     def generate_density_curve_chart(self, output_path: Path):
         """生成密度曲线图"""
         density_curve = self.stats['density_curve']
         
         if not density_curve:
-            fig, ax = plt.subplots(figsize=(9, 6))  # 3:2 比例，适配前端
-            ax.text(0.5, 0.5, '暂无数据', ha='center', va='center', fontsize=fs(16))
-            ax.set_title('物量密度曲线', fontsize=fs(14), fontweight='bold')
-            ax.set_xlabel('时间（秒）', fontsize=fs(12))
-            ax.set_ylabel('物量密度', fontsize=fs(12))
-            plt.savefig(output_path, dpi=150, bbox_inches='tight')
-            plt.close()
+            self._render_empty(output_path, '物量密度曲线', '时间（秒）', '物量密度')
             return
         
         times = sorted(density_curve.keys())
@@ -391,29 +464,27 @@ class ChartVisualizer:
         times_sec = [ticks_to_seconds(t, bpm) for t in times]
         densities_per_sec = [d / window_seconds if window_seconds else 0 for d in densities]
         
-        fig, ax = plt.subplots(figsize=(9, 6), facecolor='white')  # 3:2 比例，适配前端
-        ax.plot(times_sec, densities_per_sec, linewidth=2.5, color='#2E86AB', marker='o', markersize=3, alpha=0.8)
-        ax.fill_between(times_sec, densities_per_sec, alpha=0.3, color='#2E86AB')
-        ax.set_title('物量密度曲线', fontsize=fs(16), fontweight='bold', pad=15, color='#2C3E50')
-        ax.set_xlabel('时间（秒）', fontsize=fs(13), fontweight='bold')
-        ax.set_ylabel('物量密度', fontsize=fs(13), fontweight='bold')
-        ax.grid(True, alpha=0.3, linestyle='--')
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=200, bbox_inches='tight', facecolor='white')
-        plt.close()
+        template = _get_template(
+            'generate_density_curve_chart', title='物量密度曲线',
+            xlabel='时间（秒）', ylabel='物量密度')
+        if not hasattr(template, 'line'):
+            template.line, = template.ax.plot(
+                [], [], linewidth=2.5, color='#2E86AB', marker='o', markersize=3, alpha=0.8)
+        
+        template.reset()
+        template.line.set_data(times_sec, densities_per_sec)
+        template.rescale()
+        template.dynamic.append(
+            template.ax.fill_between(times_sec, densities_per_sec, alpha=0.3, color='#2E86AB'))
+        template.ax.autoscale_view()
+        template.save(output_path)
     
     def generate_track_distribution_chart(self, output_path: Path):
         """生成轨道分布柱状图"""
         track_dist = self.stats['track_distribution']
         
         if not track_dist:
-            fig, ax = plt.subplots(figsize=(9, 6))  # 3:2 比例，适配前端
-            ax.text(0.5, 0.5, '暂无数据', ha='center', va='center', fontsize=fs(16))
-            ax.set_title('轨道分布', fontsize=fs(16), fontweight='bold', pad=20)
-            plt.savefig(output_path, dpi=150, bbox_inches='tight')
-            plt.close()
+            self._render_empty(output_path, '轨道分布')
             return
         
         # 处理键可能是字符串或整数的情况
@@ -424,7 +495,11 @@ class ChartVisualizer:
         colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7']
         bar_colors = [colors[i % len(colors)] for i in range(len(tracks))]
         
-        fig, ax = plt.subplots(figsize=(9, 6), facecolor='white')  # 3:2 比例，适配前端
+        template = _get_template(
+            'generate_track_distribution_chart', title='轨道分布',
+            xlabel='轨道', ylabel='物量', grid_axis='y')
+        ax = template.ax
+        template.reset()
         bars = ax.bar(
             tracks,
             counts,
@@ -434,11 +509,12 @@ class ChartVisualizer:
             alpha=0.8,
             width=0.6
         )
+        template.dynamic.extend(bars)
         
         # 在柱状图上添加数值标签
         for bar in bars:
             height = bar.get_height()
-            ax.text(
+            template.dynamic.append(ax.text(
                 bar.get_x() + bar.get_width() / 2.,
                 height,
                 f'{int(height)}',
@@ -446,26 +522,12 @@ class ChartVisualizer:
                 va='bottom',
                 fontsize=fs(12),
                 fontweight='bold'
-            )
+            ))
         
-        ax.set_title(
-            '轨道分布',
-            fontsize=fs(16),
-            fontweight='bold',
-            pad=20,
-            color='#2C3E50'
-        )
-        ax.set_xlabel('轨道', fontsize=fs(13), fontweight='bold')
-        ax.set_ylabel('物量', fontsize=fs(13), fontweight='bold')
         ax.set_xticks(tracks)
         ax.set_xticklabels([f'轨道{t}' for t in tracks])
-        ax.grid(True, alpha=0.3, axis='y', linestyle='--')
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=200, bbox_inches='tight', facecolor='white')
-        plt.close()
+        template.rescale()
+        template.save(output_path)
     
     def generate_time_distribution_chart(self, output_path: Path):
         """生成音符时间分布直方图"""
@@ -473,13 +535,7 @@ class ChartVisualizer:
         bpm = self.stats.get('bpm', 0) or 0
         
         if not time_dist:
-            fig, ax = plt.subplots(figsize=(9, 6))  # 3:2 比例，适配前端
-            ax.text(0.5, 0.5, '暂无数据', ha='center', va='center', fontsize=fs(16))
-            ax.set_title('物量时间分布', fontsize=fs(16), fontweight='bold', pad=20)
-            ax.set_xlabel('时间（秒）', fontsize=fs(13), fontweight='bold')
-            ax.set_ylabel('物量', fontsize=fs(13), fontweight='bold')
-            plt.savefig(output_path, dpi=150, bbox_inches='tight')
-            plt.close()
+            self._render_empty(output_path, '物量时间分布', '时间（秒）', '物量')
             return
         
         duration = self.stats['duration']
@@ -487,10 +543,13 @@ class ChartVisualizer:
         num_bins = min(50, max(20, duration // 50))
         time_dist_sec = [ticks_to_seconds(t, bpm) for t in time_dist]
         
-        fig, ax = plt.subplots(figsize=(9, 6), facecolor='white')  # 3:2 比例，适配前端
+        template = _get_template(
+            'generate_time_distribution_chart', title='物量时间分布',
+            xlabel='时间（秒）', ylabel='物量数量', grid_axis='y')
+        template.reset()
         
         # 绘制直方图，使用渐变色
-        n, bins, patches = ax.hist(
+        n, bins, patches = template.ax.hist(
             time_dist_sec,
             bins=num_bins,
             color='#4ECDC4',
@@ -498,27 +557,14 @@ class ChartVisualizer:
             linewidth=1.5,
             alpha=0.7
         )
+        template.dynamic.extend(patches)
         
         # 为直方图添加渐变色效果
         for i, patch in enumerate(patches):
             patch.set_facecolor(plt.cm.viridis(i / len(patches)))
         
-        ax.set_title(
-            '物量时间分布',
-            fontsize=fs(16),
-            fontweight='bold',
-            pad=20,
-            color='#2C3E50'
-        )
-        ax.set_xlabel('时间（秒）', fontsize=fs(13), fontweight='bold')
-        ax.set_ylabel('物量数量', fontsize=fs(13), fontweight='bold')
-        ax.grid(True, alpha=0.3, axis='y', linestyle='--')
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=200, bbox_inches='tight', facecolor='white')
-        plt.close()
+        template.rescale()
+        template.save(output_path)
     
     def generate_difficulty_curve_chart(self, output_path: Path):
         """生成难度曲线分析图"""
@@ -526,12 +572,7 @@ class ChartVisualizer:
         bpm = self.stats.get('bpm', 0) or 0
         
         if not difficulty_curve:
-            fig, ax = plt.subplots(figsize=(9, 6))  # 3:2 比例，适配前端
-            ax.text(0.5, 0.5, '暂无数据', ha='center', va='center', fontsize=fs(16))
-            ax.set_title('难度曲线', fontsize=fs(16), fontweight='bold', pad=20)
-            ax.set_xlabel('时间（秒）', fontsize=fs(13), fontweight='bold')
-            plt.savefig(output_path, dpi=150, bbox_inches='tight')
-            plt.close()
+            self._render_empty(output_path, '难度曲线', '时间（秒）')
             return
         
         times = sorted(difficulty_curve.keys())
@@ -541,22 +582,30 @@ class ChartVisualizer:
         # 计算平均难度和峰值
         avg_difficulty = np.mean(difficulties) if difficulties else 0
         peak_difficulty = max(difficulties) if difficulties else 0
-        
-        fig, ax = plt.subplots(figsize=(9, 6), facecolor='white')  # 3:2 比例，适配前端
-        
-        # 绘制难度曲线，使用渐变色
-        ax.plot(times_sec, difficulties, linewidth=2.5, color='#E74C3C', alpha=0.8, label='难度')
-        ax.fill_between(times_sec, difficulties, alpha=0.3, color='#E74C3C')
-        
-        # 添加平均难度线
-        ax.axhline(y=avg_difficulty, color='#3498DB', linestyle='--', linewidth=2, 
-                   label=f'平均值: {avg_difficulty:.2f}', alpha=0.7)
-        
-        # 标记峰值
         peak_idx = difficulties.index(peak_difficulty)
         peak_time = times_sec[peak_idx]
-        ax.plot(peak_time, peak_difficulty, 'ro', markersize=10, label=f'峰值: {peak_difficulty:.2f}')
-        ax.annotate(
+        
+        template = _get_template(
+            'generate_difficulty_curve_chart', title='难度曲线分析',
+            xlabel='时间（秒）', ylabel='难度评分')
+        ax = template.ax
+        if not hasattr(template, 'line'):
+            template.line, = ax.plot([], [], linewidth=2.5, color='#E74C3C', alpha=0.8, label='难度')
+            # 平均难度线
+            template.avg_line = ax.axhline(y=0, color='#3498DB', linestyle='--', linewidth=2, alpha=0.7)
+            # 峰值标记
+            template.peak_marker, = ax.plot([], [], 'ro', markersize=10)
+        
+        template.reset()
+        template.line.set_data(times_sec, difficulties)
+        template.avg_line.set_ydata([avg_difficulty, avg_difficulty])
+        template.avg_line.set_label(f'平均值: {avg_difficulty:.2f}')
+        template.peak_marker.set_data([peak_time], [peak_difficulty])
+        template.peak_marker.set_label(f'峰值: {peak_difficulty:.2f}')
+        template.rescale()
+        
+        template.dynamic.append(ax.fill_between(times_sec, difficulties, alpha=0.3, color='#E74C3C'))
+        template.dynamic.append(ax.annotate(
             f'峰值: {peak_difficulty:.2f}',
             xy=(peak_time, peak_difficulty),
             xytext=(10, 10),
@@ -565,82 +614,296 @@ class ChartVisualizer:
             fontweight='bold',
             bbox=dict(boxstyle='round,pad=0.5', facecolor='yellow', alpha=0.7),
             arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0')
-        )
-        
-        ax.set_title(
-            '难度曲线分析',
-            fontsize=fs(16),
-            fontweight='bold',
-            pad=20,
-            color='#2C3E50'
-        )
-        ax.set_xlabel('时间（秒）', fontsize=fs(13), fontweight='bold')
-        ax.set_ylabel('难度评分', fontsize=fs(13), fontweight='bold')
-        ax.legend(loc='upper right', fontsize=fs_smaller(11), framealpha=0.9)
-        ax.grid(True, alpha=0.3, linestyle='--')
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=200, bbox_inches='tight', facecolor='white')
-        plt.close()
+        ))
+        template.dynamic.append(ax.legend(loc='upper right', fontsize=fs_smaller(11), framealpha=0.9))
+        ax.autoscale_view()
+        template.save(output_path)
+
 
+# 每个谱面输出的图表：(文件名后缀, ChartVisualizer 方法名)
+CHART_FIGURES = [
+    ('_note_count.png', 'generate_note_count_chart'),
+    ('_note_density.png', 'generate_note_density_chart'),
+    ('_density_curve.png', 'generate_density_curve_chart'),
+    ('_track_distribution.png', 'generate_track_distribution_chart'),
+    ('_time_distribution.png', 'generate_time_distribution_chart'),
+    ('_difficulty_curve.png', 'generate_difficulty_curve_chart'),
+]
 
-def process_chart(chart_name: str) -> bool:
-    """处理单个谱面：解析、分析、生成图表和 summary"""
+
+class AnalysisCache:
+    """增量分析缓存：outputs/manifest.json 记录每个谱面输出对应的内容哈希。
+
+    哈希由谱面 TXT 内容与分析器/绘图版本号共同决定，内容未变的谱面直接跳过；
+    generate_protocol 也从 manifest 读取文件清单，不再逐个探测输出文件。
+    --no-plots 写入的条目标记 ``plots: False``，之后需要图表时不视为最新。
+    """
+    
+    MANIFEST_VERSION = 1
+    
+    def __init__(self, path: Path = MANIFEST_PATH):
+        self.path = path
+        self.charts: Dict[str, dict] = {}
+        self.dirty = False
+    
+    @classmethod
+    def load(cls, path: Path = MANIFEST_PATH) -> 'AnalysisCache':
+        cache = cls(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == cls.MANIFEST_VERSION:
+                cache.charts = data.get('charts', {})
+        except (OSError, ValueError):
+            pass
+        return cache
+    
+    @staticmethod
+    def key_for(chart_file: Path) -> str:
+        """谱面内容 + 分析器/绘图版本号的 sha256"""
+        digest = hashlib.sha256(chart_file.read_bytes())
+        digest.update(f"|analyzer={ANALYZER_VERSION}|renderer={RENDERER_VERSION}".encode())
+        return digest.hexdigest()
+    
+    def entry(self, chart_name: str) -> Optional[dict]:
+        return self.charts.get(chart_name)
+    
+    def is_current(self, chart_name: str, key: str, plots: bool = True) -> bool:
+        """manifest 中记录的哈希一致且 summary/PNG/缩略图均存在；``plots`` 为 True 时还要求条目含图表"""
+        entry = self.charts.get(chart_name)
+        if entry is None or entry.get('key') != key:
+            return False
+        if plots and not entry.get('plots', True):
+            return False
+        outputs = entry.get('files', []) + entry.get('thumbnails', []) + [entry.get('summary', '')]
+        return all((OUTPUT_DIR / name).is_file() for name in outputs)
+    
+    def record(self, chart_name: str, key: str, stats: dict, plots: bool = True):
+        files = [f"{chart_name}{suffix}" for suffix, _ in CHART_FIGURES] if plots else []
+        self.charts[chart_name] = {
+            'key': key,
+            'plots': plots,
+            'files': files,
+            'thumbnails': [thumbnail_name(name) for name in files],
+            'summary': f"{chart_name}_summary.json",
+            'bpm': stats.get('bpm'),
+            'duration': stats.get('duration'),
+        }
+        self.dirty = True
+    
+    def save(self):
+        if not self.dirty:
+            return
+        data = {'version': self.MANIFEST_VERSION, 'charts': self.charts}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(self.path, data)
+        self.dirty = False
+
+
+def analyze_chart(chart_name: str) -> Optional[dict]:
+    """解析、校验并分析单个谱面，返回 stats；失败时返回 None"""
+    with instrument.span("chart_analysis.analyze", chart=chart_name):
+        return _analyze_chart(chart_name)
+
+
+def _analyze_chart(chart_name: str) -> Optional[dict]:
     chart_dir = CHARTS_DIR / chart_name
     chart_file = chart_dir / f"{chart_name}.txt"
     
     if not chart_file.exists():
         print(f"警告: 谱面文件不存在: {chart_file}")
-        return False
-    
-    # 校验谱面
-    if not chart_check(chart_name):
-        print(f"警告: 谱面校验失败: {chart_name}")
-        return False
+        return None
     
-    # 解析
+    # 解析（只读取一次谱面文件）
     parser = ChartParser(chart_file)
     if not parser.parse():
         print(f"错误: 解析失败: {chart_name}")
-        return False
+        return None
+    
+    # 校验谱面
+    if not validate_chart(parser.chart):
+        print(f"警告: 谱面校验失败: {chart_name}")
+        return None
     
     # 分析
     analyzer = ChartAnalyzer(chart_name, parser)
     analyzer.analyze()
+    return analyzer.stats
+
+
+def render_figure(chart_name: str, stats: dict, suffix: str, method_name: str):
+    """渲染单张图表（可在子进程中独立执行）"""
+    with instrument.span("chart_analysis.render", chart=chart_name, figure=method_name):
+        visualizer = ChartVisualizer(chart_name, stats=stats)
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        getattr(visualizer, method_name)(OUTPUT_DIR / f"{chart_name}{suffix}")
+    instrument.count("chart_analysis.figures_rendered", figure=method_name)
+
+
+def write_json(path: Path, data) -> None:
+    """原子地写入 JSON（临时文件 + os.replace），服务端读取时不会读到写了一半的文件"""
+    _replace_text(path, json.dumps(data, indent=2, ensure_ascii=False))
+
+
+def write_summary(chart_name: str, stats: dict):
+    """生成 summary.json（移除大型数据以减小文件大小）"""
+    summary_data = {k: v for k, v in stats.items() 
+                   if k not in ['density_curve', 'difficulty_curve', 'time_distribution']}
+    summary_path = OUTPUT_DIR / f"{chart_name}_summary.json"
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    write_json(summary_path, summary_data)
+
+
+# 单个谱面的处理结果
+STATUS_OK = 'ok'
+STATUS_SKIPPED = 'skipped'
+STATUS_FAILED = 'failed'
+
+# 进度回调：接收 {"event": ..., ...} 字典，供 server 等调用方跟踪每个谱面的进度
+ProgressCallback = Callable[[dict], None]
+
+# --progress-json 模式下输出的进度行前缀
+PROGRESS_PREFIX = "PROGRESS "
+# --trace-json 模式下输出的埋点记录行前缀
+TRACE_PREFIX = "TRACE "
+
+
+def _process_chart(chart_name: str, cache: AnalysisCache, force: bool = False, plots: bool = True) -> str:
+    """处理单个谱面，返回 STATUS_OK / STATUS_SKIPPED / STATUS_FAILED；``plots`` 为 False 时只写 summary"""
+    chart_file = CHARTS_DIR / chart_name / f"{chart_name}.txt"
+    key = cache.key_for(chart_file) if chart_file.exists() else None
+    if key is not None and not force and cache.is_current(chart_name, key, plots):
+        print(f"[SKIP] 谱面未变化，沿用已有输出: {chart_name}")
+        instrument.count("chart_analysis.cache", result="hit")
+        return STATUS_SKIPPED
+    instrument.count("chart_analysis.cache", result="miss")
     
-    # 可视化
-    visualizer = ChartVisualizer(chart_name, analyzer)
+    stats = analyze_chart(chart_name)
+    if stats is None:
+        return STATUS_FAILED
     
     # 生成图表
-    note_count_path = OUTPUT_DIR / f"{chart_name}_note_count.png"
-    note_density_path = OUTPUT_DIR / f"{chart_name}_note_density.png"
-    density_curve_path = OUTPUT_DIR / f"{chart_name}_density_curve.png"
-    track_dist_path = OUTPUT_DIR / f"{chart_name}_track_distribution.png"
-    time_dist_path = OUTPUT_DIR / f"{chart_name}_time_distribution.png"
-    difficulty_curve_path = OUTPUT_DIR / f"{chart_name}_difficulty_curve.png"
-    
-    visualizer.generate_note_count_chart(note_count_path)
-    visualizer.generate_note_density_chart(note_density_path)
-    visualizer.generate_density_curve_chart(density_curve_path)
-    visualizer.generate_track_distribution_chart(track_dist_path)
-    visualizer.generate_time_distribution_chart(time_dist_path)
-    visualizer.generate_difficulty_curve_chart(difficulty_curve_path)
-    
-    # 生成 summary.json（移除大型数据以减小文件大小）
-    summary_data = {k: v for k, v in analyzer.stats.items() 
-                   if k not in ['density_curve', 'difficulty_curve', 'time_distribution']}
-    summary_path = OUTPUT_DIR / f"{chart_name}_summary.json"
-    with open(summary_path, 'w', encoding='utf-8') as f:
-        json.dump(summary_data, f, indent=2, ensure_ascii=False)
+    if plots:
+        for suffix, method_name in CHART_FIGURES:
+            render_figure(chart_name, stats, suffix, method_name)
+    
+    write_summary(chart_name, stats)
+    cache.record(chart_name, key, stats, plots)
     
     print(f"[OK] 完成分析: {chart_name}")
-    return True
+    return STATUS_OK
+
+
+def process_chart(chart_name: str, cache: Optional[AnalysisCache] = None,
+                  force: bool = False, plots: bool = True) -> bool:
+    """处理单个谱面：解析、分析、生成图表和 summary。
+
+    内容哈希与 manifest 一致且输出齐全时直接跳过；未传入 cache 时自行读写 manifest。
+    ``plots`` 为 False 时只生成 summary，不导入 matplotlib。
+    """
+    own_cache = cache is None
+    if own_cache:
+        cache = AnalysisCache.load()
+    status = _process_chart(chart_name, cache, force, plots)
+    if own_cache:
+        cache.save()
+    return status != STATUS_FAILED
+
+
+def _call_captured(func, *args):
+    """在子进程中调用 func 并捕获其 stdout，返回 (结果, 输出文本, 埋点记录)"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), instrument.collecting() as records:
+        result = func(*args)
+    return result, buffer.getvalue(), records
+
+
+def _report(chart_name: str, future) -> Tuple[object, bool]:
+    """按提交顺序取回子进程结果并输出其日志（埋点记录合并到主进程），返回 (结果, 是否成功)"""
+    try:
+        result, output, records = future.result()
+    except Exception as exc:
+        print(f"错误: 处理 {chart_name} 时子进程出错: {exc}")
+        return None, False
+    for record in records:
+        instrument.ingest(record, forward=True)
+    if output:
+        print(output, end='')
+    return result, True
+
+
+def process_charts_parallel(chart_names: List[str], jobs: int, cache: AnalysisCache,
+                            force: bool = False,
+                            on_result: Optional[Callable[[str, str], None]] = None,
+                            plots: bool = True) -> List[str]:
+    """用进程池并行处理多个谱面：先并行分析，再把每张图表作为独立任务分发。
+
+    结果与日志按 chart_names 顺序收集输出，与串行模式一致；
+    manifest 只在主进程中读写，未变化的谱面不会提交给进程池。
+    每个谱面完成时以 (谱面名, 状态) 调用 on_result；``plots`` 为 False 时不分发图表任务。
+    """
+    keys = {}
+    for chart_name in chart_names:
+        chart_file = CHARTS_DIR / chart_name / f"{chart_name}.txt"
+        keys[chart_name] = cache.key_for(chart_file) if chart_file.exists() else None
+    
+    results = []
+    # 进程池按需导入（串行与 --no-plots 刷新不承担 multiprocessing 的导入开销）
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs, initializer=instrument.clear_listeners) as pool:
+        analyses = {}
+        for chart_name in chart_names:
+            key = keys[chart_name]
+            if key is not None and not force and cache.is_current(chart_name, key, plots):
+                instrument.count("chart_analysis.cache", result="hit")
+                continue
+            instrument.count("chart_analysis.cache", result="miss")
+            analyses[chart_name] = pool.submit(_call_captured, analyze_chart, chart_name)
+        
+        # 按顺序取回分析结果，每拿到一个就立即分发其图表任务
+        pending = []
+        for chart_name in chart_names:
+            if chart_name not in analyses:
+                pending.append((chart_name, None, None))
+                continue
+            stats, ok = _report(chart_name, analyses[chart_name])
+            figures = []
+            if ok and stats is not None and plots:
+                figures = [
+                    pool.submit(_call_captured, render_figure, chart_name, stats, suffix, method_name)
+                    for suffix, method_name in CHART_FIGURES
+                ]
+            pending.append((chart_name, stats, figures))
+        
+        for chart_name, stats, figures in pending:
+            if figures is None:
+                print(f"[SKIP] 谱面未变化，沿用已有输出: {chart_name}")
+                status = STATUS_SKIPPED
+            else:
+                ok = stats is not None
+                for future in figures:
+                    ok = _report(chart_name, future)[1] and ok
+                if ok:
+                    write_summary(chart_name, stats)
+                    cache.record(chart_name, keys[chart_name], stats, plots)
+                    print(f"[OK] 完成分析: {chart_name}")
+                status = STATUS_OK if ok else STATUS_FAILED
+            results.append(status)
+            if on_result is not None:
+                on_result(chart_name, status)
+            print()
+    return results
+
 
+def generate_protocol(cache: Optional[AnalysisCache] = None):
+    """生成 protocol.json 文件（文件清单与 bpm/duration 取自 manifest）"""
+    with instrument.span("chart_analysis.protocol"):
+        _generate_protocol(cache)
 
-def generate_protocol():
-    """生成 protocol.json 文件"""
+
+def _generate_protocol(cache: Optional[AnalysisCache]):
+    if cache is None:
+        cache = AnalysisCache.load()
     protocol = {
         "version": 1,
         "note": "谱面分析协议：包含所有曲目的图表与数据文件路径",
@@ -662,51 +925,27 @@ def generate_protocol():
         if not chart_file.exists():
             continue
         
-        # 检查输出文件是否存在
-        files = []
-        patterns = [
-            '_note_count.png',
-            '_note_density.png',
-            '_density_curve.png',
-            '_track_distribution.png',
-            '_time_distribution.png',
-            '_difficulty_curve.png'
-        ]
-        for pattern in patterns:
-            file_path = OUTPUT_DIR / f"{chart_name}{pattern}"
-            if file_path.exists():
-                files.append(f"{chart_name}{pattern}")
-        
         summary_file = f"{chart_name}_summary.json"
-        summary_path = OUTPUT_DIR / summary_file
-        
-        if summary_path.exists():
-            # 读取 summary 获取额外信息
-            try:
-                with open(summary_path, 'r', encoding='utf-8') as f:
-                    summary_data = json.load(f)
-                chart_entry = {
-                    "name": chart_name,
-                    "files": files,
-                    "summary": summary_file,
-                    "bpm": summary_data.get('bpm'),
-                    "duration": summary_data.get('duration'),
-                    "folder": chart_name
-                }
-                # 检查是否有音频文件
-                audio_file = chart_dir / f"{chart_name}.mp3"
-                if audio_file.exists():
-                    chart_entry["audio"] = f"{chart_name}.mp3"
-            except:
-                chart_entry = {
-                    "name": chart_name,
-                    "files": files,
-                    "summary": summary_file
-                }
+        entry = cache.entry(chart_name)
+        if entry is not None:
+            chart_entry = {
+                "name": chart_name,
+                "files": list(entry.get('files', [])),
+                "thumbnails": list(entry.get('thumbnails', [])),
+                "summary": entry.get('summary', summary_file),
+                "bpm": entry.get('bpm'),
+                "duration": entry.get('duration'),
+                "folder": chart_name
+            }
+            # 检查是否有音频文件
+            audio_file = chart_dir / f"{chart_name}.mp3"
+            if audio_file.exists():
+                chart_entry["audio"] = f"{chart_name}.mp3"
         else:
             chart_entry = {
                 "name": chart_name,
-                "files": files,
+                "files": [],
+                "thumbnails": [],
                 "summary": summary_file
             }
         
@@ -714,24 +953,14 @@ def generate_protocol():
     
     # 保存 protocol.json
     protocol_path = OUTPUT_DIR / "protocol.json"
-    with open(protocol_path, 'w', encoding='utf-8') as f:
-        json.dump(protocol, f, indent=2, ensure_ascii=False)
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    write_json(protocol_path, protocol)
     
     print(f"[OK] 生成协议文件: {protocol_path}")
 
 
-def main():
-    """主函数：扫描 charts 目录，处理所有谱面"""
-    print("开始谱面分析...")
-    print(f"谱面目录: {CHARTS_DIR}")
-    print(f"输出目录: {OUTPUT_DIR}")
-    print()
-    
-    if not CHARTS_DIR.exists():
-        print(f"错误: charts 目录不存在: {CHARTS_DIR}")
-        return
-    
-    # 扫描并处理所有谱面
+def list_chart_names() -> List[str]:
+    """扫描 charts 目录，返回含同名 TXT 的谱面名（按名称排序）"""
     chart_names = []
     for chart_dir in sorted(CHARTS_DIR.iterdir()):
         if not chart_dir.is_dir() or chart_dir.name == '__pycache__':
@@ -742,27 +971,115 @@ def main():
         
         if chart_file.exists():
             chart_names.append(chart_name)
+    return chart_names
+
+
+def run_analysis(jobs: int = 1, force: bool = False,
+                 progress: Optional[ProgressCallback] = None, plots: bool = True) -> Tuple[int, int]:
+    """分析全部谱面并生成 protocol.json，返回 (成功数, 谱面总数)；``plots`` 为 False 时只生成 summary"""
+    with instrument.span("chart_analysis.run", jobs=jobs, plots=plots):
+        return _run_analysis(jobs, force, progress, plots)
+
+
+def _run_analysis(jobs: int, force: bool, progress: Optional[ProgressCallback],
+                  plots: bool) -> Tuple[int, int]:
+    def emit(event: dict):
+        if progress is not None:
+            progress(event)
+    
+    print("开始谱面分析...")
+    print(f"谱面目录: {CHARTS_DIR}")
+    print(f"输出目录: {OUTPUT_DIR}")
+    print()
+    
+    if not CHARTS_DIR.exists():
+        print(f"错误: charts 目录不存在: {CHARTS_DIR}")
+        emit({'event': 'done', 'success': 0, 'total': 0})
+        return 0, 0
     
+    # 扫描并处理所有谱面
+    chart_names = list_chart_names()
     if not chart_names:
         print("未找到任何谱面文件")
-        return
+        emit({'event': 'done', 'success': 0, 'total': 0})
+        return 0, 0
     
     print(f"找到 {len(chart_names)} 个谱面: {', '.join(chart_names)}")
     print()
+    emit({'event': 'start', 'charts': chart_names})
+    
+    completed = []
+    cache = AnalysisCache.load()
+    
+    def on_result(chart_name: str, status: str):
+        completed.append(chart_name)
+        event = {'event': 'chart', 'chart': chart_name, 'status': status,
+                 'index': len(completed), 'total': len(chart_names)}
+        entry = cache.entry(chart_name)
+        if status != STATUS_FAILED and entry is not None:
+            # 输出文件清单与内容版本（manifest 哈希前缀），供客户端增量更新、给图片 URL 加版本号
+            event.update(files=list(entry.get('files', [])), thumbnails=list(entry.get('thumbnails', [])),
+                         summary=entry.get('summary'),
+                         bpm=entry.get('bpm'), duration=entry.get('duration'),
+                         version=entry.get('key', '')[:12])
+        emit(event)
     
     # 处理每个谱面
-    success_count = 0
-    for chart_name in chart_names:
-        if process_chart(chart_name):
-            success_count += 1
+    if jobs > 1:
+        print(f"并行模式: {jobs} 个进程")
         print()
+        results = process_charts_parallel(chart_names, jobs, cache, force=force,
+                                          on_result=on_result, plots=plots)
+    else:
+        results = []
+        for chart_name in chart_names:
+            status = _process_chart(chart_name, cache, force=force, plots=plots)
+            results.append(status)
+            on_result(chart_name, status)
+            print()
+    success_count = sum(1 for status in results if status != STATUS_FAILED)
+    cache.save()
     
     print(f"处理完成: {success_count}/{len(chart_names)} 个谱面成功")
     
     # 生成 protocol.json
-    generate_protocol()
+    generate_protocol(cache)
     print()
     print("所有分析完成！")
+    emit({'event': 'done', 'success': success_count, 'total': len(chart_names)})
+    return success_count, len(chart_names)
+
+
+def _print_progress(event: dict):
+    """--progress-json：以单行 JSON 输出进度，供 server 解析"""
+    print(PROGRESS_PREFIX + json.dumps(event, ensure_ascii=False), flush=True)
+
+
+def _print_trace(record: dict):
+    """--trace-json：以单行 JSON 输出埋点记录，供 server 汇总到 /metrics"""
+    print(TRACE_PREFIX + json.dumps(record, ensure_ascii=False), flush=True)
+
+
+def main(argv: Optional[List[str]] = None):
+    """主函数：扫描 charts 目录，处理所有谱面"""
+    arg_parser = argparse.ArgumentParser(description="谱面统计与可视化分析")
+    arg_parser.add_argument("--jobs", "-j", type=int, default=1,
+                            help="并行进程数（默认 1 为串行，0 表示使用全部 CPU）")
+    arg_parser.add_argument("--force", action="store_true",
+                            help="忽略 manifest 缓存，重新分析并渲染所有谱面")
+    arg_parser.add_argument("--no-plots", action="store_true",
+                            help="只生成 summary 与 protocol.json，不渲染图表（不导入 matplotlib）")
+    arg_parser.add_argument("--progress-json", action="store_true",
+                            help=f"每个谱面完成时输出一行 '{PROGRESS_PREFIX}<json>' 进度")
+    arg_parser.add_argument("--trace-json", action="store_true",
+                            help=f"每条埋点记录（span 开始/结束、计数）输出一行 '{TRACE_PREFIX}<json>'")
+    args = arg_parser.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if args.trace_json:
+        instrument.add_listener(_print_trace)
+    
+    run_analysis(jobs, force=args.force,
+                 progress=_print_progress if args.progress_json else None, plots=not args.no_plots)
 
 
 if __name__ == "__main__":
@@ -1,17 +1,111 @@
 from __future__ import annotations
 
+import argparse
+import contextlib
+import fnmatch
+import hashlib
+import io
+import json
+import mmap
 import os
-import random
 import re
+import struct
+import sys
+import threading
+from array import array
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 
+try:
+    from . import instrument
+except ImportError:
+    # 以脚本方式运行时不在包内，instrument.py 与本文件同目录
+    import instrument
 
-# ==== chart_check (from chart_engine/check.py) ====
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+# ==== Chart 模型（chart_check / process_chart / chart_analysis 共用的单次解析） ====
 _EVENT_PATTERN = re.compile(r"^\(\s*([^,]+)\s*,\s*([^,]+)\s*,\s*([^)]+)\s*\)$")
 _ALLOWED_TYPES = {"tap", "hold_start", "hold_mid"}
 _ALLOWED_TRACES = {"0", "1"}
 
+# type code 与 ROM 中每轨 2bit 的编码保持一致，ROM 生成时可直接写入
+TAP = 0b01
+HOLD_START = 0b10
+HOLD_MID = 0b11
+TYPE_CODES = {"tap": TAP, "hold_start": HOLD_START, "hold_mid": HOLD_MID}
+TYPE_NAMES = {code: name for name, code in TYPE_CODES.items()}
+
+
+class Chart:
+    """谱面的紧凑内存表示：BPM + 三个并行 int 数组（time / type code / track）。
+
+    三列为 ``array``，从二进制旁路文件加载时为映射内存上的 ``memoryview``，两者用法一致；
+    映射版本可用 ``close()`` 或 ``with`` 提前解除映射。
+
+    由 ``parse_chart`` 一次读取生成，校验、ROM 生成与谱面分析均直接消费该对象，
+    不再各自重复读取和正则解析谱面文件。
+    """
+
+    __slots__ = ("name", "path", "bpm", "times", "types", "tracks", "validated", "_mapping")
+
+    def __init__(self, name: str, path: Optional[Path], bpm: int):
+        self.name = name
+        self.path = path
+        self.bpm = bpm
+        # validate_chart 通过后置位，同一对象不再重复校验
+        self.validated = False
+        self.times = array("i")
+        self.types = array("b")
+        self.tracks = array("b")
+        # 从二进制旁路文件加载时为其 mmap
+        self._mapping: Optional[mmap.mmap] = None
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __enter__(self) -> "Chart":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """三列复制为 ``array`` 并解除旁路文件的映射，之后旁路文件可被替换或删除（Windows 下映射期间不可）。
+
+        列仍被外部引用（如 ``numpy.frombuffer`` 的结果）时映射保留到这些引用释放为止。
+        """
+        mapping, self._mapping = self._mapping, None
+        if mapping is None:
+            return
+        views = (self.times, self.types, self.tracks)
+        self.times, self.types, self.tracks = array("i"), array("b"), array("b")
+        for column, view in zip((self.times, self.types, self.tracks), views):
+            column.frombytes(view.tobytes())
+        try:
+            for view in views:
+                view.release()
+            mapping.close()
+        except BufferError:
+            pass
+
+    @property
+    def duration(self) -> int:
+        """谱面时长（最大事件时间，单位 tick）"""
+        return max(self.times) if self.times else 0
+
+    def events(self) -> Iterator[Tuple[int, str, int]]:
+        """按文件顺序迭代 (time, type, track) 元组"""
+        names = TYPE_NAMES
+        for time_val, code, track in zip(self.times, self.types, self.tracks):
+            yield time_val, names[code], track
+
 
 def _resolve_chart_path(chart_name: str, chart_path: Optional[Path]) -> Path:
     if chart_path is not None:
@@ -20,183 +114,385 @@ def _resolve_chart_path(chart_name: str, chart_path: Optional[Path]) -> Path:
     return base_dir / "charts" / chart_name / f"{chart_name}.txt"
 
 
-def chart_check(chart_name: str, chart_path: Optional[Path] = None) -> bool:
-    target_path = _resolve_chart_path(chart_name, chart_path)
-    if not target_path.exists():
-        print(f"[chart_check] 文件不存在: {target_path}")
-        return False
+class Diagnostic(NamedTuple):
+    """一条校验诊断：行号（从 1 起，0 表示文件级错误）、规则名与错误信息"""
 
-    try:
-        lines = target_path.read_text(encoding="utf-8").splitlines()
-    except Exception as exc:  # pragma: no cover
-        print(f"[chart_check] 读取文件失败: {target_path} ({exc})")
-        return False
+    line: int
+    rule: str
+    message: str
 
-    if not lines:
-        print("[chart_check] 文件为空")
-        return False
 
-    header = lines[0].strip()
+def _scan_header(idx: int, raw_line: str) -> Tuple[Optional[int], Optional[Diagnostic]]:
+    """检查 bpm 头行，返回 (bpm, None) 或 (None, 诊断)"""
+    header = raw_line.strip()
     if not header.startswith("bpm="):
-        print("[chart_check] 第一行必须为 bpm=<整数>")
-        return False
+        return None, Diagnostic(idx, "header", "第一行必须为 bpm=<整数>")
 
     bpm_value = header.split("=", 1)[1]
     if not bpm_value.isdigit():
-        print("[chart_check] BPM 必须为整数")
-        return False
+        return None, Diagnostic(idx, "bpm", "BPM 必须为整数")
+    return int(bpm_value), None
 
-    last_time: Optional[int] = None
-    last_by_trace: Dict[str, Optional[Tuple[int, str]]] = {
-        "0": None, "1": None}
 
-    for idx, raw_line in enumerate(lines[1:], start=2):
-        line = raw_line.strip()
-        if not line:
-            break
+def _scan_event(idx: int, line: str) -> Tuple[Optional[Tuple[int, int, int]], Optional[Diagnostic]]:
+    """检查单个已去除首尾空白的事件行，返回 ((time, type code, track), None) 或 (None, 诊断)"""
+    match = _EVENT_PATTERN.match(line)
+    if not match:
+        return None, Diagnostic(idx, "format", f"第 {idx} 行格式错误，应为 (time,type,trace): {line}")
 
-        match = _EVENT_PATTERN.match(line)
-        if not match:
-            print(f"[chart_check] 第 {idx} 行格式错误，应为 (time,type,trace): {line}")
-            return False
+    time_str, evt_type, trace_str = match.groups()
+    time_str = time_str.strip()
+    evt_type = evt_type.strip()
+    trace_str = trace_str.strip()
 
-        time_str, evt_type, trace_str = match.groups()
-        time_str = time_str.strip()
-        evt_type = evt_type.strip()
-        trace_str = trace_str.strip()
+    if evt_type not in _ALLOWED_TYPES:
+        return None, Diagnostic(idx, "type", f"第 {idx} 行 type 非法: {evt_type}")
 
-        if evt_type not in _ALLOWED_TYPES:
-            print(f"[chart_check] 第 {idx} 行 type 非法: {evt_type}")
-            return False
+    if trace_str not in _ALLOWED_TRACES:
+        return None, Diagnostic(idx, "trace", f"第 {idx} 行 trace 仅允许 0/1: {trace_str}")
 
-        if trace_str not in _ALLOWED_TRACES:
-            print(f"[chart_check] 第 {idx} 行 trace 仅允许 0/1: {trace_str}")
-            return False
+    if not time_str.lstrip("-").isdigit():
+        return None, Diagnostic(idx, "time", f"第 {idx} 行 time 必须为整数: {time_str}")
 
-        if not time_str.lstrip("-").isdigit():
-            print(f"[chart_check] 第 {idx} 行 time 必须为整数: {time_str}")
-            return False
+    time_val = int(time_str)
+    if time_val < 0:
+        return None, Diagnostic(idx, "time", f"第 {idx} 行 time 不得为负: {time_val}")
 
-        time_val = int(time_str)
-        if time_val < 0:
-            print(f"[chart_check] 第 {idx} 行 time 不得为负: {time_val}")
-            return False
+    return (time_val, TYPE_CODES[evt_type], int(trace_str)), None
 
-        if last_time is not None and time_val < last_time:
-            print(
-                f"[chart_check] 时间需整体单调不减：第 {idx} 行 {time_val} < 上一行 {last_time}")
-            return False
-        last_time = time_val
 
-        prev = last_by_trace[trace_str]
-        if prev is not None:
-            prev_time, prev_type = prev
+def parse_chart(chart_name: str, chart_path: Optional[Path] = None,
+                use_binary: bool = True) -> Tuple[Optional[Chart], Optional[str]]:
+    """逐行读取并解析谱面，返回 (Chart, None)；格式错误时返回 (None, 错误信息)。
+
+    只做逐行的格式检查（行格式、type、trace、time 为非负整数），
+    时间顺序与长条规则由 ``validate_chart`` 在解析结果上检查。
+    事件行在第一个空行处结束。
+    ``use_binary`` 为 True 且存在与 TXT 一致的二进制旁路文件时直接映射加载。
+    """
+    with instrument.span("chart_engine.parse", chart=chart_name):
+        chart, error = _parse_chart(chart_name, chart_path, use_binary)
+    if chart is not None:
+        instrument.count("chart_engine.events_parsed", len(chart))
+    return chart, error
+
+
+def _parse_chart(chart_name: str, chart_path: Optional[Path], use_binary: bool) -> Tuple[Optional[Chart], Optional[str]]:
+    target_path = Path(_resolve_chart_path(chart_name, chart_path))
+    if not target_path.exists():
+        return None, f"文件不存在: {target_path}"
+
+    if use_binary:
+        chart = load_chart_binary(chart_name, target_path)
+        if chart is not None:
+            return chart, None
+
+    try:
+        with open(target_path, "r", encoding="utf-8") as handle:
+            header_line = handle.readline()
+            if not header_line:
+                return None, "文件为空"
+
+            bpm, diag = _scan_header(1, header_line)
+            if diag is not None:
+                return None, diag.message
+
+            chart = Chart(chart_name, target_path, bpm)
+            times_append = chart.times.append
+            types_append = chart.types.append
+            tracks_append = chart.tracks.append
+
+            for idx, raw_line in enumerate(handle, start=2):
+                line = raw_line.strip()
+                if not line:
+                    break
+
+                event, diag = _scan_event(idx, line)
+                if diag is not None:
+                    return None, diag.message
+
+                times_append(event[0])
+                types_append(event[1])
+                tracks_append(event[2])
+    except (OSError, UnicodeDecodeError) as exc:  # pragma: no cover
+        return None, f"读取文件失败: {target_path} ({exc})"
+
+    return chart, None
+
+
+class _OrderChecker:
+    """时间顺序与长条规则的增量检查器，只保存全局与每轨上一个事件，内存占用恒定。
+
+    每次 ``feed`` 至多返回一条诊断，且无论是否违规都推进状态，
+    因此可在出错后继续检查后续行（收集全部错误模式）。
+    """
+
+    __slots__ = ("last_time", "last_by_trace")
+
+    def __init__(self):
+        self.last_time: Optional[int] = None
+        # 每轨上一个事件的 (time, type code, 行号)
+        self.last_by_trace: Dict[int, Optional[Tuple[int, int, int]]] = {0: None, 1: None}
+
+    def feed(self, idx: int, time_val: int, code: int, trace: int) -> Optional[Diagnostic]:
+        diag = None
+        last_time = self.last_time
+        prev = self.last_by_trace[trace]
+        if last_time is not None and time_val < last_time:
+            diag = Diagnostic(idx, "monotonic", f"时间需整体单调不减：第 {idx} 行 {time_val} < 上一行 {last_time}")
+        elif prev is not None:
+            prev_time, prev_code, _ = prev
             if prev_time >= time_val:
-                print(
-                    f"[chart_check] 同轨时间需严格递增：轨道 {trace_str} 第 {idx} 行 {time_val} <= 上一事件 {prev_time}")
-                return False
+                diag = Diagnostic(
+                    idx, "track_order", f"同轨时间需严格递增：轨道 {trace} 第 {idx} 行 {time_val} <= 上一事件 {prev_time}")
+            elif code == HOLD_MID:
+                if prev_code == TAP or prev_time != time_val - 1:
+                    diag = Diagnostic(idx, "hold_mid", f"hold_mid 需紧接前一拍同轨 hold_start/hold_mid：第 {idx} 行")
+            elif prev_code == HOLD_START:
+                diag = Diagnostic(idx, "hold_start", f"hold_start 后必须跟随连续 hold_mid：轨道 {trace} 第 {idx} 行")
+        elif code == HOLD_MID:
+            diag = Diagnostic(idx, "hold_mid", f"hold_mid 前必须有 hold_start：第 {idx} 行")
 
-            if evt_type == "hold_mid":
-                if prev_type not in {"hold_start", "hold_mid"} or prev_time != time_val - 1:
-                    print(
-                        f"[chart_check] hold_mid 需紧接前一拍同轨 hold_start/hold_mid：第 {idx} 行")
-                    return False
-            else:
-                if prev_type == "hold_start":
-                    print(
-                        f"[chart_check] hold_start 后必须跟随连续 hold_mid：轨道 {trace_str} 第 {idx} 行")
-                    return False
-        else:
-            if evt_type == "hold_mid":
-                print(f"[chart_check] hold_mid 前必须有 hold_start：第 {idx} 行")
-                return False
+        self.last_time = time_val
+        self.last_by_trace[trace] = (time_val, code, idx)
+        return diag
+
+    def finish(self) -> List[Diagnostic]:
+        """文件结束时检查各轨长条是否闭合，诊断行号指向未闭合的 hold_start"""
+        return [
+            Diagnostic(prev[2], "hold_unclosed", f"轨道 {trace} 的 hold_start 未闭合")
+            for trace, prev in self.last_by_trace.items()
+            if prev is not None and prev[1] == HOLD_START
+        ]
 
-        last_by_trace[trace_str] = (time_val, evt_type)
 
-    for trace, prev in last_by_trace.items():
-        if prev is not None and prev[1] == "hold_start":
-            print(f"[chart_check] 轨道 {trace} 的 hold_start 未闭合")
-            return False
+def _first_violation(chart: Chart) -> Optional[str]:
+    """在解析结果上检查时间顺序与长条规则，返回第一条错误信息"""
+    checker = _OrderChecker()
+    feed = checker.feed
+    for i, (time_val, code, trace) in enumerate(zip(chart.times, chart.types, chart.tracks)):
+        # 事件从文件第 2 行开始且连续
+        diag = feed(i + 2, time_val, code, trace)
+        if diag is not None:
+            return diag.message
+
+    unclosed = checker.finish()
+    return unclosed[0].message if unclosed else None
 
+
+def validate_chart(chart: Chart) -> bool:
+    """校验已解析的谱面，不通过时打印原因并返回 False"""
+    if chart.validated:
+        return True
+    error = _first_violation(chart)
+    if error is not None:
+        print(f"[chart_check] {error}")
+        return False
+    chart.validated = True
     return True
 
 
-# ==== generate_random_chart (from chart_engine/random_gen.py) ====
-def generate_random_chart(output_dir, name="Random", bpm=120, length_seconds=60, seed=None):
-    if seed is not None:
-        random.seed(seed)
+def load_chart(chart_name: str, chart_path: Optional[Path] = None, tag: str = "chart_check") -> Optional[Chart]:
+    """解析谱面，失败时以 ``[tag]`` 前缀打印原因并返回 None"""
+    chart, error = parse_chart(chart_name, chart_path)
+    if chart is None:
+        print(f"[{tag}] {error}")
+    return chart
 
-    output_path = Path(output_dir) / f"{name}.txt"
+
+# ==== 二进制谱面（TXT 旁路的 .bin 文件，mmap 零拷贝加载） ====
+# 布局：文件头 + time(int32 * n) + type(int8 * n) + track(int8 * n)，小端
+_BINARY_MAGIC = b"MDCB"
+# 校验规则变化时递增，使保存的 validated 标志失效
+_BINARY_VERSION = 2
+# magic, version, flags, bpm, 事件数, 源 TXT 的 size 与 sha256（用于判断是否过期）
+_BINARY_HEADER = struct.Struct("<4sHHIIq32s")
+_BINARY_FLAG_VALIDATED = 0x1
+# 列直接按本机字节序 cast，仅在小端且 array('i') 为 4 字节时启用
+_BINARY_SUPPORTED = sys.byteorder == "little" and array("i").itemsize == 4
+
+
+def binary_chart_path(chart_path: Path) -> Path:
+    """谱面 TXT 对应的二进制旁路文件路径"""
+    return Path(chart_path).with_suffix(".bin")
+
+
+def write_chart_binary(chart: Chart) -> Optional[Path]:
+    """将谱面写为与源 TXT 同目录的二进制旁路文件，返回写出路径；无法写出时返回 None"""
+    if not _BINARY_SUPPORTED or chart.path is None:
+        return None
+
+    target_path = binary_chart_path(chart.path)
+    tmp_path = target_path.with_name(f".{target_path.name}.{os.getpid()}.tmp")
     try:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8"):
+        source = chart.path.read_bytes()
+        header = _BINARY_HEADER.pack(
+            _BINARY_MAGIC,
+            _BINARY_VERSION,
+            _BINARY_FLAG_VALIDATED if chart.validated else 0,
+            chart.bpm,
+            len(chart),
+            len(source),
+            hashlib.sha256(source).digest(),
+        )
+        with open(tmp_path, "wb") as handle:
+            handle.write(header)
+            handle.write(chart.times)
+            handle.write(chart.types)
+            handle.write(chart.tracks)
+        os.replace(tmp_path, target_path)
+    except (OSError, struct.error) as exc:
+        print(f"[chart_binary] 写入失败: {target_path} ({exc})")
+        try:
+            tmp_path.unlink()
+        except OSError:
             pass
-    except Exception as exc:
-        print(f"错误：无法创建文件 {output_path}: {exc}")
         return None
+    return target_path
+
+
+def load_chart_binary(chart_name: str, chart_path: Path) -> Optional[Chart]:
+    """映射加载与 TXT 内容一致（size 与 sha256 相同）的二进制旁路文件；缺失、过期或损坏时返回 None。
+
+    三列为映射内存上的 memoryview，不复制数据；文件句柄在映射后即关闭，映射由 ``Chart.close()`` 解除。
+    ``validated`` 标志随文件保存，只在 TXT 内容与 ``_BINARY_VERSION`` 都未变时沿用。
+    """
+    if not _BINARY_SUPPORTED:
+        return None
+
+    try:
+        source_stat = chart_path.stat()
+        with open(binary_chart_path(chart_path), "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size < _BINARY_HEADER.size:
+                return None
+            buf = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    magic, version, flags, bpm, count, source_size, source_digest = _BINARY_HEADER.unpack_from(buf, 0)
+    if (
+        magic != _BINARY_MAGIC
+        or version != _BINARY_VERSION
+        or source_size != source_stat.st_size
+        or size != _BINARY_HEADER.size + count * 6
+    ):
+        buf.close()
+        return None
+    # size 相同再比较内容哈希：只改 mtime 时仍可复用，同长度的修改也能发现
+    try:
+        fresh = hashlib.sha256(chart_path.read_bytes()).digest() == source_digest
+    except OSError:
+        fresh = False
+    if not fresh:
+        buf.close()
+        return None
+
+    view = memoryview(buf)
+    offset = _BINARY_HEADER.size
+    chart = Chart(chart_name, chart_path, bpm)
+    chart.times = view[offset:offset + 4 * count].cast("i")
+    offset += 4 * count
+    chart.types = view[offset:offset + count].cast("b")
+    offset += count
+    chart.tracks = view[offset:offset + count].cast("b")
+    chart.validated = bool(flags & _BINARY_FLAG_VALIDATED)
+    chart._mapping = buf
+    view.release()
+    return chart
+
+
+# ==== 流式校验（逐行读取，可收集全部诊断） ====
+def iter_chart_diagnostics(chart_name: str, chart_path: Optional[Path] = None) -> Iterator[Diagnostic]:
+    """逐行流式校验谱面，按读取顺序产出全部诊断，不在内存中保留谱面。
+
+    格式错误的行被跳过，其余规则继续检查后续行，未闭合的长条在文件末尾报告；
+    调用方只取第一条即可作为快速的布尔判定。
+    """
+    target_path = Path(_resolve_chart_path(chart_name, chart_path))
+    if not target_path.exists():
+        yield Diagnostic(0, "file", f"文件不存在: {target_path}")
+        return
+
+    checker = _OrderChecker()
+    feed = checker.feed
+    scan_event = _scan_event
+    try:
+        with open(target_path, "r", encoding="utf-8") as handle:
+            header_line = handle.readline()
+            if not header_line:
+                yield Diagnostic(0, "file", "文件为空")
+                return
+
+            _, diag = _scan_header(1, header_line)
+            if diag is not None:
+                yield diag
+
+            for idx, raw_line in enumerate(handle, start=2):
+                line = raw_line.strip()
+                if not line:
+                    break
+
+                event, diag = scan_event(idx, line)
+                if diag is None:
+                    diag = feed(idx, event[0], event[1], event[2])
+                if diag is not None:
+                    yield diag
+    except (OSError, UnicodeDecodeError) as exc:
+        yield Diagnostic(0, "file", f"读取文件失败: {target_path} ({exc})")
+        return
+
+    yield from checker.finish()
+
+
+def collect_diagnostics(chart_name: str, chart_path: Optional[Path] = None,
+                        limit: Optional[int] = None) -> List[Diagnostic]:
+    """收集谱面诊断；``limit`` 为 None 时收集全部，否则最多收集 ``limit`` 条后停止读取"""
+    diagnostics = iter_chart_diagnostics(chart_name, chart_path)
+    if limit is not None:
+        diagnostics = islice(diagnostics, limit)
+    return list(diagnostics)
+
+
+# ==== chart_check (from chart_engine/check.py) ====
+def chart_check(chart_name: str, chart_path: Optional[Path] = None, collect_all: bool = False) -> bool:
+    """流式校验谱面，打印诊断并返回是否通过。
+
+    默认遇到第一处错误即停止；``collect_all=True`` 时一次报告全部错误。
+    """
+    with instrument.span("chart_engine.check", chart=chart_name):
+        diagnostics = collect_diagnostics(chart_name, chart_path, limit=None if collect_all else 1)
+    instrument.count("chart_engine.charts_checked", result="ok" if not diagnostics else "failed")
+    for diag in diagnostics:
+        print(f"[chart_check] {diag.message}")
+    return not diagnostics
+
+
+# ==== generate_random_chart (from chart_engine/random_gen.py) ====
+def generate_random_chart(output_dir, name="Random", bpm=120, length_seconds=60, seed=None, **constraints):
+    """生成一个随机谱面写入 ``<output_dir>/<name>.txt``，返回路径，失败返回 None。
+
+    基于 generator.py 的局部 numpy Generator（不修改全局 random 状态），``constraints`` 为
+    ``ChartConstraints`` 的字段（density / hold_ratio / hold_length / track_balance / max_ticks）。
+    批量生成见 ``generator.generate_charts``。
+    """
+    # generator 依赖 numpy 且反向导入本模块，按需导入；以脚本方式运行时 chart_engine 不是包
+    try:
+        from chart_engine.generator import constraints_for, generate_charts, write_chart
+    except ImportError:
+        from generator import constraints_for, generate_charts, write_chart
 
-    maxlength = bpm * length_seconds / 60
-    n = 0
     output_bpm = bpm if bpm is not None else 120
-    lines = [f"bpm={output_bpm}"]
-
-    while n < maxlength:
-        x = random.randint(2, 6)
-        type_val = random.randint(1, 100)
-        trace = random.randint(1, 3)
-
-        if type_val <= 85:
-            if trace == 1:
-                lines.append(f"({n+x},tap,0)")
-            elif trace == 2:
-                lines.append(f"({n+x},tap,1)")
-            elif trace == 3:
-                lines.append(f"({n+x},tap,0)")
-                lines.append(f"({n+x},tap,1)")
-            n = n + x
-        else:
-            length = random.randint(3, 8)
-            head = random.randint(1, 20)
-            tail = random.randint(1, 10)
-            for m in range(length):
-                if m == 0:
-                    if trace == 1:
-                        lines.append(f"({n+x},hold_start,0)")
-                        if head == 1:
-                            lines.append(f"({n+x},tap,1)")
-                    elif trace == 2:
-                        lines.append(f"({n+x},hold_start,1)")
-                        if head == 1:
-                            lines.append(f"({n+x},tap,0)")
-                    elif trace == 3:
-                        lines.append(f"({n+x},hold_start,0)")
-                        lines.append(f"({n+x},hold_start,1)")
-                elif m == length - 1:
-                    if trace == 1:
-                        lines.append(f"({n+x+m},hold_mid,0)")
-                        if tail == 1:
-                            lines.append(f"({n+x+m},tap,1)")
-                    elif trace == 2:
-                        lines.append(f"({n+x+m},hold_mid,1)")
-                        if tail == 1:
-                            lines.append(f"({n+x+m},tap,0)")
-                    elif trace == 3:
-                        lines.append(f"({n+x+m},hold_mid,0)")
-                        lines.append(f"({n+x+m},hold_mid,1)")
-                else:
-                    if trace == 1:
-                        lines.append(f"({n+x+m},hold_mid,0)")
-                    elif trace == 2:
-                        lines.append(f"({n+x+m},hold_mid,1)")
-                    elif trace == 3:
-                        lines.append(f"({n+x+m},hold_mid,0)")
-                        lines.append(f"({n+x+m},hold_mid,1)")
-            n = n + x + (length - 1)
+    try:
+        chart = generate_charts(1, seeds=[seed], bpm=output_bpm, name_prefix=name,
+                                constraints=constraints_for(output_bpm, length_seconds, **constraints))[0]
+    except (TypeError, ValueError) as exc:
+        print(f"错误：随机谱面参数无效: {exc}")
+        return None
 
+    output_path = Path(output_dir) / f"{name}.txt"
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            for line in lines:
-                f.write(line + "\n")
+        write_chart(chart, output_path)
     except Exception as exc:
         print(f"错误：无法写入文件 {output_path}: {exc}")
         return None
@@ -204,131 +500,956 @@ def generate_random_chart(output_dir, name="Random", bpm=120, length_seconds=60,
     return output_path
 
 
+# ==== ROM 镜像（process_chart 输出） ====
+ROM_LEN = 4096
+ROM_ADDR_WIDTH = 12
+# hex / mif：数据写入同名 .hex / .mif，ROM.v 为固定的加载模块；verilog：旧的逐行 initial 赋值；
+# sparse：delta-time 编码写入同名 .sparse.hex，由固定的 Sparse_ROM.v 解码
+ROM_FORMATS = ("hex", "mif", "verilog", "sparse")
+# 生成的 ROM 与被改写的 MuseDash.v / Address_Generator.v / ROM.v 所在目录
+VERILOG_DIR = Path(__file__).resolve().parent.parent / "verilog"
+
+
+def build_rom_image(chart: Chart, rom_len: int = ROM_LEN) -> Optional[bytearray]:
+    """将谱面展开为 ROM 镜像：每个地址一个字节，值为 {noteup, notedown}（轨道 1 在高 2 位）"""
+    max_time = chart.duration
+    if max_time >= rom_len:
+        print(f"[process_chart] 谱面时间超过可支持范围: max_time={max_time}")
+        return None
+
+    rom = bytearray(rom_len)
+    _fill_rom(rom, chart, 0)
+    return rom
+
+
+def _fill_rom(rom: bytearray, chart: Chart, base: int):
+    """将谱面事件写入 ``rom[base:]``"""
+    for time_val, val, trace in zip(chart.times, chart.types, chart.tracks):
+        addr = base + time_val
+        if trace == 1:
+            rom[addr] = (rom[addr] & 0b0011) | (val << 2)
+        else:
+            rom[addr] = (rom[addr] & 0b1100) | val
+
+
+def rom_addr_width(rom_len: int) -> int:
+    """ROM 深度对应的地址位宽，4096 为 12 位"""
+    return max(1, (rom_len - 1).bit_length())
+
+
+def format_rom_hex(rom: bytearray) -> str:
+    """$readmemh 格式：每行一个 4 位字"""
+    return "\n".join(map("{:x}".format, rom)) + "\n"
+
+
+def format_rom_mif(rom: bytearray) -> str:
+    """Quartus MIF 格式，连续相同的字合并为地址区间"""
+    lines = [
+        "WIDTH=4;",
+        f"DEPTH={len(rom)};",
+        "ADDRESS_RADIX=UNS;",
+        "DATA_RADIX=HEX;",
+        "",
+        "CONTENT BEGIN",
+    ]
+    start = 0
+    for idx in range(1, len(rom) + 1):
+        if idx < len(rom) and rom[idx] == rom[start]:
+            continue
+        if idx - 1 == start:
+            lines.append(f"\t{start} : {rom[start]:x};")
+        else:
+            lines.append(f"\t[{start}..{idx - 1}] : {rom[start]:x};")
+        start = idx
+    lines.extend(["END;", ""])
+    return "\n".join(lines)
+
+
+def format_rom_verilog(rom: bytearray) -> str:
+    """逐地址 initial 赋值的 ROM 模块（旧格式）"""
+    lines_out = [
+        "module ROM (",
+        f"    input [{rom_addr_width(len(rom)) - 1}:0] addr,",
+        "    output reg [1:0] noteup,",
+        "    output reg [1:0] notedown",
+        ");",
+        "",
+        f"reg [3:0] ROM [0:{len(rom) - 1}];",
+        "",
+        "initial begin",
+    ]
+    for idx, val in enumerate(rom):
+        lines_out.append(f"\tROM[{idx}] = 4'b{val:04b};")
+    lines_out.extend(
+        [
+            "end",
+            "",
+            "always @(*) begin",
+            "    {noteup, notedown} = ROM[addr];",
+            "end",
+            "",
+            "endmodule",
+            "",
+        ]
+    )
+    return "\n".join(lines_out)
+
+
+def format_rom_loader(init_file: str, rom_format: str, rom_len: int = ROM_LEN) -> str:
+    """固定的 ROM 模块：内容由初始化文件加载，换谱面时模块本身不变"""
+    if rom_format == "mif":
+        header = ["module ROM ("]
+        body = [f'(* ram_init_file = "{init_file}" *) reg [3:0] ROM [0:{rom_len - 1}];', ""]
+    else:
+        header = [
+            "module ROM #(",
+            f'    parameter INIT_FILE = "{init_file}"',
+            ") (",
+        ]
+        body = [
+            f"reg [3:0] ROM [0:{rom_len - 1}];",
+            "",
+            "initial begin",
+            "    $readmemh(INIT_FILE, ROM);",
+            "end",
+            "",
+        ]
+    lines_out = [
+        *header,
+        f"    input [{rom_addr_width(rom_len) - 1}:0] addr,",
+        "    output reg [1:0] noteup,",
+        "    output reg [1:0] notedown",
+        ");",
+        "",
+        *body,
+        "always @(*) begin",
+        "    {noteup, notedown} = ROM[addr];",
+        "end",
+        "",
+        "endmodule",
+        "",
+    ]
+    return "\n".join(lines_out)
+
+
+def write_rom(rom: bytearray, verilog_path: Path, rom_format: str = "hex") -> Path:
+    """按格式写出 ROM，返回数据文件路径。
+
+    hex / mif 只重写数据文件，ROM 模块内容不变时不重写（保持时间戳，便于增量编译）；
+    初始化文件路径相对 quartus/ 工程目录。
+    """
+    if rom_format not in ROM_FORMATS or rom_format == "sparse":
+        raise ValueError(f"不支持的 ROM 格式: {rom_format}")
+    instrument.count("chart_engine.rom_words_written", len(rom), format=rom_format)
+    if rom_format == "verilog":
+        _replace_text(verilog_path, format_rom_verilog(rom))
+        return verilog_path
+
+    data_path = verilog_path.with_suffix(f".{rom_format}")
+    formatter = format_rom_hex if rom_format == "hex" else format_rom_mif
+    _replace_text(data_path, formatter(rom), encoding="ascii")
+
+    loader = format_rom_loader(f"../{verilog_path.parent.name}/{data_path.name}", rom_format, len(rom))
+    _write_if_changed(verilog_path, loader)
+    return data_path
+
+
+def _replace_text(path: Path, content: str, encoding: str = "utf-8"):
+    """先写临时文件再 os.replace，读取方（Quartus、并发的请求）不会看到写了一半的文件"""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_text(content, encoding=encoding)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """内容不同时才写入（保持时间戳，便于增量编译），返回是否写入"""
+    try:
+        current = path.read_text(encoding="utf-8")
+    except OSError:
+        current = None
+    if current == content:
+        return False
+    _replace_text(path, content)
+    return True
+
+
+# ==== 稀疏 ROM（delta-time 编码，Sparse_ROM.v 解码） ====
+# 每个表项 8 位 {delta[3:0], word[3:0]}：先输出 delta 个空字，再输出 word。
+# 超过 15 的空白由 {15, 0} 表项（16 个空字）补齐；8'h00 为结束标记，之后一直输出空字。
+# 表深度即表项数（含结束标记），经 MuseDash.v 的 SPARSE_DEPTH 传给 Sparse_ROM，占用 8 x 表项数 bit；
+# 上限 2048 项（16 Kbit，与 4096 x 4 位的稠密 ROM 相同），超过时稀疏编码不再节省存储
+SPARSE_MAX_DEPTH = 2048
+SPARSE_MAX_DELTA = 15
+SPARSE_END = 0x00
+
+
+def build_sparse_words(chart: Chart) -> bytearray:
+    """展开为稠密字序列（长度为 duration + 1，不受 ROM_LEN 限制）"""
+    words = bytearray(chart.duration + 1 if len(chart) else 0)
+    _fill_rom(words, chart, 0)
+    return words
+
+
+def encode_sparse(words: bytes) -> bytearray:
+    """稠密字序列 -> 稀疏表项（含结束标记）"""
+    entries = bytearray()
+    gap = 0
+    for word in words:
+        if word == 0:
+            gap += 1
+            continue
+        while gap > SPARSE_MAX_DELTA:
+            entries.append(SPARSE_MAX_DELTA << 4)
+            gap -= SPARSE_MAX_DELTA + 1
+        entries.append((gap << 4) | word)
+        gap = 0
+    entries.append(SPARSE_END)
+    return entries
+
+
+def decode_sparse(entries: bytes) -> bytearray:
+    """稀疏表项 -> 稠密字序列，逐项与 Sparse_ROM.v 的输出一致（结束标记之后全为空字，不再展开）"""
+    words = bytearray()
+    for entry in entries:
+        if entry == SPARSE_END:
+            break
+        words.extend(bytes(entry >> 4))
+        words.append(entry & 0xF)
+    return words
+
+
+def build_sparse_image(chart: Chart) -> Optional[bytearray]:
+    """编码谱面并以稠密镜像为参照做往返校验，超出 SPARSE_MAX_DEPTH 时返回 None"""
+    words = build_sparse_words(chart)
+    entries = encode_sparse(words)
+    if len(entries) > SPARSE_MAX_DEPTH:
+        print(f"[process_chart] 稀疏表项超过可支持范围: {len(entries)} > {SPARSE_MAX_DEPTH}")
+        return None
+    if decode_sparse(entries) != words.rstrip(b"\x00"):
+        print("[process_chart] 稀疏编码往返校验失败")
+        return None
+    return entries
+
+
+def format_sparse_hex(entries: bytes) -> str:
+    """$readmemh 格式：每行一个 8 位表项，不补齐（行数即 Sparse_ROM 的 DEPTH）"""
+    return "\n".join(map("{:02x}".format, entries)) + "\n"
+
+
+def read_sparse_depth(data_path: Path) -> int:
+    """.sparse.hex 的表项数"""
+    with open(data_path, "r", encoding="ascii") as handle:
+        return sum(1 for line in handle if line.strip())
+
+
+def sparse_data_path(verilog_path: Path) -> Path:
+    return verilog_path.with_suffix(".sparse.hex")
+
+
+def check_sparse_roundtrip(chart: Chart) -> bool:
+    """以 build_rom_image 的稠密镜像为参照校验稀疏编码：逐 tick 比较解码输出（结束后补空字）"""
+    dense = build_rom_image(chart) if chart.duration < ROM_LEN else build_sparse_words(chart)
+    if dense is None:
+        return False
+    decoded = decode_sparse(encode_sparse(dense))
+    return decoded + bytes(len(dense) - len(decoded)) == dense
+
+
 # ==== process_chart (adapted from chart_engine/rom_gen.py) ====
-def process_chart(chart_name: str, output_filename: str = "ROM.v") -> bool:
-    base_dir = Path(__file__).resolve().parent.parent
-    chart_path = _resolve_chart_path(chart_name, None)
-    if not chart_path.exists():
-        print(f"[process_chart] 文件不存在: {chart_path}")
+# MuseDash.v 为全局共享文件，保护其 parameter 读改写
+_MUSEDASH_LOCK = threading.Lock()
+# MuseDash.v、Address_Generator.v 与 ROM.v 共同决定硬件播放哪个谱面：
+# 切换谱面（参数 + ROM）整体在 hardware_lock() 内完成，并发处理不同谱面时不会留下 div_cnt 与 ROM 不匹配的组合
+_HARDWARE_LOCK = threading.RLock()
+_HARDWARE_LOCK_FILE = ".hardware.lock"
+_hardware_depth = 0
+
+
+def _lock_file(handle):
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        return
+    while True:  # pragma: no cover - Windows：LK_LOCK 重试约 10 秒后抛出 OSError
+        try:
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def _unlock_file(handle):
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    else:  # pragma: no cover - Windows
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextlib.contextmanager
+def hardware_lock():
+    """切换谱面的互斥锁：进程内为可重入锁，进程间为 verilog/.hardware.lock 上的文件锁
+    （server 的 process 请求与命令行的 --select / --bank 互斥）"""
+    global _hardware_depth
+    with _HARDWARE_LOCK:
+        if _hardware_depth:
+            _hardware_depth += 1
+            try:
+                yield
+            finally:
+                _hardware_depth -= 1
+            return
+        with open(VERILOG_DIR / _HARDWARE_LOCK_FILE, "a+b") as handle:
+            _lock_file(handle)
+            _hardware_depth = 1
+            try:
+                yield
+            finally:
+                _hardware_depth = 0
+                _unlock_file(handle)
+
+
+def process_chart(chart_name: str, output_filename: str = "ROM.v", chart: Optional[Chart] = None,
+                  rom_format: str = "hex", leave_bank: bool = False) -> bool:
+    """校验谱面、更新 MuseDash.v 的 div_cnt 并写出 ROM。
+
+    ``chart`` 为已解析的谱面时直接复用，不再重新读取文件。
+    ``rom_format`` 为 hex / mif 时数据写入 ``output_filename`` 同名的 .hex / .mif，
+    ``output_filename`` 本身为加载该文件的固定 ROM 模块；为 verilog 时输出逐行赋值的 ROM 模块。
+    MuseDash.v 处于 bank 模式时须传入 ``leave_bank=True`` 才会切回单谱面（见 ``update_div_cnt``）。
+    """
+    with instrument.span("chart_engine.process_chart", chart=chart_name, format=rom_format):
+        ok = _process_chart(chart_name, output_filename, chart, rom_format, leave_bank)
+    instrument.count("chart_engine.charts_processed", result="ok" if ok else "failed")
+    return ok
+
+
+def _process_chart(chart_name: str, output_filename: str, chart: Optional[Chart], rom_format: str,
+                   leave_bank: bool) -> bool:
+    if rom_format not in ROM_FORMATS:
+        print(f"[process_chart] 未知的 ROM 格式: {rom_format}")
         return False
+    if chart is None:
+        chart = load_chart(chart_name, tag="process_chart")
+        if chart is None:
+            return False
 
-    if not chart_check(chart_name, chart_path):
+    if not validate_chart(chart):
         return False
 
-    pattern = re.compile(r"^\(\s*([^,]+)\s*,\s*([^,]+)\s*,\s*([^)]+)\s*\)$")
+    # 文本解析得到的谱面顺带写出二进制旁路文件，之后的加载直接映射
+    if isinstance(chart.times, array):
+        write_chart_binary(chart)
+
+    with hardware_lock():
+        if not update_div_cnt(chart.bpm, sparse=rom_format == "sparse", leave_bank=leave_bank):
+            return False
+        return write_chart_rom(chart, output_filename, rom_format) and install_rom(output_filename, rom_format)
+
+
+def bpm_to_div_cnt(bpm: int) -> int:
+    """div_cnt = 50,000,000 / (bpm * 4 / 60) / 2 = 375,000,000 / bpm"""
+    return int(375000000 / bpm)
+
+
+def set_verilog_parameters(content: str, values: Dict[str, object]) -> str:
+    """替换 Verilog 源码中 ``parameter 名 = 值`` 的默认值：int 对应十进制数，str 对应字符串字面量"""
+    for name, value in values.items():
+        if isinstance(value, str):
+            pattern, literal = rf'(parameter\s+{name}\s*=\s*)("[^"]*")', f'"{value}"'
+        else:
+            pattern, literal = rf"(parameter\s+{name}\s*=\s*)(\d+)", str(value)
+        content = re.sub(pattern, lambda match: match.group(1) + literal, content, count=1)
+    return content
+
+
+def _update_musedash_parameters(values: Dict[str, object], tag: str) -> Optional[bool]:
+    """按 {参数名: 值} 更新 MuseDash.v 的 parameter，返回是否重写了文件，失败返回 None"""
+    musedash_path = VERILOG_DIR / "MuseDash.v"
     try:
-        lines = chart_path.read_text(encoding="utf-8").splitlines()
+        # 多线程并发处理不同谱面时串行读改写
+        with _MUSEDASH_LOCK:
+            musedash_content = musedash_path.read_text(encoding="utf-8")
+            updated = set_verilog_parameters(musedash_content, values)
+            if updated == musedash_content:
+                return False
+            _replace_text(musedash_path, updated)
     except Exception as exc:
-        print(f"[process_chart] 读取文件失败: {exc}")
+        print(f"[{tag}] 更新 MuseDash.v 失败: {exc}")
+        return None
+    return True
+
+
+def musedash_banked() -> bool:
+    """MuseDash.v 当前是否为多谱面 bank 模式（BANKED = 1，由 ``pack_chart_bank`` 写入）"""
+    musedash_path = VERILOG_DIR / "MuseDash.v"
+    try:
+        content = musedash_path.read_text(encoding="utf-8")
+    except OSError:
         return False
+    match = re.search(r"parameter\s+BANKED\s*=\s*(\d+)", content)
+    return match is not None and int(match.group(1)) != 0
+
 
-    # 3.1. 解析第一行获取 BPM 并更新 MuseDash.v 的 div_cnt
-    if not lines:
-        print(f"[process_chart] 文件为空")
+def update_div_cnt(bpm: int, tag: str = "process_chart", sparse: bool = False, leave_bank: bool = False) -> bool:
+    """根据 BPM 更新 MuseDash.v 的 div_cnt 并切回单谱面模式（``sparse`` 选择稀疏解码器）；值未变化时不重写文件。
+
+    切回单谱面会重写 Address_Generator.v 并置 BANKED = 0，打包好的 bank 表随之失效；
+    当前为 bank 模式时只有 ``leave_bank=True`` 才继续，否则报错返回 False。
+    """
+    if bpm <= 0:
+        print(f"[{tag}] BPM 值无效: {bpm}")
         return False
-    bpm_line = lines[0].strip()
-    if not bpm_line.startswith("bpm="):
-        print(f"[process_chart] 第一行格式错误，应为 bpm=xxx: {bpm_line}")
+    div_cnt = bpm_to_div_cnt(bpm)
+
+    if musedash_banked():
+        if not leave_bank:
+            print(f"[{tag}] MuseDash.v 当前为多谱面 bank 模式（BANKED = 1），切回单谱面会覆盖打包的 bank 表；"
+                  f"确认切换请使用 leave_bank=True（命令行 --leave-bank）")
+            return False
+        print(f"[{tag}] 退出 bank 模式：BANKED = 0，Address_Generator.v 恢复为单谱面")
+
+    changed = _update_musedash_parameters(
+        {"div_cnt": div_cnt, "BANKED": 0, "ADDR_WIDTH": ROM_ADDR_WIDTH, "SPARSE": int(sparse)}, tag)
+    if changed is None:
         return False
-    try:
-        bpm = float(bpm_line[4:])  # 跳过 "bpm="
-        if bpm <= 0:
-            print(f"[process_chart] BPM 值无效: {bpm}")
+    if changed:
+        print(f"[{tag}] 已更新 MuseDash.v 的 div_cnt = {div_cnt} (BPM = {bpm})")
+    else:
+        print(f"[{tag}] MuseDash.v 的 div_cnt 已为 {div_cnt} (BPM = {bpm})，无需更新")
+    return write_address_generator([_SINGLE_BANK], ROM_ADDR_WIDTH, tag)
+
+
+def write_chart_rom(chart: Chart, output_filename: str = "ROM.v", rom_format: str = "hex",
+                    tag: str = "process_chart") -> bool:
+    """生成谱面的 ROM 镜像并按格式写入 verilog/ 目录，不涉及 MuseDash.v。
+
+    sparse 格式只写出 ``output_filename`` 同名的 .sparse.hex，由固定的 Sparse_ROM.v 加载。
+    """
+    verilog_path = VERILOG_DIR / output_filename
+    if rom_format == "sparse":
+        entries = build_sparse_image(chart)
+        if entries is None:
+            return False
+        try:
+            _replace_text(sparse_data_path(verilog_path), format_sparse_hex(entries), encoding="ascii")
+        except Exception as exc:
+            print(f"[{tag}] 写入 ROM 失败: {exc}")
             return False
-        div_cnt = int(375000000 / bpm)
-    except (ValueError, ZeroDivisionError) as exc:
-        print(f"[process_chart] 解析 BPM 失败: {exc}")
+        instrument.count("chart_engine.rom_words_written", len(entries), format="sparse")
+        return True
+
+    rom = build_rom_image(chart)
+    if rom is None:
         return False
 
-    # 更新 MuseDash.v 的 div_cnt
-    musedash_path = base_dir / "verilog" / "MuseDash.v"
     try:
-        musedash_content = musedash_path.read_text(encoding="utf-8")
-        # 使用正则表达式替换 div_cnt 的值
-        div_cnt_pattern = r"(parameter\s+div_cnt\s*=\s*)\d+"
-        replacement = f"\\g<1>{div_cnt}"
-        musedash_content = re.sub(
-            div_cnt_pattern, replacement, musedash_content)
-        musedash_path.write_text(musedash_content, encoding="utf-8")
-        print(
-            f"[process_chart] 已更新 MuseDash.v 的 div_cnt = {div_cnt} (BPM = {bpm})")
+        write_rom(rom, verilog_path, rom_format)
     except Exception as exc:
-        print(f"[process_chart] 更新 MuseDash.v 失败: {exc}")
+        print(f"[{tag}] 写入 ROM 失败: {exc}")
         return False
+    return True
 
-    events = []
-    max_time = 0
-    for raw_line in lines[1:]:
-        line = raw_line.strip()
-        if not line:
-            break
-        match = pattern.match(line)
-        if not match:
-            print(f"[process_chart] 行格式错误: {line}")
+
+def install_rom(output_filename: str, rom_format: str = "hex", tag: str = "process_chart") -> bool:
+    """让工程实际编译的 verilog/ROM.v 加载 ``output_filename`` 的谱面数据（单谱面模式）。
+
+    hex / mif：ROM.v 改为指向该数据文件的固定加载模块；verilog：把该模块复制为 ROM.v。内容不变时不重写。
+    sparse 不经过 ROM.v：MuseDash.v 的 SPARSE_INIT / SPARSE_DEPTH 指向该 .sparse.hex 及其表项数。
+    """
+    verilog_dir = VERILOG_DIR
+    source = verilog_dir / output_filename
+    target = verilog_dir / "ROM.v"
+    if rom_format == "sparse":
+        data_path = sparse_data_path(source)
+        try:
+            depth = read_sparse_depth(data_path)
+        except OSError as exc:
+            print(f"[{tag}] 读取稀疏 ROM 失败: {exc}")
             return False
-        time_str, evt_type, trace_str = match.groups()
-        time_val = int(time_str.strip())
-        evt_type = evt_type.strip()
-        trace_str = trace_str.strip()
-        max_time = max(max_time, time_val)
-        events.append((time_val, evt_type, trace_str))
-
-    # 计算 ROM 长度：覆盖到 max_time，最小 1，最大 4096
-    max_len = max(1 << max(max_time.bit_length(), 0), 1)
-    if max_len > 4096:
-        print(f"[process_chart] 谱面时间超过可支持范围: max_time={max_time}")
+        init_file = f"../{verilog_dir.name}/{data_path.name}"
+        return _update_musedash_parameters({"SPARSE_INIT": init_file, "SPARSE_DEPTH": depth}, tag) is not None
+    if source == target:
+        return True
+    try:
+        if rom_format == "verilog":
+            changed = _write_if_changed(target, source.read_text(encoding="utf-8"))
+            loaded = source.name
+        else:
+            data_path = source.with_suffix(f".{rom_format}")
+            if not data_path.is_file():
+                print(f"[{tag}] ROM 数据文件不存在: {data_path}")
+                return False
+            loaded = data_path.name
+            changed = _write_if_changed(
+                target, format_rom_loader(f"../{verilog_dir.name}/{loaded}", rom_format, ROM_LEN))
+    except OSError as exc:
+        print(f"[{tag}] 更新 ROM.v 失败: {exc}")
         return False
-    rom_len = 4096
-
-    rom = [0] * rom_len
-    type_to_val = {"tap": 0b01, "hold_start": 0b10, "hold_mid": 0b11}
-    for time_val, evt_type, trace_str in events:
-        val = type_to_val[evt_type]
-        if time_val >= rom_len:
-            print(
-                f"[process_chart] time 索引越界: time={time_val}, rom_len={rom_len}")
-            return False
-        if trace_str == "1":
-            rom[time_val] = (rom[time_val] & 0b0011) | (val << 2)
+    if changed:
+        print(f"[{tag}] ROM.v 已改为加载 {loaded}")
+    return True
+
+
+# ==== 多谱面 ROM bank（一次编译容纳整个曲目列表） ====
+# 镜像布局（每个地址一个 4 位字）：
+#   [0..1]            bank 数（高 4 位在前）
+#   [2+16*i .. +15]   第 i 个 bank：base 4 字、length 4 字、div_cnt 7 字、保留 1 字（均高位在前）
+#   之后按 BANK_ALIGN 对齐依次存放各谱面，每个谱面末尾至少一个空字，地址生成器停在该处
+BANK_MAX = 8                # MuseDash.v 的 bank_sel 为 3 位
+BANK_ADDR_WIDTH_MAX = 16    # 表项 base / length 各 4 个字
+BANK_ENTRY_WORDS = 16
+BANK_HEADER_WORDS = 2
+BANK_ALIGN = 16
+DIV_CNT_BITS = 25
+
+
+class BankEntry(NamedTuple):
+    name: str
+    base: int
+    length: int
+    bpm: int
+    div_cnt: int
+
+
+# 单谱面模式：从 0 播放到 ROM 末尾，div_cnt 取 MuseDash.v 的参数（BANKED = 0），表项中的值不使用
+_SINGLE_BANK = BankEntry("", 0, ROM_LEN, 0, 0)
+
+
+def _put_nibbles(rom: bytearray, addr: int, value: int, width: int):
+    for idx in range(width):
+        rom[addr + idx] = (value >> (4 * (width - 1 - idx))) & 0xF
+
+
+def build_bank_image(charts: List[Chart], names: List[str]) -> Optional[Tuple[bytearray, List[BankEntry]]]:
+    """将多个谱面依次排入一个 ROM 镜像并写入索引头，返回 (镜像, bank 表)。
+
+    镜像长度取不小于 ROM_LEN 的 2 的幂，单个谱面不再受 4096 tick 限制。
+    """
+    if not 0 < len(charts) <= BANK_MAX:
+        print(f"[pack_bank] bank 数量须为 1 ~ {BANK_MAX}: {len(charts)}")
+        return None
+
+    entries: List[BankEntry] = []
+    header_len = BANK_HEADER_WORDS + BANK_ENTRY_WORDS * len(charts)
+    base = -(-header_len // BANK_ALIGN) * BANK_ALIGN
+    for name, chart in zip(names, charts):
+        if chart.bpm <= 0:
+            print(f"[pack_bank] {name}: BPM 值无效: {chart.bpm}")
+            return None
+        div_cnt = bpm_to_div_cnt(chart.bpm)
+        if div_cnt >= 1 << DIV_CNT_BITS:
+            print(f"[pack_bank] {name}: BPM 过低，div_cnt 超过 {DIV_CNT_BITS} 位: {div_cnt}")
+            return None
+        length = chart.duration + 2
+        entries.append(BankEntry(name, base, length, chart.bpm, div_cnt))
+        base = -(-(base + length) // BANK_ALIGN) * BANK_ALIGN
+
+    rom_len = ROM_LEN
+    while rom_len < base:
+        rom_len *= 2
+    if rom_addr_width(rom_len) > BANK_ADDR_WIDTH_MAX:
+        print(f"[pack_bank] 谱面总长度超过可支持范围: {base}")
+        return None
+
+    rom = bytearray(rom_len)
+    _put_nibbles(rom, 0, len(entries), BANK_HEADER_WORDS)
+    for idx, (entry, chart) in enumerate(zip(entries, charts)):
+        addr = BANK_HEADER_WORDS + BANK_ENTRY_WORDS * idx
+        _put_nibbles(rom, addr, entry.base, 4)
+        _put_nibbles(rom, addr + 4, entry.length, 4)
+        _put_nibbles(rom, addr + 8, entry.div_cnt, 7)
+        _fill_rom(rom, chart, entry.base)
+    return rom, entries
+
+
+def read_bank_header(rom: bytearray) -> List[Tuple[int, int, int]]:
+    """解析镜像索引头，返回 [(base, length, div_cnt)]"""
+    def nibbles(addr: int, width: int) -> int:
+        value = 0
+        for idx in range(width):
+            value = (value << 4) | rom[addr + idx]
+        return value
+
+    count = nibbles(0, BANK_HEADER_WORDS)
+    table = []
+    for idx in range(count):
+        addr = BANK_HEADER_WORDS + BANK_ENTRY_WORDS * idx
+        table.append((nibbles(addr, 4), nibbles(addr + 4, 4), nibbles(addr + 8, 7)))
+    return table
+
+
+def format_address_generator(entries: List[BankEntry], addr_width: int = ROM_ADDR_WIDTH) -> str:
+    """地址生成器：按 bank 表给出起始地址与 div_cnt，复位后从起始地址播放，到最后一个字停住"""
+    table = []
+    for idx, entry in enumerate(entries):
+        comment = f" // {entry.name} (BPM {entry.bpm})" if entry.name else ""
+        table.append(
+            f"        3'd{idx}: begin base = 'd{entry.base}; last = 'd{entry.length - 1}; "
+            f"div_cnt = 25'd{entry.div_cnt}; end{comment}"
+        )
+    first = entries[0]
+    table.append(
+        f"        default: begin base = 'd{first.base}; last = 'd{first.length - 1}; "
+        f"div_cnt = 25'd{first.div_cnt}; end"
+    )
+    lines_out = [
+        "module Address_Generator #(",
+        f"    parameter ADDR_WIDTH = {addr_width}",
+        ") (",
+        "    input clk_div,",
+        "    input rst_n,",
+        "    input [2:0] bank,",
+        "",
+        "    output [ADDR_WIDTH-1:0] address,",
+        "    output reg [24:0] div_cnt",
+        ");",
+        "",
+        "// bank 表（由 chart_engine 生成）：base 为谱面起始地址，last 为最后一个字的偏移",
+        "reg [ADDR_WIDTH-1:0] base;",
+        "reg [ADDR_WIDTH-1:0] last;",
+        "reg [ADDR_WIDTH-1:0] offset;",
+        "",
+        "always @(*) begin",
+        "    case(bank)",
+        *table,
+        "    endcase",
+        "end",
+        "",
+        "always @(posedge clk_div or negedge rst_n) begin",
+        "    if(!rst_n) begin",
+        "        offset <= 'd0;",
+        "    end else if(offset == last) begin",
+        "        offset <= offset;",
+        "    end else begin",
+        "        offset <= offset + 'd1;",
+        "    end",
+        "end",
+        "",
+        "assign address = base + offset;",
+        "",
+        "endmodule",
+        "",
+    ]
+    return "\n".join(lines_out)
+
+
+def write_address_generator(entries: List[BankEntry], addr_width: int = ROM_ADDR_WIDTH,
+                            tag: str = "process_chart") -> bool:
+    """写出 verilog/Address_Generator.v，内容不变时不重写"""
+    path = VERILOG_DIR / "Address_Generator.v"
+    try:
+        _write_if_changed(path, format_address_generator(entries, addr_width))
+    except OSError as exc:
+        print(f"[{tag}] 写入 Address_Generator.v 失败: {exc}")
+        return False
+    return True
+
+
+def pack_chart_bank(chart_names: List[str], output_filename: str = "ROM.v",
+                    rom_format: str = "hex") -> Optional[List[BankEntry]]:
+    """将多个谱面打包为一个 bank ROM，返回 bank 表。
+
+    写出 ROM（``output_filename`` 及其数据文件）与带 bank 表的 Address_Generator.v，
+    并将 MuseDash.v 切换为 BANKED = 1 与对应的 ADDR_WIDTH。之后换曲只需拨 bank_sel 开关并 restart，
+    无需重新编译；``process_chart`` / ``update_div_cnt`` 须传入 ``leave_bank=True`` 才会切回单谱面模式。
+    """
+    if rom_format not in ROM_FORMATS or rom_format == "sparse":
+        print(f"[pack_bank] 不支持的 ROM 格式: {rom_format}")
+        return None
+
+    charts = []
+    for name in chart_names:
+        chart = load_chart(name, tag="pack_bank")
+        if chart is None or not validate_chart(chart):
+            return None
+        charts.append(chart)
+
+    packed = build_bank_image(charts, chart_names)
+    if packed is None:
+        return None
+    rom, entries = packed
+    addr_width = rom_addr_width(len(rom))
+
+    verilog_path = VERILOG_DIR / output_filename
+    with hardware_lock():
+        try:
+            write_rom(rom, verilog_path, rom_format)
+        except Exception as exc:
+            print(f"[pack_bank] 写入 ROM 失败: {exc}")
+            return None
+        if not write_address_generator(entries, addr_width, tag="pack_bank"):
+            return None
+        if _update_musedash_parameters({"BANKED": 1, "ADDR_WIDTH": addr_width, "SPARSE": 0}, "pack_bank") is None:
+            return None
+
+    for idx, entry in enumerate(entries):
+        print(f"[pack_bank] bank {idx}: {entry.name} base={entry.base} length={entry.length} "
+              f"BPM={entry.bpm} div_cnt={entry.div_cnt}")
+    return entries
+
+
+# ==== 批量 ROM 构建（内容寻址缓存） ====
+ROM_MANIFEST_PATH = Path(__file__).resolve().parent / "outputs" / "rom_manifest.json"
+# ROM 镜像布局版本号：修改 build_rom_image / write_rom 的输出时递增，使缓存失效
+ROM_BUILDER_VERSION = 2
+BUILD_OK = "ok"
+BUILD_SKIPPED = "skipped"
+BUILD_FAILED = "failed"
+
+
+def resolve_chart_names(patterns: List[str]) -> List[str]:
+    """将曲目名或通配符（如 ``C*``）展开为 charts/ 下含同名 TXT 的曲目名，保持输入顺序并去重"""
+    charts_dir = Path(__file__).resolve().parent.parent / "charts"
+    available = sorted(
+        entry.name for entry in charts_dir.iterdir()
+        if entry.is_dir() and (entry / f"{entry.name}.txt").is_file()
+    )
+    names: List[str] = []
+    for pattern in patterns:
+        if any(ch in pattern for ch in "*?["):
+            matched = fnmatch.filter(available, pattern)
+            if not matched:
+                print(f"[build_roms] 没有匹配的谱面: {pattern}")
         else:
-            rom[time_val] = (rom[time_val] & 0b1100) | val
+            matched = [pattern]
+        for name in matched:
+            if name not in names:
+                names.append(name)
+    return names
 
-    verilog_path = base_dir / "verilog" / output_filename
+
+def rom_build_key(chart_path: Path, rom_format: str) -> str:
+    """谱面内容 + ROM 格式与版本号的 sha256"""
+    digest = hashlib.sha256(chart_path.read_bytes())
+    digest.update(f"|rom={ROM_BUILDER_VERSION}|len={ROM_LEN}|format={rom_format}".encode())
+    return digest.hexdigest()
+
+
+def _rom_outputs(output_filename: str, rom_format: str) -> List[str]:
+    if rom_format == "sparse":
+        return [str(sparse_data_path(Path(output_filename)))]
+    outputs = [output_filename]
+    if rom_format != "verilog":
+        outputs.append(str(Path(output_filename).with_suffix(f".{rom_format}")))
+    return outputs
+
+
+def _load_rom_manifest() -> Dict[str, dict]:
     try:
-        lines_out = [
-            "module ROM (",
-            "    input [11:0] addr,",
-            "    output reg [1:0] noteup,",
-            "    output reg [1:0] notedown",
-            ");",
-            "",
-            f"reg [3:0] ROM [0:{rom_len - 1}];",
-            "",
-            "initial begin",
-        ]
-        for idx, val in enumerate(rom):
-            lines_out.append(f"\tROM[{idx}] = 4'b{val:04b};")
-        lines_out.extend(
-            [
-                "end",
-                "",
-                "always @(*) begin",
-                "    {noteup, notedown} = ROM[addr];",
-                "end",
-                "",
-                "endmodule",
-                "",
+        with open(ROM_MANIFEST_PATH, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != ROM_BUILDER_VERSION:
+        return {}
+    return data.get("charts", {})
+
+
+def _save_rom_manifest(charts: Dict[str, dict]):
+    ROM_MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = ROM_MANIFEST_PATH.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump({"version": ROM_BUILDER_VERSION, "charts": charts}, handle, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, ROM_MANIFEST_PATH)
+
+
+def _build_chart_rom(chart_name: str, output_filename: str,
+                    rom_format: str) -> Tuple[Optional[int], str, List[instrument.Record]]:
+    """子进程中构建单个谱面的 ROM（不修改 MuseDash.v），返回 (BPM 或 None, 输出日志, 埋点记录)"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), instrument.collecting() as records, \
+            instrument.span("chart_engine.build_rom", chart=chart_name):
+        chart = load_chart(chart_name, tag="build_roms")
+        if chart is None:
+            return None, buffer.getvalue(), records
+        with chart:
+            ok = validate_chart(chart) and write_chart_rom(chart, output_filename, rom_format, tag="build_roms")
+            if ok and isinstance(chart.times, array):
+                write_chart_binary(chart)
+    return (chart.bpm if ok else None), buffer.getvalue(), records
+
+
+def build_roms(patterns: List[str], output_template: str = "{name}_ROM.v", rom_format: str = "hex",
+               jobs: int = 1, select: Optional[str] = None, force: bool = False,
+               leave_bank: bool = False) -> Dict[str, str]:
+    """批量构建多个谱面的 ROM，返回 {曲目名: ok / skipped / failed}。
+
+    谱面内容哈希与格式均未变化且输出文件齐全的谱面直接跳过；其余按 ``jobs`` 个进程并行构建。
+    构建过程不修改 MuseDash.v 与 ROM.v；``select`` 指定的谱面构建成功后切换为该谱面：
+    div_cnt 不同时重写 MuseDash.v，并让 ROM.v 加载该谱面的数据（``install_rom``）；
+    当前为 bank 模式时须传入 ``leave_bank=True``。
+    """
+    if rom_format not in ROM_FORMATS:
+        print(f"[build_roms] 未知的 ROM 格式: {rom_format}")
+        return {}
+
+    names = resolve_chart_names(patterns)
+    manifest = _load_rom_manifest()
+    statuses: Dict[str, str] = {}
+    todo: List[Tuple[str, str, str]] = []
+
+    for name in names:
+        chart_path = _resolve_chart_path(name, None)
+        output_filename = output_template.format(name=name)
+        try:
+            key = rom_build_key(chart_path, rom_format)
+        except OSError as exc:
+            print(f"[build_roms] {name}: 读取谱面失败 ({exc})")
+            statuses[name] = BUILD_FAILED
+            continue
+        outputs = _rom_outputs(output_filename, rom_format)
+        entry = manifest.get(name)
+        if (
+            not force
+            and entry is not None
+            and entry.get("key") == key
+            and entry.get("outputs") == outputs
+            and all((VERILOG_DIR / output).is_file() for output in outputs)
+        ):
+            print(f"[build_roms] {name}: 未变化，跳过")
+            instrument.count("chart_engine.rom_builds", status=BUILD_SKIPPED)
+            statuses[name] = BUILD_SKIPPED
+            continue
+        todo.append((name, output_filename, key))
+
+    def _record(name: str, output_filename: str, key: str, bpm: Optional[int], output: str):
+        instrument.count("chart_engine.rom_builds", status=BUILD_OK if bpm is not None else BUILD_FAILED)
+        if output:
+            print(output, end="")
+        if bpm is None:
+            statuses[name] = BUILD_FAILED
+            manifest.pop(name, None)
+            return
+        outputs = _rom_outputs(output_filename, rom_format)
+        manifest[name] = {"key": key, "bpm": bpm, "outputs": outputs}
+        statuses[name] = BUILD_OK
+        print(f"[build_roms] {name}: 已输出 {outputs[0]}")
+
+    if jobs > 1 and len(todo) > 1:
+        # 进程池按需导入（multiprocessing 的导入开销不计入单谱面命令的启动时间）
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo)), initializer=instrument.clear_listeners) as pool:
+            futures = [
+                (name, output_filename, key, pool.submit(_build_chart_rom, name, output_filename, rom_format))
+                for name, output_filename, key in todo
             ]
-        )
-        verilog_path.write_text("\n".join(lines_out), encoding="utf-8")
-    except Exception as exc:
-        print(f"[process_chart] 写入 ROM 失败: {exc}")
-        return False
+            for name, output_filename, key, future in futures:
+                try:
+                    bpm, output, records = future.result()
+                except Exception as exc:
+                    bpm, output, records = None, f"[build_roms] {name}: 子进程出错 ({exc})\n", []
+                # 子进程的埋点记录合并到本进程
+                for record in records:
+                    instrument.ingest(record, forward=True)
+                _record(name, output_filename, key, bpm, output)
+    else:
+        for name, output_filename, key in todo:
+            bpm, output, _ = _build_chart_rom(name, output_filename, rom_format)
+            _record(name, output_filename, key, bpm, output)
+
+    if todo:
+        try:
+            _save_rom_manifest(manifest)
+        except OSError as exc:
+            print(f"[build_roms] 写入 manifest 失败: {exc}")
+
+    if select is not None:
+        entry = manifest.get(select)
+        if statuses.get(select) not in (BUILD_OK, BUILD_SKIPPED) or entry is None:
+            print(f"[build_roms] 选中的谱面未成功构建: {select}")
+            statuses[select] = BUILD_FAILED
+        else:
+            # 参数与 ROM.v 一起切换，不与 server 的 process 请求交错
+            with hardware_lock():
+                selected = (
+                    update_div_cnt(entry["bpm"], tag="build_roms", sparse=rom_format == "sparse",
+                                   leave_bank=leave_bank)
+                    and install_rom(output_template.format(name=select), rom_format, tag="build_roms")
+                )
+            if not selected:
+                statuses[select] = BUILD_FAILED
+
+    return statuses
 
-    return True
 
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="谱面校验与 ROM 生成")
+    parser.add_argument("--check", nargs="+", metavar="CHART", help="仅流式校验指定谱面（曲目名或 txt 路径）")
+    parser.add_argument("--all-errors", action="store_true", help="配合 --check，一次报告全部错误而非第一处")
+    parser.add_argument("--rom-format", choices=ROM_FORMATS, default="hex",
+                        help="ROM 输出格式：hex/mif 为固定 ROM 模块 + 初始化文件，verilog 为逐行赋值，"
+                             "sparse 为 delta-time 稀疏编码（默认 hex）")
+    parser.add_argument("--pack", nargs="+", metavar="CHART", help="校验指定谱面并写出二进制旁路文件（.bin）")
+    parser.add_argument("--build", nargs="+", metavar="CHART",
+                        help="批量构建 ROM，可用通配符（如 'C*'），未变化的谱面跳过")
+    parser.add_argument("--output", default="{name}_ROM.v", help="配合 --build，输出文件名模板（默认 {name}_ROM.v）")
+    parser.add_argument("--select", metavar="CHART", help="配合 --build，切换硬件到该谱面：更新 MuseDash.v 的 div_cnt 并让 ROM.v 加载其数据")
+    parser.add_argument("--leave-bank", action="store_true",
+                        help="配合 --select，MuseDash.v 为 bank 模式时确认切回单谱面（覆盖打包的 bank 表）")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="配合 --build，并行进程数（默认 1）")
+    parser.add_argument("--force", action="store_true", help="配合 --build，忽略缓存全部重建")
+    parser.add_argument("--bank", nargs="+", metavar="CHART",
+                        help=f"将多个谱面（最多 {BANK_MAX} 个，可用通配符）打包进 ROM.v，按 bank_sel 开关选曲")
+    parser.add_argument("--sparse-check", nargs="+", metavar="CHART",
+                        help="对指定谱面做稀疏编码往返校验并统计存储占用")
+    args = parser.parse_args(argv)
+
+    if args.sparse_check:
+        failed = 0
+        for name in args.sparse_check:
+            chart = load_chart(name)
+            if chart is None or not check_sparse_roundtrip(chart):
+                print(f"[sparse] {name}: 往返校验失败")
+                failed += 1
+                continue
+            entries = encode_sparse(build_sparse_words(chart))
+            print(f"[sparse] {name}: {len(entries)} 个表项 ({len(entries) * 8} bit)，"
+                  f"稠密 {chart.duration + 1} 个字 ({(chart.duration + 1) * 4} bit)，"
+                  f"为稠密 ROM（{ROM_LEN * 4} bit）的 {len(entries) * 8 / (ROM_LEN * 4):.0%}")
+        sys.exit(1 if failed else 0)
+
+    if args.bank:
+        entries = pack_chart_bank(resolve_chart_names(args.bank), rom_format=args.rom_format)
+        sys.exit(0 if entries else 1)
+
+    if args.build:
+        statuses = build_roms(args.build, output_template=args.output, rom_format=args.rom_format,
+                              jobs=max(1, args.jobs), select=args.select, force=args.force,
+                              leave_bank=args.leave_bank)
+        built = sum(status == BUILD_OK for status in statuses.values())
+        skipped = sum(status == BUILD_SKIPPED for status in statuses.values())
+        failed = sum(status == BUILD_FAILED for status in statuses.values())
+        print(f"[build_roms] 完成：构建 {built}，跳过 {skipped}，失败 {failed}")
+        sys.exit(1 if failed or not statuses else 0)
+
+    if args.pack:
+        failed = 0
+        for name in args.pack:
+            chart = load_chart(name)
+            path = write_chart_binary(chart) if chart is not None and validate_chart(chart) else None
+            if path is None:
+                failed += 1
+            else:
+                print(f"[OK] {path}")
+        sys.exit(1 if failed else 0)
+
+    if args.check:
+        failed = 0
+        for target in args.check:
+            target_path = Path(target) if target.endswith(".txt") else None
+            name = target_path.stem if target_path is not None else target
+            if chart_check(name, target_path, collect_all=args.all_errors):
+                print(f"[OK] {target}")
+            else:
+                failed += 1
+        sys.exit(1 if failed else 0)
 
-def main():
     base_dir = Path(__file__).resolve().parent.parent
     chart_name = "Random"
     chart_dir = base_dir / "charts" / chart_name
@@ -341,25 +1462,24 @@ def main():
     print(f"    [OK] 已生成: {chart_path}")
 
     print("[2/5] 校验谱面 ...")
-    if not chart_check(chart_name, chart_path):
+    chart = load_chart(chart_name, chart_path)
+    if chart is None or not validate_chart(chart):
         return
     print("    [OK] 校验通过")
 
     print("[3/5] 生成 Verilog ROM (test_rom.v) ...")
-    if not process_chart(chart_name, output_filename="test_rom.v"):
+    if not process_chart(chart_name, output_filename="test_rom.v", chart=chart, rom_format=args.rom_format):
         return
     print(f"    [OK] 已输出: {base_dir / 'verilog' / 'test_rom.v'}")
 
-    print("[4/5] 处理 Cthugha 谱面 ...")
-    if not process_chart("Cthugha", output_filename="Cthugha_ROM.v"):
-        return
-    print(f"    [OK] 已输出: {base_dir / 'verilog' / 'Cthugha_ROM.v'}")
-
-    print("[5/5] 处理 Cyaegha 谱面 ...")
-    if not process_chart("Cyaegha", output_filename="Cyaegha_ROM.v"):
+    print("[4/5] 批量处理 Cthugha / Cyaegha 谱面 ...")
+    statuses = build_roms(["Cthugha", "Cyaegha"], rom_format=args.rom_format, select="Cyaegha")
+    if any(status == BUILD_FAILED for status in statuses.values()):
         return
-    print(f"    [OK] 已输出: {base_dir / 'verilog' / 'Cyaegha_ROM.v'}")
+    for name in statuses:
+        print(f"    [OK] 已输出: {base_dir / 'verilog' / f'{name}_ROM.v'}")
 
+    print("[5/5] 完成")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,313 @@
+"""
+chart_check 的模糊测试与吞吐基准：
+对合法谱面（generator 生成 + charts/ 下的谱面）施加随机变异，以独立实现的向量化规则为参照，
+检查流式校验与内存校验的接受/拒绝结果及每条诊断；再测量 1K ~ 10M 事件谱面的校验吞吐。
+结果写入 JSON，便于对比回归。
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+try:
+    from chart_engine.chart_engine import (
+        HOLD_MID, HOLD_START, TAP, Chart, collect_diagnostics, load_chart, parse_chart, resolve_chart_names,
+        validate_chart,
+    )
+    from chart_engine.generator import ChartConstraints, generate_charts, write_chart
+except ImportError:
+    # python chart_engine/fuzz.py：脚本目录在 sys.path 首位，chart_engine 解析为同目录的 chart_engine.py
+    from chart_engine import (
+        HOLD_MID, HOLD_START, TAP, Chart, collect_diagnostics, load_chart, parse_chart, resolve_chart_names,
+        validate_chart,
+    )
+    from generator import ChartConstraints, generate_charts, write_chart
+
+RESULTS_PATH = Path(__file__).resolve().parent / "outputs" / "chart_check_fuzz.json"
+RESULTS_VERSION = 1
+BENCH_SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+class Events(NamedTuple):
+    """谱面事件的三列 numpy 数组（文件顺序）"""
+
+    times: np.ndarray
+    types: np.ndarray
+    tracks: np.ndarray
+
+    @classmethod
+    def from_chart(cls, chart: Chart) -> "Events":
+        return cls(np.asarray(chart.times, dtype=np.int64), np.asarray(chart.types, dtype=np.int8),
+                   np.asarray(chart.tracks, dtype=np.int8))
+
+    def to_chart(self, name: str, bpm: int) -> Chart:
+        chart = Chart(name, None, bpm)
+        chart.times.frombytes(self.times.astype(np.int32).tobytes())
+        chart.types.frombytes(self.types.astype(np.int8).tobytes())
+        chart.tracks.frombytes(self.tracks.astype(np.int8).tobytes())
+        return chart
+
+    def take(self, index: np.ndarray) -> "Events":
+        return Events(self.times[index], self.types[index], self.tracks[index])
+
+
+# ==== 参照规则（按 charts/README.md 与 chart_engine/doc 独立实现，逐行向量化） ====
+def reference_diagnostics(events: Events) -> List[Tuple[int, str]]:
+    """返回全部诊断的 (行号, 规则名)，行号从 2 起（第 1 行为 bpm），顺序与流式校验一致。
+
+    每行至多一条：时间比上一行小为 monotonic；否则与同轨上一事件比较，时间不严格递增为 track_order，
+    hold_mid 不紧接前一拍同轨 hold_start / hold_mid 为 hold_mid，hold_start 后不是 hold_mid 为 hold_start。
+    文件末尾各轨最后一个事件为 hold_start 时报告 hold_unclosed（行号指向该 hold_start）。
+    """
+    times, types, tracks = events
+    count = len(times)
+    rows = np.arange(count)
+    rule = np.full(count, "", dtype=object)
+
+    # 同轨上一事件的行号（无则 -1）
+    prev = np.full(count, -1)
+    for track in (0, 1):
+        on_track = rows[tracks == track]
+        prev[on_track[1:]] = on_track[:-1]
+    has_prev = prev >= 0
+    prev_time = np.where(has_prev, times[prev], 0)
+    prev_type = np.where(has_prev, types[prev], 0)
+    is_mid = types == HOLD_MID
+
+    hold_start_rule = has_prev & ~is_mid & (prev_type == HOLD_START)
+    hold_mid_rule = is_mid & (~has_prev | (prev_type == TAP) | (prev_time != times - 1))
+    track_order_rule = has_prev & (prev_time >= times)
+    monotonic_rule = np.zeros(count, dtype=bool)
+    monotonic_rule[1:] = times[1:] < times[:-1]
+    # 优先级由低到高覆盖
+    rule[hold_start_rule] = "hold_start"
+    rule[hold_mid_rule & ~track_order_rule] = "hold_mid"
+    rule[track_order_rule] = "track_order"
+    rule[monotonic_rule] = "monotonic"
+
+    found = [(int(row) + 2, rule[row]) for row in np.flatnonzero(rule != "")]
+    for track in (0, 1):
+        on_track = rows[tracks == track]
+        if len(on_track) and types[on_track[-1]] == HOLD_START:
+            found.append((int(on_track[-1]) + 2, "hold_unclosed"))
+    return found
+
+
+# ==== 变异算子 ====
+def _swap(rng: np.random.Generator, events: Events) -> Events:
+    idx = int(rng.integers(len(events.times) - 1))
+    order = np.arange(len(events.times))
+    order[idx], order[idx + 1] = idx + 1, idx
+    return events.take(order)
+
+
+def _duplicate(rng: np.random.Generator, events: Events) -> Events:
+    idx = int(rng.integers(len(events.times)))
+    return events.take(np.insert(np.arange(len(events.times)), idx, idx))
+
+
+def _delete(rng: np.random.Generator, events: Events) -> Events:
+    return events.take(np.delete(np.arange(len(events.times)), int(rng.integers(len(events.times)))))
+
+
+def _retype(rng: np.random.Generator, events: Events) -> Events:
+    idx = int(rng.integers(len(events.times)))
+    types = events.types.copy()
+    types[idx] = rng.choice([code for code in (TAP, HOLD_START, HOLD_MID) if code != types[idx]])
+    return Events(events.times, types, events.tracks)
+
+
+def _retrack(rng: np.random.Generator, events: Events) -> Events:
+    idx = int(rng.integers(len(events.times)))
+    tracks = events.tracks.copy()
+    tracks[idx] ^= 1
+    return Events(events.times, events.types, tracks)
+
+
+def _shift(rng: np.random.Generator, events: Events) -> Events:
+    idx = int(rng.integers(len(events.times)))
+    times = events.times.copy()
+    times[idx] = max(0, times[idx] + int(rng.choice([-2, -1, 1, 2])))
+    return Events(times, events.types, events.tracks)
+
+
+def _truncate(rng: np.random.Generator, events: Events) -> Events:
+    return events.take(np.arange(int(rng.integers(1, len(events.times)))))
+
+
+MUTATIONS: Dict[str, Callable[[np.random.Generator, Events], Events]] = {
+    "swap": _swap,
+    "duplicate": _duplicate,
+    "delete": _delete,
+    "retype": _retype,
+    "retrack": _retrack,
+    "shift": _shift,
+    "truncate": _truncate,
+}
+
+
+def _source_charts(generated: int, seed: Optional[int], max_ticks: int) -> List[Chart]:
+    charts = []
+    for name in resolve_chart_names(["*"]):
+        chart = load_chart(name, tag="fuzz")
+        if chart is not None and validate_chart(chart) and len(chart) >= 2:
+            charts.append(chart)
+    constraints = ChartConstraints(density=0.6, hold_ratio=0.3, max_ticks=max_ticks)
+    charts.extend(
+        chart for chart in generate_charts(generated, seed=seed, name_prefix="Fuzz", constraints=constraints)
+        if len(chart) >= 2
+    )
+    return charts
+
+
+def run_fuzz(cases: int = 2000, seed: Optional[int] = 0, generated: int = 50, max_ticks: int = 400,
+             max_mutations: int = 3) -> dict:
+    """变异合法谱面并与参照规则比对，返回统计；``mismatches`` 中每项可由 (seed, case) 复现"""
+    sources = _source_charts(generated, seed, max_ticks)
+    names = list(MUTATIONS)
+    per_mutation = {name: {"cases": 0, "rejected": 0, "mismatches": 0} for name in names}
+    mismatches = []
+    accepted = rejected = 0
+
+    with tempfile.TemporaryDirectory(prefix="chart_fuzz_") as tmp_dir:
+        chart_path = Path(tmp_dir) / "case.txt"
+        for case, case_seed in enumerate(np.random.SeedSequence(seed).spawn(cases)):
+            rng = np.random.default_rng(case_seed)
+            source = sources[int(rng.integers(len(sources)))]
+            events = Events.from_chart(source)
+            applied = []
+            for _ in range(int(rng.integers(1, max_mutations + 1))):
+                if len(events.times) < 2:
+                    break
+                name = names[int(rng.integers(len(names)))]
+                events = MUTATIONS[name](rng, events)
+                applied.append(name)
+
+            expected = reference_diagnostics(events)
+            chart = events.to_chart("case", source.bpm)
+            write_chart(chart, chart_path)
+            streamed = [(diag.line, diag.rule) for diag in collect_diagnostics("case", chart_path)]
+            valid = _validate_quiet(chart)
+
+            ok = streamed == expected and valid == (not expected)
+            if expected:
+                rejected += 1
+            else:
+                accepted += 1
+            for name in set(applied):
+                per_mutation[name]["cases"] += 1
+                per_mutation[name]["rejected"] += bool(expected)
+                per_mutation[name]["mismatches"] += not ok
+            if not ok:
+                mismatches.append({
+                    "case": case, "source": source.name, "mutations": applied,
+                    "expected": expected[:5], "streamed": streamed[:5], "validate_chart": valid,
+                })
+
+    return {
+        "seed": seed,
+        "cases": cases,
+        "sources": len(sources),
+        "accepted": accepted,
+        "rejected": rejected,
+        "by_mutation": per_mutation,
+        "mismatches": mismatches,
+    }
+
+
+def _validate_quiet(chart: Chart) -> bool:
+    """validate_chart 不通过时会打印错误信息，模糊测试中屏蔽输出"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return validate_chart(chart)
+
+
+# ==== 吞吐基准 ====
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(sizes=BENCH_SIZES, seed: Optional[int] = 0) -> List[dict]:
+    """按目标事件数生成合法谱面，测量流式校验、解析与内存校验的用时（小谱面取多次中的最小值）"""
+    constraints = ChartConstraints()
+    low, high = constraints.hold_length
+    events_per_tick = constraints.density * (1 + constraints.hold_ratio * ((low + high) / 2 - 1))
+    results = []
+    with tempfile.TemporaryDirectory(prefix="chart_bench_") as tmp_dir:
+        for size in sizes:
+            bench_constraints = constraints._replace(max_ticks=max(2, int(size / events_per_tick)))
+            chart = generate_charts(1, seed=seed, name_prefix="Bench", constraints=bench_constraints)[0]
+            chart_path = write_chart(chart, Path(tmp_dir) / f"bench_{size}.txt")
+            events = len(chart)
+            repeat = max(1, min(5, 1_000_000 // max(events, 1)))
+
+            stream_s = _best_of(repeat, lambda: collect_diagnostics("bench", chart_path, limit=1))
+            parsed: List[Chart] = []
+            parse_s = _best_of(repeat, lambda: parsed.append(parse_chart("bench", chart_path, use_binary=False)[0]))
+            validate_s = _best_of(repeat, lambda: validate_chart(parsed.pop()))
+            results.append({
+                "target_events": size,
+                "events": events,
+                "file_bytes": chart_path.stat().st_size,
+                "repeat": repeat,
+                "stream_check_s": round(stream_s, 6),
+                "stream_events_per_s": round(events / stream_s) if stream_s else None,
+                "parse_s": round(parse_s, 6),
+                "validate_s": round(validate_s, 6),
+                "validate_events_per_s": round(events / validate_s) if validate_s else None,
+            })
+            chart_path.unlink()
+            print(f"[fuzz] {events} 个事件：流式校验 {stream_s:.3f}s，解析 {parse_s:.3f}s，内存校验 {validate_s:.3f}s")
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="chart_check 模糊测试与吞吐基准")
+    parser.add_argument("--cases", type=int, default=2000, help="变异用例数（0 为跳过模糊测试）")
+    parser.add_argument("--seed", type=int, default=0, help="主种子，用例 i 的种子由其派生")
+    parser.add_argument("--generated", type=int, default=50, help="作为变异来源的生成谱面数")
+    parser.add_argument("--sizes", type=int, nargs="*", default=list(BENCH_SIZES),
+                        help="基准的目标事件数（不给值则跳过基准）")
+    parser.add_argument("--output", default=str(RESULTS_PATH), help="结果 JSON 路径")
+    args = parser.parse_args(argv)
+
+    report = {
+        "version": RESULTS_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+    }
+    if args.cases > 0:
+        start = time.perf_counter()
+        report["fuzz"] = run_fuzz(args.cases, seed=args.seed, generated=args.generated)
+        report["fuzz"]["elapsed_s"] = round(time.perf_counter() - start, 3)
+        fuzz = report["fuzz"]
+        print(f"[fuzz] {fuzz['cases']} 个用例：拒绝 {fuzz['rejected']}，接受 {fuzz['accepted']}，"
+              f"不一致 {len(fuzz['mismatches'])}")
+    if args.sizes:
+        report["benchmark"] = run_benchmark(args.sizes, seed=args.seed)
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"[fuzz] 结果已写入 {output_path}")
+    sys.exit(1 if report.get("fuzz", {}).get("mismatches") else 0)
+
+
+if __name__ == "__main__":
+    main()
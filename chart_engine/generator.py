@@ -0,0 +1,212 @@
+"""
+随机谱面批量生成：每个谱面使用独立的 numpy.random.Generator，按轨道整段生成事件数组，
+构造上保证通过 chart_check（同轨严格递增、长条连续且闭合、整体时间单调不减）。
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from chart_engine.chart_engine import HOLD_MID, HOLD_START, TAP, TYPE_NAMES, Chart
+except ImportError:
+    # 以脚本方式运行（python chart_engine/generator.py 或 chart_engine.py）时，
+    # 脚本目录下的 chart_engine.py 遮蔽了同名包，chart_engine 即该模块本身
+    from chart_engine import HOLD_MID, HOLD_START, TAP, TYPE_NAMES, Chart
+
+
+class ChartConstraints(NamedTuple):
+    """随机谱面的约束。
+
+    ``density``：两轨合计每 tick 的音符（tap / hold 头）数目标，受最小间隔限制时取可达上限；
+    ``hold_ratio``：音符为长条的概率；``hold_length``：长条总长度（含 hold_start）的闭区间，下限至少为 2；
+    ``track_balance``：音符落在轨道 1 的比例；``max_ticks``：所有事件（含长条尾）的时间上限（不含）。
+    """
+
+    density: float = 0.3
+    hold_ratio: float = 0.15
+    hold_length: Tuple[int, int] = (3, 8)
+    track_balance: float = 0.5
+    max_ticks: int = 120
+
+
+def constraints_for(bpm: int, length_seconds: float, **overrides) -> ChartConstraints:
+    """按 BPM 与时长换算 max_ticks（与旧版 generate_random_chart 相同：bpm * 秒数 / 60）"""
+    overrides.setdefault("max_ticks", int(bpm * length_seconds / 60))
+    return ChartConstraints(**overrides)
+
+
+def _check_constraints(constraints: ChartConstraints):
+    low, high = constraints.hold_length
+    if not 2 <= low <= high:
+        raise ValueError(f"hold_length 须满足 2 <= 下限 <= 上限: {constraints.hold_length}")
+    if not 0.0 <= constraints.hold_ratio <= 1.0:
+        raise ValueError(f"hold_ratio 须在 [0, 1] 内: {constraints.hold_ratio}")
+    if not 0.0 <= constraints.track_balance <= 1.0:
+        raise ValueError(f"track_balance 须在 [0, 1] 内: {constraints.track_balance}")
+    if constraints.density < 0 or constraints.max_ticks < 0:
+        raise ValueError("density 与 max_ticks 不得为负")
+
+
+def _track_events(rng: np.random.Generator, rate: float, constraints: ChartConstraints) -> Tuple[np.ndarray, np.ndarray]:
+    """生成单轨事件 (times, types)。
+
+    音符依次排列：每个音符前至少空 1 tick（间隔服从几何分布，均值按 ``rate`` 换算），
+    长条占据连续的 tick，超出 max_ticks 的音符整体丢弃，因此长条总是闭合的。
+    """
+    max_ticks = constraints.max_ticks
+    if rate <= 0 or max_ticks <= 1:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int8)
+
+    low, high = constraints.hold_length
+    mean_length = 1.0 + constraints.hold_ratio * ((low + high) / 2.0 - 1.0)
+    mean_gap = max(1.0, 1.0 / rate - mean_length)
+    # 每个音符至少占 1 tick 间隔 + 1 tick，按上界一次采样，再截断到 max_ticks
+    count = max_ticks // 2 + 1
+    gaps = rng.geometric(1.0 / mean_gap, size=count)
+    lengths = np.where(
+        rng.random(count) < constraints.hold_ratio,
+        rng.integers(low, high + 1, size=count),
+        1,
+    )
+    starts = np.cumsum(gaps + lengths) - lengths
+    ends = starts + lengths
+    keep = int(np.searchsorted(ends, max_ticks, side="right"))
+    starts = starts[:keep]
+    lengths = lengths[:keep]
+
+    total = int(lengths.sum())
+    heads = np.cumsum(lengths) - lengths
+    offsets = np.arange(total) - np.repeat(heads, lengths)
+    times = (np.repeat(starts, lengths) + offsets).astype(np.int32)
+    types = np.full(total, HOLD_MID, dtype=np.int8)
+    types[heads] = np.where(lengths == 1, TAP, HOLD_START)
+    return times, types
+
+
+def random_chart(rng: np.random.Generator, bpm: int = 120, name: str = "Random",
+                 constraints: ChartConstraints = ChartConstraints()) -> Chart:
+    """用给定的 Generator 生成一个谱面（不写文件）"""
+    _check_constraints(constraints)
+    share_1 = constraints.track_balance
+    times_0, types_0 = _track_events(rng, constraints.density * (1.0 - share_1), constraints)
+    times_1, types_1 = _track_events(rng, constraints.density * share_1, constraints)
+
+    times = np.concatenate((times_0, times_1))
+    types = np.concatenate((types_0, types_1))
+    tracks = np.concatenate((np.zeros(len(times_0), dtype=np.int8), np.ones(len(times_1), dtype=np.int8)))
+    # 按 (time, track) 排序：整体时间单调不减，同轨顺序不变
+    order = np.lexsort((tracks, times))
+
+    chart = Chart(name, None, bpm)
+    chart.times.frombytes(times[order].astype(np.int32).tobytes())
+    chart.types.frombytes(types[order].tobytes())
+    chart.tracks.frombytes(tracks[order].tobytes())
+    return chart
+
+
+def chart_seeds(count: int, seed: Optional[int] = None) -> List[np.random.SeedSequence]:
+    """由一个主种子派生 ``count`` 个相互独立的种子；同一主种子的第 i 个谱面总是相同，与线程/进程划分无关"""
+    return np.random.SeedSequence(seed).spawn(count)
+
+
+def generate_charts(count: int, seed: Optional[int] = None, seeds: Optional[Sequence] = None,
+                    bpm: int = 120, name_prefix: str = "Random",
+                    constraints: ChartConstraints = ChartConstraints()) -> List[Chart]:
+    """批量生成谱面。
+
+    ``seeds`` 给出时逐个谱面使用（int 或 SeedSequence，长度须为 ``count``），否则由 ``seed`` 派生。
+    ``count`` 为 1 时谱面名即 ``name_prefix``，否则为 ``<name_prefix>_<序号>``。
+    """
+    if seeds is None:
+        seeds = chart_seeds(count, seed)
+    elif len(seeds) != count:
+        raise ValueError(f"seeds 数量 {len(seeds)} 与 count {count} 不一致")
+    _check_constraints(constraints)
+
+    charts = []
+    for idx, chart_seed in enumerate(seeds):
+        name = name_prefix if count == 1 else f"{name_prefix}_{idx:0{len(str(count - 1))}d}"
+        charts.append(random_chart(np.random.default_rng(chart_seed), bpm, name, constraints))
+    return charts
+
+
+def format_chart(chart: Chart) -> str:
+    """谱面 TXT 文本：bpm 头行 + 每行一个 (time,type,track)"""
+    names = TYPE_NAMES
+    lines = [f"bpm={chart.bpm}"]
+    lines.extend(
+        f"({time_val},{names[code]},{track})"
+        for time_val, code, track in zip(chart.times.tolist(), chart.types.tolist(), chart.tracks.tolist())
+    )
+    lines.append("")
+    return "\n".join(lines)
+
+
+def write_chart(chart: Chart, output_path: Path, chunk_events: int = 1 << 16) -> Path:
+    """写出谱面 TXT（打开一次，按块格式化，超大谱面不会一次性生成全部文本），并记录路径到 ``chart.path``"""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    names = TYPE_NAMES
+    with open(output_path, "w", encoding="utf-8") as handle:
+        handle.write(f"bpm={chart.bpm}\n")
+        for start in range(0, len(chart), chunk_events):
+            stop = start + chunk_events
+            handle.writelines(
+                f"({time_val},{names[code]},{track})\n"
+                for time_val, code, track in zip(
+                    chart.times[start:stop].tolist(), chart.types[start:stop].tolist(),
+                    chart.tracks[start:stop].tolist())
+            )
+    chart.path = output_path
+    return output_path
+
+
+def main(argv: Optional[List[str]] = None):
+    defaults = ChartConstraints()
+    parser = argparse.ArgumentParser(description="批量生成随机谱面（可复现，构造上保证通过 chart_check）")
+    parser.add_argument("output_dir", help="输出目录，谱面写入 <output_dir>/<名称>/<名称>.txt")
+    parser.add_argument("--count", type=int, default=1, help="谱面数量")
+    parser.add_argument("--seed", type=int, default=None, help="主种子，第 i 个谱面的种子由其派生")
+    parser.add_argument("--name", default="Random", help="谱面名（数量大于 1 时为前缀）")
+    parser.add_argument("--bpm", type=int, default=120)
+    parser.add_argument("--length", type=float, default=60, help="时长（秒），换算为 max_ticks")
+    parser.add_argument("--max-ticks", type=int, default=None, help="直接指定 max_ticks，覆盖 --length")
+    parser.add_argument("--density", type=float, default=defaults.density, help="两轨合计每 tick 音符数")
+    parser.add_argument("--hold-ratio", type=float, default=defaults.hold_ratio)
+    parser.add_argument("--hold-length", type=int, nargs=2, default=defaults.hold_length,
+                        metavar=("MIN", "MAX"))
+    parser.add_argument("--track-balance", type=float, default=defaults.track_balance,
+                        help="轨道 1 的音符比例")
+    args = parser.parse_args(argv)
+
+    overrides = dict(density=args.density, hold_ratio=args.hold_ratio,
+                     hold_length=tuple(args.hold_length), track_balance=args.track_balance)
+    if args.max_ticks is not None:
+        overrides["max_ticks"] = args.max_ticks
+    try:
+        constraints = constraints_for(args.bpm, args.length, **overrides)
+        start = time.perf_counter()
+        charts = generate_charts(args.count, seed=args.seed, bpm=args.bpm, name_prefix=args.name,
+                                 constraints=constraints)
+    except ValueError as exc:
+        print(f"[generator] {exc}")
+        sys.exit(1)
+    output_dir = Path(args.output_dir)
+    for chart in charts:
+        write_chart(chart, output_dir / chart.name / f"{chart.name}.txt")
+    elapsed = time.perf_counter() - start
+
+    events = sum(len(chart) for chart in charts)
+    print(f"[generator] 已生成 {len(charts)} 个谱面（{events} 个事件）到 {output_dir}，"
+          f"用时 {elapsed:.2f}s（{len(charts) / elapsed:.0f} 个/秒）")
+
+
+if __name__ == "__main__":
+    main()
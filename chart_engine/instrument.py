@@ -0,0 +1,233 @@
+"""
+轻量埋点：命名计时 span 与计数器（线程安全，只依赖标准库）。
+
+- ``span(name, **fields)``：上下文管理器，按名称累计次数、总耗时与最大耗时；执行中的 span 会出现在快照的
+  ``active`` 中，可据此判断慢请求卡在哪个阶段。
+- ``count(name, value=1, **labels)``：累加计数器（解析事件数、写出的 ROM 字数、渲染的图表数、缓存命中等）。
+- 每条记录（span 开始 / 结束、计数）交给已注册的监听器；``configure_log`` 或环境变量 ``MUSEDASH_TRACE``
+  （文件路径，``-`` 为 stderr）指定时另以 JSON 行写出结构化日志，子进程继承环境变量后各自追加写入。
+- ``snapshot()`` / ``format_prometheus()`` 供 server 的 /metrics 使用，``ingest(record)`` 合并其他进程转发来的记录。
+"""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+import json
+import os
+import re
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+Record = dict
+Listener = Callable[[Record], None]
+
+_lock = threading.Lock()
+# (名称, 排序后的标签) -> 累计值
+_counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+# 名称 -> [次数, 总耗时, 最大耗时]
+_spans: Dict[str, List[float]] = {}
+# span id -> 开始记录
+_active: Dict[str, Record] = {}
+_listeners: List[Listener] = []
+_span_ids = itertools.count(1)
+_log_handle = None
+_log_lock = threading.Lock()
+
+
+def configure_log(target: Optional[str]):
+    """结构化日志输出到 ``target``（文件路径，追加写入；``-`` 为 stderr；None 关闭）"""
+    global _log_handle
+    with _log_lock:
+        if _log_handle is not None and _log_handle is not sys.stderr:
+            _log_handle.close()
+        if not target:
+            _log_handle = None
+        elif target == "-":
+            _log_handle = sys.stderr
+        else:
+            _log_handle = open(target, "a", encoding="utf-8", buffering=1)
+
+
+def add_listener(listener: Listener):
+    with _lock:
+        _listeners.append(listener)
+
+
+def remove_listener(listener: Listener):
+    with _lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+
+def _apply(record: Record):
+    kind = record["kind"]
+    with _lock:
+        if kind == "count":
+            key = (record["name"], tuple(sorted(record.get("labels", {}).items())))
+            _counters[key] = _counters.get(key, 0) + record["value"]
+        elif kind == "span_start":
+            _active[record["id"]] = record
+        elif kind == "span_end":
+            _active.pop(record["id"], None)
+            stats = _spans.setdefault(record["name"], [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += record["duration_s"]
+            stats[2] = max(stats[2], record["duration_s"])
+        listeners = list(_listeners)
+    return listeners
+
+
+def _write_log(record: Record):
+    handle = _log_handle
+    if handle is None:
+        return
+    line = json.dumps(record, ensure_ascii=False, default=str)
+    with _log_lock:
+        try:
+            handle.write(line + "\n")
+        except (OSError, ValueError):
+            pass
+
+
+def _emit(record: Record):
+    for listener in _apply(record):
+        listener(record)
+    _write_log(record)
+
+
+def ingest(record: Record, forward: bool = False):
+    """合并其他进程转发的记录（结构化日志已由产生记录的进程写出）。
+
+    ``forward`` 为 True 时同时交给本进程的监听器，使子进程池的记录可继续转发到上层进程。
+    """
+    listeners = _apply(record)
+    if forward:
+        for listener in listeners:
+            listener(record)
+
+
+def _record(kind: str, name: str, **extra) -> Record:
+    return {"ts": time.time(), "pid": os.getpid(), "thread": threading.current_thread().name,
+            "kind": kind, "name": name, **extra}
+
+
+def count(name: str, value: float = 1, **labels):
+    _emit(_record("count", name, value=value, labels={key: str(val) for key, val in labels.items()}))
+
+
+@contextlib.contextmanager
+def span(name: str, **fields) -> Iterator[None]:
+    span_id = f"{os.getpid()}-{next(_span_ids)}"
+    fields = {key: str(val) for key, val in fields.items()}
+    _emit(_record("span_start", name, id=span_id, fields=fields))
+    start = time.perf_counter()
+    error = None
+    try:
+        yield
+    except BaseException as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        extra = {"error": error} if error else {}
+        _emit(_record("span_end", name, id=span_id, fields=fields,
+                      duration_s=round(time.perf_counter() - start, 6), **extra))
+
+
+def clear_listeners():
+    """移除全部监听器。用作进程池的 initializer：fork 出的子进程不沿用父进程的监听器（避免重复转发），
+    子进程的记录由 ``collecting`` 带回父进程"""
+    with _lock:
+        _listeners.clear()
+
+
+@contextlib.contextmanager
+def collecting() -> Iterator[List[Record]]:
+    """在当前进程中收集期间产生的全部记录（用于把子进程的记录带回父进程再 ``ingest``）"""
+    records: List[Record] = []
+    add_listener(records.append)
+    try:
+        yield records
+    finally:
+        remove_listener(records.append)
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _spans.clear()
+        _active.clear()
+
+
+def snapshot() -> dict:
+    now = time.time()
+    with _lock:
+        return {
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(_counters.items())
+            ],
+            "spans": {
+                name: {"count": int(stats[0]), "total_s": round(stats[1], 6), "max_s": round(stats[2], 6)}
+                for name, stats in sorted(_spans.items())
+            },
+            "active": [
+                {"name": record["name"], "fields": record["fields"], "pid": record["pid"],
+                 "thread": record["thread"], "elapsed_s": round(now - record["ts"], 3)}
+                for record in sorted(_active.values(), key=lambda record: record["ts"])
+            ],
+        }
+
+
+def _metric_name(name: str) -> str:
+    return "musedash_" + re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(key, str(val).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, val in sorted(labels.items())
+    )
+    return "{" + body + "}"
+
+
+def format_prometheus(data: Optional[dict] = None) -> str:
+    """Prometheus 文本格式：计数器为 ``musedash_<名称>_total``，span 为 ``musedash_span_seconds`` 摘要"""
+    data = snapshot() if data is None else data
+    lines = []
+    declared = set()
+    for counter in data["counters"]:
+        metric = _metric_name(counter["name"]) + "_total"
+        if metric not in declared:
+            lines.append(f"# TYPE {metric} counter")
+            declared.add(metric)
+        lines.append(f"{metric}{_labels(counter['labels'])} {counter['value']:g}")
+
+    lines.append("# TYPE musedash_span_seconds summary")
+    for name, stats in data["spans"].items():
+        labels = _labels({"span": name})
+        lines.append(f"musedash_span_seconds_count{labels} {stats['count']}")
+        lines.append(f"musedash_span_seconds_sum{labels} {stats['total_s']:g}")
+    lines.append("# TYPE musedash_span_max_seconds gauge")
+    for name, stats in data["spans"].items():
+        lines.append(f"musedash_span_max_seconds{_labels({'span': name})} {stats['max_s']:g}")
+
+    active: Dict[str, List[float]] = {}
+    for record in data["active"]:
+        active.setdefault(record["name"], []).append(record["elapsed_s"])
+    lines.append("# TYPE musedash_span_active gauge")
+    for name, elapsed in sorted(active.items()):
+        lines.append(f"musedash_span_active{_labels({'span': name})} {len(elapsed)}")
+    lines.append("# TYPE musedash_span_active_oldest_seconds gauge")
+    for name, elapsed in sorted(active.items()):
+        lines.append(f"musedash_span_active_oldest_seconds{_labels({'span': name})} {max(elapsed):g}")
+    return "\n".join(lines) + "\n"
+
+
+# 环境变量开启结构化日志（子进程继承）
+if os.environ.get("MUSEDASH_TRACE"):
+    configure_log(os.environ["MUSEDASH_TRACE"])
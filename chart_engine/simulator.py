@@ -0,0 +1,643 @@
+"""
+谱面回放仿真：以 clk_div 为粒度复现 Address_Generator → Queue → Judgement(LFSR)
+→ ScoreConversion → Accumulator 的判定与计分，状态按回放条数向量化。
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+try:
+    from chart_engine.chart_engine import (
+        HOLD_MID, HOLD_START, ROM_LEN, TAP, Chart, build_rom_image, load_chart, validate_chart,
+    )
+except ImportError:
+    # python chart_engine/simulator.py：同目录的 chart_engine.py 遮蔽了包，直接从该模块导入
+    from chart_engine import (
+        HOLD_MID, HOLD_START, ROM_LEN, TAP, Chart, build_rom_image, load_chart, validate_chart,
+    )
+
+
+# ==== 硬件常量（与 verilog/ 保持一致） ====
+# Judgement / ScoreConversion 的判定编码
+PERFECT = 0b00
+GOOD = 0b01
+MISS = 0b10
+NO_NOTE = 0b11
+RESULT_NAMES = {PERFECT: "PERFECT", GOOD: "GOOD", MISS: "MISS", NO_NOTE: "NO_NOTE"}
+# ScoreConversion：按判定编码索引的单轨得分
+RESULT_SCORES = np.array([2, 1, 0, 0], dtype=np.int64)
+
+QUEUE_DEPTH = 16        # Queue 每轨 16 级移位寄存器，bit0 为判定线（left），bit1 为下一拍（right）
+SCORE_MODULUS = 10000   # Accumulator 为 4 位 BCD，溢出后回绕
+
+# LFSR：13 位，抽头 12/11/10/7/0，复位值 1，random_num = lfsr_reg[0]
+LFSR_BITS = 13
+LFSR_MASK = (1 << LFSR_BITS) - 1
+LFSR_RESET = 1
+
+# 按键电平：Judgement 中 PUSHED = 0
+_NOT_PUSHED = 1
+
+# 压缩仿真：每个半周期与每个按键采样内至少仿真的 clk 数，保证瞬态稳定（与逐 clk 仿真对比得出）
+MIN_SUB_STEPS = 6
+MIN_CYCLES_PER_SAMPLE = 6
+
+
+# ==== LFSR（GF(2) 线性映射，可直接跳过任意周期数） ====
+def _lfsr_step(state: int) -> int:
+    next_bit = ((state >> 12) ^ (state >> 11) ^ (state >> 10) ^ (state >> 7) ^ state) & 1
+    return ((state << 1) | next_bit) & LFSR_MASK
+
+
+def _apply_columns(columns: Sequence[int], state: int) -> int:
+    out = 0
+    for bit, column in enumerate(columns):
+        if (state >> bit) & 1:
+            out ^= column
+    return out
+
+
+def lfsr_jump_columns(cycles: int) -> List[int]:
+    """返回 LFSR 前进 ``cycles`` 个 clk 的线性映射（每个状态位对应的结果列）"""
+    result = [1 << bit for bit in range(LFSR_BITS)]
+    power = [_lfsr_step(1 << bit) for bit in range(LFSR_BITS)]
+    while cycles:
+        if cycles & 1:
+            result = [_apply_columns(power, column) for column in result]
+        power = [_apply_columns(power, column) for column in power]
+        cycles >>= 1
+    return result
+
+
+def _lfsr_jump(columns: Sequence[int], states: np.ndarray) -> np.ndarray:
+    """对一批 LFSR 状态同时应用跳转映射"""
+    out = np.zeros_like(states)
+    for bit, column in enumerate(columns):
+        out ^= ((states >> bit) & 1) * np.uint16(column)
+    return out
+
+
+# ==== Judgement 查找表 ====
+# 每轨每个 clk 的寄存器更新只取决于少量位，预先枚举为查找表：
+#   逐条回放的位：judge_state(2) | judged(1) << 2 | click(1) << 3 | click_prev2(1) << 4
+#   各条回放共享的位（只取决于谱面与时钟相位）：
+#       cur_note(2) << 5 | cur_note_delay/delay2 均为 NOTHING(1) << 7 | clk_div != count2(1) << 8
+#       | count2(1) << 9 | clk_div_posedge && count2_negedge(1) << 10
+# 输出为下一拍的 judge_state | judged << 2。
+def _next_state(state, judged, click, cur, quiet, cdc, count2):
+    empty = cur == 0 and quiet
+    tapish = cur in (TAP, HOLD_START)
+    mid = cur == HOLD_MID
+    nothing = cur == 0
+    if state == PERFECT:
+        if empty:
+            return NO_NOTE
+        if tapish and cdc and not judged:
+            return GOOD
+        if mid and click == _NOT_PUSHED and count2 == 0:
+            return MISS
+        if judged:
+            return PERFECT
+        return NO_NOTE if nothing else PERFECT
+    if state == GOOD:
+        if empty:
+            return NO_NOTE
+        if (not cdc and not judged) or mid:
+            return PERFECT
+        if judged:
+            return GOOD
+        return NO_NOTE if nothing else GOOD
+    if state == MISS:
+        if empty:
+            return NO_NOTE
+        if tapish:
+            return GOOD
+        if mid and not judged:
+            return PERFECT
+        if judged:
+            return MISS
+        return NO_NOTE if nothing else MISS
+    if tapish:
+        return GOOD
+    return PERFECT if mid else NO_NOTE
+
+
+def _next_judged(judged, click, click_prev2, cur, quiet, count2, clear):
+    tapish = cur in (TAP, HOLD_START)
+    mid = cur == HOLD_MID
+    if cur == 0 and quiet:
+        return 0
+    if clear:
+        return 0
+    if click_prev2 == _NOT_PUSHED and click != _NOT_PUSHED and tapish:
+        return 1
+    if count2 == 1 and mid:
+        return 1
+    if not judged and mid and click == _NOT_PUSHED and count2 == 0:
+        return 1
+    return judged
+
+
+def _build_step_table() -> np.ndarray:
+    table = np.zeros(1 << 11, dtype=np.uint16)
+    for idx in range(1 << 11):
+        state = idx & 3
+        judged = (idx >> 2) & 1
+        click = (idx >> 3) & 1
+        click_prev2 = (idx >> 4) & 1
+        cur = (idx >> 5) & 3
+        quiet = (idx >> 7) & 1
+        cdc = (idx >> 8) & 1
+        count2 = (idx >> 9) & 1
+        clear = (idx >> 10) & 1
+        nxt = _next_state(state, judged, click, cur, quiet, cdc, count2)
+        nxt_judged = _next_judged(judged, click, click_prev2, cur, quiet, count2, clear)
+        table[idx] = nxt | (nxt_judged << 2)
+    return table
+
+
+def _build_latch_table() -> np.ndarray:
+    """resultup_cond：judge_state | judged << 2 | random << 3 -> 判定结果"""
+    table = np.zeros(16, dtype=np.uint16)
+    for idx in range(16):
+        state = idx & 3
+        judged = (idx >> 2) & 1
+        random_bit = (idx >> 3) & 1
+        if state == GOOD and not judged:
+            table[idx] = MISS
+        elif state == PERFECT and random_bit:
+            table[idx] = GOOD
+        else:
+            table[idx] = state
+    return table
+
+
+_STEP_TABLE = _build_step_table()
+_LATCH_TABLE = _build_latch_table()
+
+
+# ==== ROM / 回放输入 ====
+def build_rom_tracks(chart: Chart) -> Optional[np.ndarray]:
+    """按 process_chart 的 ROM 镜像展开谱面，返回 (ROM_LEN, 2) 的 type code，列 0 为 notedown（轨道 0），列 1 为 noteup"""
+    image = build_rom_image(chart, ROM_LEN)
+    if image is None:
+        return None
+    words = np.frombuffer(image, dtype=np.uint8)
+    return np.stack([words & 0b11, words >> 2], axis=1)
+
+
+def replay_ticks(chart: Chart) -> int:
+    """回放覆盖的 tick 数：谱面时长 + Queue 深度 + 余量，取偶数以对齐判定窗口"""
+    ticks = chart.duration + QUEUE_DEPTH + 4
+    return ticks + (ticks & 1)
+
+
+def judge_time(time_val):
+    """谱面 time 处音符 PERFECT 区间的中心，单位 tick，从复位起算。
+
+    音符在第 time+15 个 clk_div 上升沿进入 Queue bit1（right），下一个上升沿到达 bit0（left），
+    clk_div == count2 的两个半周期（[time+15, time+16)）内按下为 PERFECT。
+    """
+    return time_val + QUEUE_DEPTH - 0.5
+
+
+def synthesize_presses(chart: Chart, batch: int, samples_per_tick: int = 4,
+                       timing_sigma: float = 0.3, miss_rate: float = 0.05,
+                       seed: Optional[int] = None) -> np.ndarray:
+    """按谱面合成一批模拟按键录制，返回 (batch, samples, 2) 的按下电平。
+
+    tap / hold_start 在 ``judge_time`` 附近按下（偏移服从正态分布，单位 tick），
+    tap 持续半拍，长条按住到最后一个 hold_mid 之后；``miss_rate`` 为漏按概率。
+    """
+    rng = np.random.default_rng(seed)
+    n_samples = replay_ticks(chart) * samples_per_tick
+    pressed = np.zeros((batch, n_samples, 2), dtype=bool)
+
+    times = np.frombuffer(chart.times, dtype=np.intc)
+    types = np.frombuffer(chart.types, dtype=np.int8)
+    tracks = np.frombuffer(chart.tracks, dtype=np.int8)
+
+    # 每个按下动作：起点为 tap / hold_start，tap 按住半拍，长条按到同轨连续 hold_mid 的最后一拍之后
+    heads = np.flatnonzero(types != HOLD_MID)
+    ends = times[heads].astype(np.float64) + 0.5
+    for track in (0, 1):
+        on_track = np.flatnonzero(tracks == track)
+        for pos, event in enumerate(on_track):
+            if types[event] != HOLD_START:
+                continue
+            last = event
+            for nxt in on_track[pos + 1:]:
+                if types[nxt] != HOLD_MID:
+                    break
+                last = nxt
+            ends[np.searchsorted(heads, event)] = times[last] + 1.0
+
+    starts = judge_time(times[heads]) + rng.normal(0.0, timing_sigma, size=(batch, len(heads)))
+    stops = starts + (ends - times[heads])
+    hit = rng.random((batch, len(heads))) >= miss_rate
+    first = np.clip(np.round(starts * samples_per_tick).astype(np.int64), 0, n_samples)
+    last = np.clip(np.round(stops * samples_per_tick).astype(np.int64), 0, n_samples)
+
+    # 以差分累加的方式一次性铺开所有按下区间
+    delta = np.zeros((batch, n_samples + 1, 2), dtype=np.int32)
+    rows = np.broadcast_to(np.arange(batch)[:, None], first.shape)
+    cols = np.broadcast_to(tracks[heads], first.shape)
+    np.add.at(delta, (rows[hit], first[hit], cols[hit]), 1)
+    np.add.at(delta, (rows[hit], last[hit], cols[hit]), -1)
+    pressed[:] = np.cumsum(delta, axis=1)[:, :n_samples] > 0
+    return pressed
+
+
+# ==== 仿真 ====
+class ReplayResult(NamedTuple):
+    """一批回放的判定结果"""
+
+    windows: np.ndarray       # (batch, n_windows, 2)：每个判定窗口（2 tick）锁存的 resultdown / resultup
+    note_results: np.ndarray  # (batch, n_events)：每个谱面事件所在窗口的判定
+    counts: np.ndarray        # (batch, 4)：有音符的 (窗口, 轨道) 中各判定编码的次数，按 PERFECT / GOOD / MISS / NO_NOTE
+    score: np.ndarray         # (batch,)：Accumulator 的最终读数（BCD 四位，十进制表示）
+
+
+def simulate_replays(chart: Chart, pressed: np.ndarray, samples_per_tick: int = 4,
+                     sub_steps: Optional[int] = None, lfsr_seed: Union[int, np.ndarray] = LFSR_RESET,
+                     div_cnt: Optional[int] = None) -> Optional[ReplayResult]:
+    """对一批按键录制回放谱面，返回逐窗口 / 逐音符判定与总分；谱面或输入无效时返回 None。
+
+    ``pressed`` 为 (batch, samples, 2) 的按下电平（列 0 为轨道 0 / clickdown），
+    每 tick 采样 ``samples_per_tick`` 次（1 或偶数，使采样边界落在半周期边界上）。每个 clk_div 半周期
+    只仿真 ``sub_steps`` 个 clk（默认每个采样 6 个 clk），足以让 Judgement 中 2 级延迟、边沿检测与 FSM
+    在每次时钟沿或按键变化后稳定；其余 clk 状态保持不变。结果与逐 clk 的 ``simulate_reference``
+    逐窗口一致（tests/test_simulator.py 对照）。
+    LFSR 按真实 clk 计数跳转：``div_cnt`` 默认取 375000000 / bpm，与 MuseDash.v 一致。
+    ``lfsr_seed`` 可为单个非零 13 位初值，或每条回放一个。
+    """
+    if not validate_chart(chart):
+        return None
+    rom = build_rom_tracks(chart)
+    if rom is None:
+        return None
+
+    pressed = np.asarray(pressed, dtype=bool)
+    if pressed.ndim != 3 or pressed.shape[2] != 2:
+        print(f"[simulator] 按键录制形状应为 (batch, samples, 2): {pressed.shape}")
+        return None
+    if samples_per_tick != 1 and samples_per_tick % 2:
+        # 奇数采样率的采样边界落在半周期中间，压缩后按键变化与时钟沿的间隔不足以稳定
+        print(f"[simulator] samples_per_tick 须为 1 或偶数: {samples_per_tick}")
+        return None
+    if sub_steps is None:
+        sub_steps = max(MIN_SUB_STEPS, MIN_CYCLES_PER_SAMPLE * samples_per_tick // 2)
+    cycles_per_tick = 2 * sub_steps
+    if (sub_steps < MIN_SUB_STEPS or cycles_per_tick % samples_per_tick
+            or cycles_per_tick // samples_per_tick < MIN_CYCLES_PER_SAMPLE):
+        print(f"[simulator] sub_steps 需 >= {MIN_SUB_STEPS}，且每个采样至少 {MIN_CYCLES_PER_SAMPLE} 个 clk: "
+              f"sub_steps={sub_steps}, samples_per_tick={samples_per_tick}")
+        return None
+
+    batch = pressed.shape[0]
+    n_ticks = replay_ticks(chart)
+    n_samples = n_ticks * samples_per_tick
+    if pressed.shape[1] < n_samples:
+        pad = np.zeros((batch, n_samples - pressed.shape[1], 2), dtype=bool)
+        pressed = np.concatenate([pressed, pad], axis=1)
+
+    # 输入按时间主序排列，每个采样取一行；按键电平转为查找表索引位（PUSHED = 0）
+    click_rows = np.ascontiguousarray((~pressed[:, :n_samples]).transpose(1, 0, 2)).astype(np.uint16)
+    released = np.full((batch, 2), _NOT_PUSHED, dtype=np.uint16)
+    # 每个采样是否有任一回放的按键电平发生变化
+    changed = np.empty(n_samples, dtype=bool)
+    changed[0] = (click_rows[0] != released).any()
+    changed[1:] = (click_rows[1:] != click_rows[:-1]).any(axis=(1, 2))
+    cycles_per_sample = cycles_per_tick // samples_per_tick
+
+    if div_cnt is None:
+        div_cnt = int(375000000 / chart.bpm) if chart.bpm > 0 else sub_steps
+    # 判定锁存发生在第 4m+3 个半周期开始处（复位后第 2、4、6… 个 clk_div 上升沿）
+    first_latch = lfsr_jump_columns(3 * div_cnt)
+    next_latch = lfsr_jump_columns(4 * div_cnt)
+    lfsr = np.broadcast_to(np.asarray(lfsr_seed, dtype=np.uint16) & LFSR_MASK, (batch,)).copy()
+    if not lfsr.all():
+        print("[simulator] LFSR 初值不能为 0")
+        return None
+    lfsr = _lfsr_jump(first_latch, lfsr)
+
+    step_table = _STEP_TABLE
+    latch_table = _LATCH_TABLE
+    # 逐条回放的寄存器：judge_state | judged << 2，复位为 NO_NOTE / 0
+    state = np.full((batch, 2), NO_NOTE, dtype=np.uint16)
+    result = np.full((batch, 2), NO_NOTE, dtype=np.uint16)
+    accum = np.zeros(batch, dtype=np.int64)
+    windows = []
+
+    # 各条回放共享的寄存器（只取决于谱面与时钟相位）
+    cur = [0, 0]
+    cur_d1 = [0, 0]
+    cur_d2 = [0, 0]
+    count2 = count2_d1 = 0
+    clk_div_d1 = clk_div_d2 = 0
+    rom_words = [(int(down), int(up)) for down, up in rom]
+    left = right = (0, 0)
+    posedges = 0
+    shared_cache = {}
+    last_shared = None
+    settled = False
+    inputs = click_now = None
+    sample = 0
+
+    cycle = 0
+    for half in range(2 * n_ticks):
+        clk_div = half & 1
+        if clk_div:
+            # clk_div 上升沿：锁存判定（count2 为 1 时）、翻转 count2、Queue 移位、地址加一
+            if count2:
+                random_bit = (lfsr & 1)[:, None] << 3
+                result = latch_table[state | random_bit]
+                windows.append(result)
+                lfsr = _lfsr_jump(next_latch, lfsr)
+            count2 ^= 1
+            posedges += 1
+            # 第 k 个上升沿后 Queue bit0 为 ROM[k-16]，bit1 为 ROM[k-15]（地址在 4095 处停止）
+            left_addr = posedges - QUEUE_DEPTH
+            left = rom_words[min(left_addr, ROM_LEN - 1)] if left_addr >= 0 else (0, 0)
+            right = rom_words[min(left_addr + 1, ROM_LEN - 1)] if left_addr + 1 >= 0 else (0, 0)
+
+        for _ in range(sub_steps):
+            clk_div_posedge = clk_div and not clk_div_d2
+            count2_negedge = (not count2) and count2_d1
+            clear = clk_div_posedge and count2_negedge
+
+            key = (cur[0], cur[1], cur_d1[0] | cur_d2[0], cur_d1[1] | cur_d2[1], clk_div != count2, count2, clear)
+            shared = shared_cache.get(key)
+            if shared is None:
+                shared = np.array([
+                    (cur[track] << 5)
+                    | (int(key[2 + track] == 0) << 7)
+                    | (int(key[4]) << 8)
+                    | (count2 << 9)
+                    | (int(clear) << 10)
+                    for track in (0, 1)
+                ], dtype=np.uint16)
+                shared_cache[key] = shared
+
+            # 按键输入（含 2 级延迟的 click_prev2）只在采样切换后的第 0、2 个 clk 变化
+            offset = cycle % cycles_per_sample
+            if offset == 0:
+                sample = cycle // cycles_per_sample
+                click_now = click_rows[sample] << 3
+                inputs = click_now | ((click_rows[sample - 1] if sample else released) << 4)
+                input_changed = changed[sample]
+            elif offset == 2:
+                inputs = click_now | (click_rows[sample] << 4)
+                input_changed = changed[sample]
+            else:
+                input_changed = False
+
+            # 共享位与输入都未变且上一拍已是不动点时，所有回放的状态保持不变，跳过查表
+            if shared is not last_shared or input_changed or not settled:
+                next_state = step_table[state | inputs | shared]
+                settled = np.array_equal(next_state, state)
+                state = next_state
+                last_shared = shared
+
+            # Accumulator：accum_now = clk_div_posedge && count2 == 0，脉宽 2 个 clk
+            if clk_div_posedge and not count2:
+                accum = (accum + RESULT_SCORES[result].sum(axis=1)) % SCORE_MODULUS
+
+            # cur_note 在 count2 为 1 时取 left，上升沿插入 NOTHING，否则取 right
+            if count2 or (count2_negedge and not clk_div_posedge):
+                nxt = left
+            elif clk_div_posedge:
+                nxt = (0, 0)
+            else:
+                nxt = right
+            cur_d2, cur_d1, cur = cur_d1, cur, list(nxt)
+            count2_d1 = count2
+            clk_div_d2, clk_div_d1 = clk_div_d1, clk_div
+            cycle += 1
+
+    window_results = np.stack(windows, axis=1) if windows else np.zeros((batch, 0, 2), dtype=np.uint16)
+    return _summarize(chart, window_results, accum)
+
+
+# ==== 逐 clk 参考模型 ====
+def _reference_next_state(state, cur, quiet, judged, click, clk_div, count2):
+    """Judgement.v 的 FSM（next_state_up / next_state_down），逐分支照抄"""
+    tapish = cur in (TAP, HOLD_START)
+    if state == PERFECT:
+        if cur == 0 and quiet:
+            return NO_NOTE
+        if tapish and clk_div != count2 and not judged:
+            return GOOD
+        if cur == HOLD_MID and click == _NOT_PUSHED and count2 == 0:
+            return MISS
+        if judged:
+            return PERFECT
+        return NO_NOTE if cur == 0 else PERFECT
+    if state == GOOD:
+        if cur == 0 and quiet:
+            return NO_NOTE
+        if (clk_div == count2 and not judged) or cur == HOLD_MID:
+            return PERFECT
+        if judged:
+            return GOOD
+        return NO_NOTE if cur == 0 else GOOD
+    if state == MISS:
+        if cur == 0 and quiet:
+            return NO_NOTE
+        if tapish:
+            return GOOD
+        if cur == HOLD_MID and not judged:
+            return PERFECT
+        if judged:
+            return MISS
+        return NO_NOTE if cur == 0 else MISS
+    if tapish:
+        return GOOD
+    return PERFECT if cur == HOLD_MID else NO_NOTE
+
+
+def simulate_reference(chart: Chart, pressed: np.ndarray, samples_per_tick: int = 4, div_cnt: int = 24,
+                       lfsr_seed: int = LFSR_RESET) -> Optional[ReplayResult]:
+    """逐 clk 的参考模型：按 verilog/ 中 Clk_Div、Address_Generator、ROM、Queue、Judgement、LFSR、
+    ScoreConversion、Accumulator 的寄存器逐个翻译，每个 clk 全部求值一次，不做任何压缩或查表。
+
+    只处理一条回放（``pressed`` 为 (samples, 2)），速度很慢，用于校验 ``simulate_replays``。
+    ``pressed`` 视为 Debouncer 之后的按键电平；所有复位在第 0 个 clk 前同时释放。
+    每个 tick 为 2 * ``div_cnt`` 个 clk，须能被 ``samples_per_tick`` 整除。
+    """
+    if not validate_chart(chart):
+        return None
+    rom = build_rom_image(chart, ROM_LEN)
+    if rom is None:
+        return None
+    pressed = np.asarray(pressed, dtype=bool)
+    if pressed.ndim != 2 or pressed.shape[1] != 2 or (2 * div_cnt) % samples_per_tick:
+        print(f"[simulator] 参考模型参数无效: pressed={pressed.shape}, div_cnt={div_cnt}, "
+              f"samples_per_tick={samples_per_tick}")
+        return None
+    cycles_per_sample = 2 * div_cnt // samples_per_tick
+
+    # Clk_Div
+    cnt = 0
+    clk_div = 0
+    # Address_Generator / Queue（位置 0 为 bit0，即 left）/ Judgement 的 clk_div 域寄存器
+    offset = 0
+    queue = [0] * QUEUE_DEPTH
+    count2 = 0
+    result = [NO_NOTE, NO_NOTE]
+    # Judgement 的 clk 域寄存器，按轨道 [down, up]
+    judge_state = [NO_NOTE, NO_NOTE]
+    judged = [0, 0]
+    cur = [0, 0]
+    cur_d1 = [0, 0]
+    cur_d2 = [0, 0]
+    click_prev = [_NOT_PUSHED, _NOT_PUSHED]
+    click_prev2 = [_NOT_PUSHED, _NOT_PUSHED]
+    clk_div_d1 = clk_div_d2 = 0
+    count2_d1 = 0
+    lfsr = lfsr_seed & LFSR_MASK
+    accum = 0
+    windows = []
+
+    n_clk = 2 * replay_ticks(chart) * div_cnt
+    for cycle in range(n_clk):
+        sample = cycle // cycles_per_sample
+        click = [
+            _NOT_PUSHED ^ int(pressed[sample, track]) if sample < len(pressed) else _NOT_PUSHED
+            for track in (0, 1)
+        ]
+        left = (queue[0] & 0b11, queue[0] >> 2)
+        right = (queue[1] & 0b11, queue[1] >> 2)
+
+        # 组合逻辑（取本拍寄存器的旧值）
+        clk_div_posedge = clk_div and not clk_div_d2
+        count2_negedge = not count2 and count2_d1
+        accum_now = clk_div_posedge and count2 == 0
+
+        next_state = [0, 0]
+        next_judged = [0, 0]
+        next_cur = [0, 0]
+        for track in (0, 1):
+            quiet = cur_d1[track] == 0 and cur_d2[track] == 0
+            next_state[track] = _reference_next_state(
+                judge_state[track], cur[track], quiet, judged[track], click[track], clk_div, count2)
+
+            tapish = cur[track] in (TAP, HOLD_START)
+            if cur[track] == 0 and quiet:
+                next_judged[track] = 0
+            elif clk_div_posedge and count2_negedge:
+                next_judged[track] = 0
+            elif click_prev2[track] == _NOT_PUSHED and click[track] != _NOT_PUSHED and tapish:
+                next_judged[track] = 1
+            elif count2 == 1 and cur[track] == HOLD_MID:
+                next_judged[track] = 1
+            elif not judged[track] and cur[track] == HOLD_MID and click[track] == _NOT_PUSHED and count2 == 0:
+                next_judged[track] = 1
+            else:
+                next_judged[track] = judged[track]
+
+            if count2 == 1 or (count2_negedge and not clk_div_posedge):
+                next_cur[track] = left[track]
+            elif clk_div_posedge:
+                next_cur[track] = 0
+            else:
+                next_cur[track] = right[track]
+
+        # clk 上升沿：LFSR 为阻塞赋值，其余为非阻塞赋值
+        lfsr = _lfsr_step(lfsr)
+        if accum_now:
+            accum = (accum + int(RESULT_SCORES[result[0]] + RESULT_SCORES[result[1]])) % SCORE_MODULUS
+        click_prev2, click_prev = click_prev, click
+        count2_d1 = count2
+        cur_d2, cur_d1, cur = cur_d1, cur, next_cur
+        clk_div_d2, clk_div_d1 = clk_div_d1, clk_div
+        judge_state = next_state
+        judged = next_judged
+        clk_div_before = clk_div
+        if cnt >= div_cnt - 1:
+            clk_div ^= 1
+            cnt = 0
+        else:
+            cnt += 1
+
+        # clk_div 上升沿：看到的是本拍更新后的 clk 域寄存器
+        if clk_div and not clk_div_before:
+            if count2:
+                random_bit = lfsr & 1
+                for track in (0, 1):
+                    if judge_state[track] == GOOD and not judged[track]:
+                        result[track] = MISS
+                    elif judge_state[track] == PERFECT and random_bit:
+                        result[track] = GOOD
+                    else:
+                        result[track] = judge_state[track]
+                windows.append(list(result))
+            count2 ^= 1
+            queue = queue[1:] + [rom[offset]]
+            if offset != ROM_LEN - 1:
+                offset += 1
+
+    window_results = np.array(windows, dtype=np.uint16).reshape(1, len(windows), 2)
+    return _summarize(chart, window_results, np.array([accum], dtype=np.int64))
+
+
+def note_window(time_val: np.ndarray) -> np.ndarray:
+    """谱面 time 处的音符由第几个判定窗口锁存。
+
+    count2 与 Queue 同时复位，cur_note 只在 count2 为 0 时取 right、为 1 时取 left，
+    因此只有奇数 time 的音符会进入判定；偶数 time 所在窗口保持 NO_NOTE（与 RTL 行为一致）。
+    """
+    return (np.asarray(time_val) + QUEUE_DEPTH - 1) // 2
+
+
+def _summarize(chart: Chart, window_results: np.ndarray, accum: np.ndarray) -> ReplayResult:
+    times = np.frombuffer(chart.times, dtype=np.intc)
+    tracks = np.frombuffer(chart.tracks, dtype=np.int8).astype(np.intp)
+    note_results = window_results[:, note_window(times), tracks]
+
+    # 只统计谱面中有音符的 (窗口, 轨道)
+    occupied = np.zeros(window_results.shape[1:], dtype=bool)
+    occupied[note_window(times), tracks] = True
+    judged = window_results[:, occupied]
+    counts = np.stack([(judged == code).sum(axis=1) for code in (PERFECT, GOOD, MISS, NO_NOTE)], axis=1)
+
+    # Accumulator 为 BCD 编码，这里直接给出十进制读数
+    return ReplayResult(window_results, note_results, counts, accum)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="按模拟按键录制批量回放谱面并计分")
+    parser.add_argument("chart", help="曲目名（charts/<曲目名>/<曲目名>.txt）")
+    parser.add_argument("--replays", type=int, default=1000, help="合成的回放条数")
+    parser.add_argument("--sigma", type=float, default=0.3, help="按键时间偏移标准差（tick）")
+    parser.add_argument("--miss-rate", type=float, default=0.05, help="漏按概率")
+    parser.add_argument("--seed", type=int, default=None, help="合成按键录制的随机种子")
+    args = parser.parse_args(argv)
+
+    chart = load_chart(args.chart, tag="simulator")
+    if chart is None:
+        sys.exit(1)
+    pressed = synthesize_presses(chart, args.replays, timing_sigma=args.sigma,
+                                 miss_rate=args.miss_rate, seed=args.seed)
+    start = time.perf_counter()
+    replay = simulate_replays(chart, pressed)
+    elapsed = time.perf_counter() - start
+    if replay is None:
+        sys.exit(1)
+
+    mean_counts = replay.counts.mean(axis=0)
+    print(f"[simulator] {args.chart}: {args.replays} 条回放，用时 {elapsed:.2f}s "
+          f"({args.replays / elapsed:.0f} 条/秒)")
+    print(f"    平均 PERFECT {mean_counts[0]:.1f} / GOOD {mean_counts[1]:.1f} / MISS {mean_counts[2]:.1f} "
+          f"/ 未判定 {mean_counts[3]:.1f}")
+    print(f"    总分 均值 {replay.score.mean():.1f}，最高 {replay.score.max()}，最低 {replay.score.min()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,19 @@ const state = {
   charts: [],
   selectedChart: null,
   randomReady: false,
+  mockCharts: false,
 };
 
 const BASE_PATH = detectBasePath();
 const PROTOCOL_URL = `${BASE_PATH}chart_analysis/outputs/protocol.json`;
+// server 合并的目录接口：protocol + 全部 summary，一次请求（分页）
+const CATALOG_URL = `${BASE_PATH}chart_analysis/catalog`;
 const ANALYSIS_ENDPOINT = `${BASE_PATH}chart_analysis/run`;
+const ANALYSIS_JOBS_ENDPOINT = `${BASE_PATH}chart_analysis/jobs/`;
+// 分析事件流（SSE）：每个谱面完成时推送 summary、图片与版本号
+const ANALYSIS_EVENTS_ENDPOINT = `${BASE_PATH}chart_analysis/events`;
+// 长轮询单次等待秒数
+const ANALYSIS_POLL_WAIT = 15;
 let chartAnalysisPromise = null;
 
 // 假设谱面时间以 tick 计，当前按 4 tick = 1 拍 进行换算
@@ -90,14 +98,62 @@ function switchMode(mode) {
 async function runAnalysisAndLoadCharts() {
   if (els.normalStatus) els.normalStatus.textContent = "调用 chart_analysis 解析所有谱面...";
   console.log("[frontend] normal mode -> trigger chart_analysis");
+  // 先展示已有结果；分析期间按推送事件逐个更新
+  await loadCharts();
+  let unsubscribe = null;
   try {
-    await triggerAnalysisForAllCharts();
+    // 任务提交后从任务起点（events_since）订阅：连接建立前已完成的谱面由服务端历史补发
+    await triggerAnalysisForAllCharts((data) => {
+      if (!state.mockCharts && typeof data.events_since === "number") {
+        unsubscribe = subscribeAnalysisEvents(applyChartEvent, data.events_since);
+      }
+    });
+    // 对账：事件流可能断开、超出服务端历史或未订阅（合并到进行中的请求），任务结束后按目录重新加载一次
     await loadCharts();
-    if (els.normalStatus) els.normalStatus.textContent = "解析完成，正在加载谱面...";
   } catch (err) {
     console.error(err);
     if (els.normalStatus) els.normalStatus.textContent = "解析或加载失败，请检查后台服务。";
+  } finally {
+    if (unsubscribe) unsubscribe();
+  }
+}
+
+// 订阅分析事件流（since 之后的事件），返回取消订阅函数；浏览器不支持 EventSource 时返回 null
+function subscribeAnalysisEvents(onChart, since = null) {
+  if (typeof EventSource === "undefined") return null;
+  const query = since === null ? "" : `?since=${encodeURIComponent(since)}`;
+  const source = new EventSource(`${ANALYSIS_EVENTS_ENDPOINT}${query}`);
+  source.addEventListener("chart", (evt) => {
+    try {
+      onChart(JSON.parse(evt.data));
+    } catch (err) {
+      console.warn("invalid chart event", err);
+    }
+  });
+  return () => source.close();
+}
+
+function applyChartEvent(evt) {
+  if (!evt || !evt.chart || !evt.files || evt.chart === "Random") return;
+  const idx = state.charts.findIndex((c) => c.name === evt.chart);
+  const current = idx >= 0 ? state.charts[idx] : null;
+  // 版本号（谱面内容哈希）未变的谱面无需更新，图片 URL 不变，浏览器直接用缓存
+  if (current && current.version && current.version === evt.version) return;
+  const chart = toChart({ ...evt, name: evt.chart, folder: current ? current.folder : undefined });
+  if (idx >= 0) {
+    state.charts[idx] = chart;
+  } else {
+    state.charts.push(chart);
   }
+  renderTrackList(state.charts);
+  markSelectedCard();
+}
+
+// 重新渲染列表后恢复选中状态
+function markSelectedCard() {
+  if (!state.selectedChart || !els.trackList) return;
+  const card = els.trackList.querySelector(`.track-card[data-id="${CSS.escape(state.selectedChart.id)}"]`);
+  if (card) card.classList.add("selected");
 }
 
 async function loadCharts() {
@@ -107,6 +163,7 @@ async function loadCharts() {
     // 普通模式不显示 Random
     state.charts = charts.filter((c) => c.name !== "Random");
     renderTrackList(state.charts);
+    markSelectedCard();
     if (els.normalStatus) {
       els.normalStatus.textContent = charts.length ? "悬停预览，点击选中。" : "未找到谱面，请检查 charts 目录。";
     }
@@ -116,24 +173,62 @@ async function loadCharts() {
   }
 }
 
+async function fetchCatalog(names) {
+  const entries = [];
+  const filter = names ? `&names=${encodeURIComponent(names.join(","))}` : "";
+  let offset = 0;
+  while (typeof offset === "number") {
+    const res = await fetch(`${CATALOG_URL}?offset=${offset}${filter}`);
+    if (!res.ok) throw new Error(`catalog fetch failed: ${res.status}`);
+    const data = await res.json();
+    if (!Array.isArray(data.charts)) throw new Error("catalog missing charts array");
+    entries.push(...data.charts);
+    offset = data.next_offset;
+  }
+  return entries;
+}
+
+// 优先使用 server 的目录接口（含 summary，悬停时无需再逐个请求），静态托管时回退到 protocol.json
+async function fetchProtocolCharts(names) {
+  try {
+    return await fetchCatalog(names);
+  } catch (err) {
+    console.warn("catalog load failed, fallback to protocol.json", err);
+  }
+  const res = await fetch(PROTOCOL_URL);
+  if (!res.ok) throw new Error(`protocol fetch failed: ${res.status}`);
+  const protocol = await res.json();
+  if (!protocol.charts || !Array.isArray(protocol.charts)) throw new Error("protocol missing charts array");
+  return names ? protocol.charts.filter((c) => names.includes(c.name)) : protocol.charts;
+}
+
+// 协议 / 目录条目或推送事件 -> 前端谱面对象；有 version 时给图片 URL 加版本号
+function toChart(c) {
+  const suffix = c.version ? `?v=${encodeURIComponent(c.version)}` : "";
+  return {
+    id: c.name,
+    name: c.name,
+    bpm: c.bpm || "?",
+    duration: c.duration || "--:--",
+    folder: c.folder || `charts/${c.name}`,
+    version: c.version || null,
+    analysisImages: (c.files || []).map((f) => `${BASE_PATH}chart_analysis/outputs/${f}${suffix}`),
+    // 悬停预览用缩略图（几十 KB），点击缩略图再打开原图；旧的 protocol 没有缩略图时直接用原图
+    analysisThumbnails: (c.thumbnails || []).map((f) => `${BASE_PATH}chart_analysis/outputs/${f}${suffix}`),
+    analysisSummary: c.summary ? `${BASE_PATH}chart_analysis/outputs/${c.summary}` : null,
+    summaryData: c.stats || null,
+    audio: normalizeAudioPath(c),
+  };
+}
+
 async function fetchChartsFromBackend() {
   try {
-    const res = await fetch(PROTOCOL_URL);
-    if (!res.ok) throw new Error(`protocol fetch failed: ${res.status}`);
-    const protocol = await res.json();
-    if (!protocol.charts || !Array.isArray(protocol.charts)) throw new Error("protocol missing charts array");
-    return protocol.charts.map((c) => ({
-      id: c.name,
-      name: c.name,
-      bpm: c.bpm || "?",
-      duration: c.duration || "--:--",
-      folder: c.folder || `charts/${c.name}`,
-      analysisImages: (c.files || []).map((f) => `${BASE_PATH}chart_analysis/outputs/${f}`),
-      analysisSummary: c.summary ? `${BASE_PATH}chart_analysis/outputs/${c.summary}` : null,
-      audio: normalizeAudioPath(c),
-    }));
+    const entries = await fetchProtocolCharts();
+    state.mockCharts = false;
+    return entries.map(toChart);
   } catch (err) {
     console.warn("protocol load failed, fallback to mock", err);
+    state.mockCharts = true;
     return MOCK_CHARTS.map((c) => ({
       ...c,
       analysisImages: [`${BASE_PATH}chart_analysis/outputs/${c.name}_dummy.png`],
@@ -143,11 +238,12 @@ async function fetchChartsFromBackend() {
   }
 }
 
-function triggerAnalysisForAllCharts() {
-  return triggerChartAnalysisRun();
+function triggerAnalysisForAllCharts(onSubmitted) {
+  return triggerChartAnalysisRun(onSubmitted);
 }
 
-function triggerChartAnalysisRun() {
+// onSubmitted(data)：POST 返回（任务已创建）后、等待任务结束前调用；合并到进行中的请求时不调用
+function triggerChartAnalysisRun(onSubmitted = null) {
   if (chartAnalysisPromise) {
     return chartAnalysisPromise;
   }
@@ -165,7 +261,13 @@ function triggerChartAnalysisRun() {
       if (data.success !== true) {
         throw new Error(data.message || "chart_analysis 返回失败");
       }
-      console.log("[frontend] chart_analysis success", data.message || "");
+      if (onSubmitted) onSubmitted(data);
+      // 后端立即返回 job_id，后台运行；轮询直到任务结束
+      const job = data.job_id ? await waitForAnalysisJob(data.job_id, data.job) : data;
+      if (job.status === "failed") {
+        throw new Error(job.message || "chart_analysis 返回失败");
+      }
+      console.log("[frontend] chart_analysis success", job.message || "");
       if (els.normalStatus) {
         els.normalStatus.textContent = "chart_analysis 完成，准备加载协议文件...";
       }
@@ -186,6 +288,25 @@ function triggerChartAnalysisRun() {
   return chartAnalysisPromise;
 }
 
+async function waitForAnalysisJob(jobId, initial) {
+  let job = initial || null;
+  while (!job || (job.status !== "succeeded" && job.status !== "failed")) {
+    const since = job && typeof job.version === "number" ? job.version : -1;
+    const url = `${ANALYSIS_JOBS_ENDPOINT}${encodeURIComponent(jobId)}?since=${since}&wait=${ANALYSIS_POLL_WAIT}`;
+    const res = await fetch(url);
+    if (!res.ok) throw new Error(`chart_analysis job poll failed: ${res.status}`);
+    const data = await res.json();
+    job = data.job;
+    updateAnalysisProgress(job);
+  }
+  return job;
+}
+
+function updateAnalysisProgress(job) {
+  if (!els.normalStatus || !job || !job.total) return;
+  els.normalStatus.textContent = `chart_analysis 进行中：${job.completed}/${job.total} 个谱面`;
+}
+
 function renderTrackList(charts) {
   if (!els.trackList) return;
   els.trackList.innerHTML = "";
@@ -234,12 +355,12 @@ function renderTrackList(charts) {
 
 function handleHover(chart) {
   if (els.previewMeta) els.previewMeta.textContent = "谱面信息统计：";
-  renderPreviewImages(chart.analysisImages, els.previewImages);
-  renderSummary(chart.analysisSummary, els.previewData);
+  renderPreviewImages(chart.analysisImages, els.previewImages, chart.analysisThumbnails);
+  renderSummary(chart.analysisSummary, els.previewData, chart.summaryData);
   playPreviewAudio(chart);
 }
 
-function renderPreviewImages(images, target) {
+function renderPreviewImages(images, target, thumbnails = null) {
   if (!target) return;
   target.innerHTML = "";
   if (!images || !images.length) {
@@ -249,16 +370,27 @@ function renderPreviewImages(images, target) {
     target.appendChild(placeholder);
     return;
   }
-  images.forEach((src) => {
+  const useThumbnails = thumbnails && thumbnails.length === images.length;
+  images.forEach((src, idx) => {
     const img = document.createElement("img");
-    img.src = src;
+    img.src = useThumbnails ? thumbnails[idx] : src;
     img.alt = "chart analysis";
+    if (useThumbnails) {
+      img.title = "点击查看原图";
+      img.style.cursor = "zoom-in";
+      img.addEventListener("click", () => window.open(src, "_blank"));
+    }
     target.appendChild(img);
   });
 }
 
-async function renderSummary(summaryPath, target) {
+async function renderSummary(summaryPath, target, data = null) {
   if (!target) return;
+  if (data) {
+    // 目录接口已带回 summary，直接渲染
+    target.textContent = formatSummary(data);
+    return;
+  }
   if (!summaryPath) {
     target.textContent = "等待 chart_analysis 输出 summary JSON";
     return;
@@ -393,12 +525,23 @@ async function applyNormalSelection() {
   }
 }
 
-async function runChartEngine(chartName) {
-  const url = `${BASE_PATH}chart_engine/process?name=${encodeURIComponent(chartName)}`;
+async function runChartEngine(chartName, output = "ROM.v", leaveBank = false) {
+  const url = `${BASE_PATH}chart_engine/process`;
   try {
-    const res = await fetch(url, { method: "POST" });
-    if (!res.ok) throw new Error(`process failed: ${res.status}`);
+    const res = await fetch(url, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ name: chartName, output, leave_bank: leaveBank }),
+    });
     const data = await res.json().catch(() => ({}));
+    if (res.status === 409 && data.banked && !leaveBank) {
+      // 硬件当前为多谱面 bank 模式：写入单个谱面会覆盖打包的曲目表，须用户确认
+      if (!window.confirm("MuseDash.v 当前为多谱面 bank 模式，写入该谱面将覆盖打包的曲目表，是否继续？")) {
+        return false;
+      }
+      return runChartEngine(chartName, output, true);
+    }
+    if (!res.ok) throw new Error(data.message || `process failed: ${res.status}`);
     return data.success === true;
   } catch (err) {
     console.warn("runChartEngine failed", err);
@@ -432,6 +575,10 @@ function generateRandomChart() {
   if (els.randomData) els.randomData.textContent = "等待 chart_analysis 输出 summary JSON";
   (async () => {
     const ok = await runGenerateRandom();
+    if (ok) {
+      // 新谱面需要重新分析后才能预览
+      await triggerChartAnalysisRun().catch(() => false);
+    }
     state.randomReady = true;
     if (els.btnStartRandom) els.btnStartRandom.disabled = false;
     if (els.randomStatus) els.randomStatus.textContent = ok ? "生成完成，点击开始或重新生成。" : "生成失败，仍可尝试开始或重试生成。";
@@ -445,13 +592,20 @@ function startRandomBuild() {
     showToast("请先生成 Random 谱面");
     return;
   }
-  showToast("Random 模式：已请求写入并启动");
+  (async () => {
+    const ok = await runChartEngine("Random");
+    showToast(ok ? "Random 模式：已写入 BPM & ROM" : "Random 模式：写入失败");
+  })();
 }
 
 async function runGenerateRandom() {
   const url = `${BASE_PATH}chart_engine/generate_random`;
   try {
-    const res = await fetch(url, { method: "POST" });
+    const res = await fetch(url, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ name: "Random", bpm: 120, length: 200 }),
+    });
     if (!res.ok) throw new Error(`generate_random failed: ${res.status}`);
     const data = await res.json().catch(() => ({}));
     return data.success === true;
@@ -463,13 +617,12 @@ async function runGenerateRandom() {
 
 async function loadRandomPreview() {
   try {
-    const res = await fetch(PROTOCOL_URL);
-    if (!res.ok) throw new Error(`protocol fetch failed: ${res.status}`);
-    const protocol = await res.json();
-    const entry = protocol.charts?.find((c) => c.name === "Random");
+    const [entry] = await fetchProtocolCharts(["Random"]);
     if (!entry) throw new Error("no Random entry in protocol");
-    renderPreviewImages((entry.files || []).map((f) => `${BASE_PATH}chart_analysis/outputs/${f}`), els.randomPreview);
-    renderSummary(entry.summary ? `${BASE_PATH}chart_analysis/outputs/${entry.summary}` : null, els.randomData);
+    const outputs = (files) => (files || []).map((f) => `${BASE_PATH}chart_analysis/outputs/${f}`);
+    renderPreviewImages(outputs(entry.files), els.randomPreview, outputs(entry.thumbnails));
+    renderSummary(entry.summary ? `${BASE_PATH}chart_analysis/outputs/${entry.summary}` : null, els.randomData,
+      entry.stats || null);
     return;
   } catch (err) {
     console.warn("loadRandomPreview failed", err);
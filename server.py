@@ -2,20 +2,89 @@
 """Lightweight dev server for the MuseDash frontend with basic API hooks."""
 
 import argparse
+import asyncio
+import atexit
+import contextlib
+import datetime
+import email.utils
+import gzip
+import hashlib
+import http.client
+import importlib
+import io
 import json
+import multiprocessing
 import os
+import queue
+import re
 import subprocess
 import sys
+import time
 import urllib.parse
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from threading import Lock
+from threading import BoundedSemaphore, Condition, Event, Lock, Thread
 
 ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT))
+from chart_engine import instrument  # noqa: E402
+from chart_engine.chart_engine import generate_random_chart, musedash_banked, process_chart  # noqa: E402
+
+CHARTS_DIR = ROOT / "charts"
+# the chart the random mode regenerates; other existing charts need "overwrite": true
+RANDOM_CHART = "Random"
 QUARTUS_QSF = ROOT / "quartus" / "MuseDash.qsf"
 CHART_ANALYSIS_SCRIPT = ROOT / "chart_analysis" / "chart_analysis.py"
-ANALYSIS_LOCK = Lock()
+ANALYSIS_OUTPUT_DIR = ROOT / "chart_analysis" / "outputs"
+# chart_analysis.py --progress-json 输出的进度行前缀
+PROGRESS_PREFIX = "PROGRESS "
+TRACE_PREFIX = "TRACE "
+JOBS_PATH = "/chart_analysis/jobs/"
+METRICS_PATH = "/metrics"
+CATALOG_PATH = "/chart_analysis/catalog"
+EVENTS_PATH = "/chart_analysis/events"
+# SSE comment sent when no event arrived for this long, so proxies and clients keep the stream open
+SSE_HEARTBEAT = 15.0
+EVENT_HISTORY = 500
+CATALOG_DEFAULT_LIMIT = 500
+CATALOG_MAX_LIMIT = 2000
+# static files: compress text-like types above this size, keep at most this much gzip output cached
+GZIP_MIN_BYTES = 1024
+GZIP_MAX_FILE_BYTES = 8 << 20
+GZIP_CACHE_BYTES = 64 << 20
+GZIP_TYPES = {"application/json", "application/javascript", "image/svg+xml", "application/xml"}
+# audio rarely changes and is large; everything else (analysis output, frontend) is revalidated via ETag
+LONG_CACHE_SUFFIXES = {".mp3", ".ogg", ".wav"}
+LONG_CACHE_CONTROL = "public, max-age=86400"
+DEFAULT_CACHE_CONTROL = "no-cache"
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+API_ROUTES = {
+    METRICS_PATH,
+    CATALOG_PATH,
+    EVENTS_PATH,
+    "/quartus/open",
+    "/chart_engine/process",
+    "/chart_engine/generate_random",
+    "/chart_analysis/run",
+}
+# 长轮询单次最多等待的秒数
+MAX_POLL_WAIT = 30.0
+# --server-mode asyncio: connection limit, keep-alive idle timeout and executor threads for handlers
+DEFAULT_MAX_CONNECTIONS = 256
+DEFAULT_KEEP_ALIVE = 15.0
+DEFAULT_HTTP_WORKERS = 16
+# a connection over the limit waits this long for a slot before it is answered with 503
+CONNECTION_WAIT = 10.0
+# time allowed for the request head/body to arrive and for a slow client to drain a response
+REQUEST_TIMEOUT = 30.0
+SEND_TIMEOUT = 60.0
+REQUEST_HEAD_LIMIT = 64 << 10
+MAX_REQUEST_BODY = 1 << 20
 
 
 def _open_with_system(path: Path):
@@ -34,17 +103,802 @@ def _open_with_system(path: Path):
         return False, str(exc)
 
 
+class EngineBusy(Exception):
+    """Raised when the chart_engine pool already has too many queued tasks."""
+
+
+class ChartEngineService:
+    """Bounded thread pool for chart_engine work with per-chart locking.
+
+    Tasks for different charts run in parallel; tasks that touch the same
+    chart (or the same ROM output file) are serialized.
+    """
+
+    def __init__(self, workers=4, max_pending=32):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chart-engine")
+        self._slots = BoundedSemaphore(max_pending)
+        self._locks = {}
+        self._locks_guard = Lock()
+
+    def _lock_for(self, key):
+        with self._locks_guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = Lock()
+            return lock
+
+    def run(self, keys, func, *args, **kwargs):
+        """Run func on the pool while holding the locks for ``keys``; blocks until done."""
+        if not self._slots.acquire(blocking=False):
+            raise EngineBusy("chart_engine is busy, try again later")
+        try:
+            return self._pool.submit(self._locked_call, sorted(set(keys)), func, args, kwargs).result()
+        finally:
+            self._slots.release()
+
+    def _locked_call(self, keys, func, args, kwargs):
+        # sorted acquisition order keeps overlapping key sets deadlock-free
+        locks = [self._lock_for(key) for key in keys]
+        for lock in locks:
+            lock.acquire()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+
+ENGINE = ChartEngineService()
+# shared by every request that switches the hardware to a chart: MuseDash.v, Address_Generator.v
+# and ROM.v are one configuration, so those requests run one at a time
+HARDWARE_KEY = "hardware"
+
+
+def _safe_name(value, suffix=None):
+    """Accept plain file/folder names only (no path separators or parent refs)."""
+    if not isinstance(value, str) or not value or value in (".", ".."):
+        return None
+    if "/" in value or "\\" in value or value != value.strip():
+        return None
+    if suffix is not None and not value.endswith(suffix):
+        return None
+    return value
+
+
+def _int_param(params, key, default=None):
+    """Integer parameter from a JSON body or query string; rejects floats like 127.5 and bools."""
+    value = params.get(key, default)
+    if value is None or value == "":
+        return default
+    if isinstance(value, bool):
+        raise ValueError(f"{key} must be an integer")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and re.fullmatch(r"[+-]?\d+", value.strip()):
+        return int(value)
+    raise ValueError(f"{key} must be an integer, got {value!r}")
+
+
+def _bool_param(params, key, default=False):
+    """Boolean parameter: JSON true/false, or true/false/1/0 in a query string."""
+    value = params.get(key, default)
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ("true", "1", "false", "0"):
+        return value.strip().lower() in ("true", "1")
+    raise ValueError(f"{key} must be true or false")
+
+
+BANK_MODE_MESSAGE = ("MuseDash.v is in bank mode (BANKED = 1); processing a single chart replaces the packed "
+                     "setlist, send \"leave_bank\": true to do so")
+
+
+def _engine_process(name, output, leave_bank=False):
+    banked = musedash_banked()
+    ok = process_chart(name, output_filename=output, leave_bank=leave_bank)
+    if not ok:
+        if banked and not leave_bank:
+            return False, BANK_MODE_MESSAGE
+        return False, f"process_chart failed for {name} (see server log)"
+    if banked:
+        return True, f"processed {name} -> verilog/{output}; left bank mode (packed setlist replaced)"
+    return True, f"processed {name} -> verilog/{output}"
+
+
+def _engine_generate(name, bpm, length, seed, output, leave_bank=False):
+    path = generate_random_chart(CHARTS_DIR / name, name=name, bpm=bpm, length_seconds=length, seed=seed)
+    if path is None:
+        return False, f"generate_random_chart failed for {name} (see server log)"
+    if output is None:
+        return True, f"generated {path.relative_to(ROOT).as_posix()}"
+    ok, message = _engine_process(name, output, leave_bank)
+    return ok, f"generated {path.relative_to(ROOT).as_posix()}; {message}"
+
+
+class AnalysisJob:
+    """One chart_analysis run, with per-chart progress for polling clients."""
+
+    def __init__(self, events_since=0):
+        self.id = uuid.uuid4().hex[:12]
+        # event bus id before this job's first event: ?since=<events_since> replays the whole job
+        self.events_since = events_since
+        self.status = "queued"  # queued -> running -> succeeded / failed
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.charts = OrderedDict()  # chart name -> pending / ok / skipped / failed
+        self.success = None
+        self.message = ""
+        self.log = deque(maxlen=200)  # tail of the script output
+        self.merged_requests = 0
+        self.active_spans = OrderedDict()  # span id -> "name chart=..." while it runs
+        # bumped on every change so long-polling clients can wait for news
+        self.version = 0
+
+    @property
+    def done(self):
+        return self.status in ("succeeded", "failed")
+
+    def to_dict(self):
+        completed = sum(1 for state in self.charts.values() if state != "pending")
+        return {
+            "id": self.id,
+            "status": self.status,
+            "version": self.version,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+            "total": len(self.charts),
+            "completed": completed,
+            "charts": dict(self.charts),
+            "success": self.success,
+            "message": self.message,
+            "merged_requests": self.merged_requests,
+            "events_since": self.events_since,
+            # innermost running span: where a slow run currently is
+            "stage": next(reversed(self.active_spans.values()), None),
+        }
+
+
+class AnalysisJobManager:
+    """Runs chart_analysis in the background, one job at a time.
+
+    Requests that arrive while a job is queued or running join that job
+    instead of being rejected, so every caller gets the same job id.
+    """
+
+    def __init__(self, runner, history=20, on_finished=None, events=None):
+        # runner(on_progress, on_output, on_trace) -> (success, message)
+        self.runner = runner
+        # on_finished(job) runs after every job, before waiters are released
+        self.on_finished = on_finished
+        # AnalysisEventBus receiving job state changes and per-chart results
+        self.events = events
+        self._cond = Condition()
+        self._jobs = OrderedDict()
+        self._current = None
+        self._history = history
+        # callables invoked (without arguments, with the lock held: they must not block) on every job change
+        self._listeners = []
+
+    def submit(self):
+        """Return (job, merged): the in-flight job, or a newly started one."""
+        with self._cond:
+            if self._current is not None and not self._current.done:
+                self._current.merged_requests += 1
+                self._touch(self._current)
+                return self._current, True
+            job = AnalysisJob(self.events.last_id if self.events is not None else 0)
+            self._current = job
+            self._jobs[job.id] = job
+            while len(self._jobs) > self._history:
+                self._jobs.popitem(last=False)
+        Thread(target=self._run, args=(job,), name=f"analysis-{job.id}", daemon=True).start()
+        return job, False
+
+    def get(self, job_id):
+        with self._cond:
+            return self._jobs.get(job_id)
+
+    def snapshot(self, job):
+        with self._cond:
+            return job.to_dict()
+
+    def add_listener(self, listener):
+        with self._cond:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        with self._cond:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _touch(self, job):
+        job.version += 1
+        self._cond.notify_all()
+        for listener in self._listeners:
+            listener()
+
+    def _update(self, job, **changes):
+        with self._cond:
+            for key, value in changes.items():
+                setattr(job, key, value)
+            self._touch(job)
+
+    def _on_progress(self, job, event):
+        with self._cond:
+            kind = event.get("event")
+            if kind == "start":
+                job.charts = OrderedDict((name, "pending") for name in event.get("charts", []))
+            elif kind == "chart":
+                job.charts[event.get("chart")] = event.get("status")
+            self._touch(job)
+        if kind == "chart" and self.events is not None:
+            self.events.publish("chart", _chart_event(job, event))
+
+    def _on_trace(self, job, record):
+        # no version bump: spans change too often to wake long-polling clients for each one
+        with self._cond:
+            if record["kind"] == "span_start":
+                label = " ".join([record["name"]] + [f"{k}={v}" for k, v in record["fields"].items()])
+                job.active_spans[record["id"]] = label
+            elif record["kind"] == "span_end":
+                job.active_spans.pop(record["id"], None)
+
+    def _publish_job(self, job):
+        if self.events is not None:
+            self.events.publish("job", {key: value for key, value in job.to_dict().items() if key != "charts"})
+
+    def _run(self, job):
+        self._update(job, status="running", started=time.time())
+        self._publish_job(job)
+        try:
+            success, message = self.runner(
+                on_progress=lambda event: self._on_progress(job, event),
+                on_output=job.log.append,
+                on_trace=lambda record: self._on_trace(job, record),
+            )
+        except Exception as exc:  # pragma: no cover - keep the job manager alive
+            success, message = False, f"chart_analysis failed: {exc}"
+        if self.on_finished is not None:
+            try:
+                self.on_finished(job)
+            except Exception as exc:  # pragma: no cover - never leave a job running
+                print(f"[server] post-analysis hook failed: {exc}")
+        self._update(
+            job,
+            status="succeeded" if success else "failed",
+            success=success,
+            message=message,
+            finished=time.time(),
+            active_spans=OrderedDict(),
+        )
+        self._publish_job(job)
+
+
+def _chart_event(job, event):
+    """Per-chart push payload: status, image URLs with a content version, and the summary itself."""
+    data = {key: event.get(key) for key in ("chart", "status", "index", "total")}
+    data["job"] = job.id
+    files = event.get("files")
+    if files is None:
+        return data
+    version = event.get("version") or ""
+    suffix = f"?v={version}" if version else ""
+    data.update(
+        version=version,
+        bpm=event.get("bpm"),
+        duration=event.get("duration"),
+        files=files,
+        thumbnails=event.get("thumbnails") or [],
+        summary=event.get("summary"),
+        images=[f"/chart_analysis/outputs/{name}{suffix}" for name in files],
+        thumbnail_images=[f"/chart_analysis/outputs/{name}{suffix}" for name in event.get("thumbnails") or []],
+        stats=None,
+    )
+    if event.get("summary"):
+        try:
+            with open(ANALYSIS_OUTPUT_DIR / event["summary"], "r", encoding="utf-8") as handle:
+                data["stats"] = json.load(handle)
+        except (OSError, ValueError):
+            pass
+    return data
+
+
+def _events_cursor(query, headers):
+    """(last_id, wait) for an events request; raises ValueError on malformed values.
+
+    Last-Event-ID wins over ``since``: an EventSource reconnecting to a ``?since=`` URL
+    resumes after the last event it saw instead of replaying from the start again.
+    """
+    last_id = headers.get("Last-Event-ID") or query.get("since", [""])[0]
+    last_id = int(last_id) if last_id not in ("", None) else ANALYSIS_EVENTS.last_id
+    wait = float(query.get("wait", ["0"])[0] or 0)
+    return last_id, wait
+
+
+def _sse_frame(seq, kind, data):
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"id: {seq}\nevent: {kind}\ndata: {payload}\n\n".encode("utf-8")
+
+
+class AnalysisEventBus:
+    """Numbered analysis events kept in a bounded history for SSE and long-poll clients."""
+
+    def __init__(self, history=EVENT_HISTORY):
+        self._cond = Condition()
+        self._events = deque(maxlen=history)
+        self._seq = 0
+        # callables invoked (without arguments, outside the lock) after every publish
+        self._listeners = []
+
+    @property
+    def last_id(self):
+        with self._cond:
+            return self._seq
+
+    def publish(self, kind, data):
+        with self._cond:
+            self._seq += 1
+            self._events.append((self._seq, kind, data))
+            self._cond.notify_all()
+            listeners = list(self._listeners)
+        instrument.count("server.analysis_events", kind=kind)
+        for listener in listeners:
+            listener()
+
+    def add_listener(self, listener):
+        with self._cond:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        with self._cond:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def since(self, last_id, wait=0.0):
+        """Events numbered after ``last_id``, waiting up to ``wait`` seconds if there are none yet."""
+        deadline = time.monotonic() + max(0.0, wait)
+        with self._cond:
+            if last_id > self._seq:
+                # id from before a server restart: replay what we still have
+                last_id = 0
+            while True:
+                events = [item for item in self._events if item[0] > last_id]
+                remaining = deadline - time.monotonic()
+                if events or remaining <= 0:
+                    return events
+                self._cond.wait(remaining)
+
+
+class AnalysisCatalog:
+    """In-memory index of protocol.json joined with every chart's summary JSON.
+
+    Rebuilt after each analysis job, and lazily whenever protocol.json changes on
+    disk (e.g. after a command-line run), so a catalog request never reads files
+    for charts that have not changed.
+    """
+
+    def __init__(self, output_dir):
+        self.output_dir = Path(output_dir)
+        self._lock = Lock()
+        self._stamp = None  # protocol.json (mtime_ns, size) the index was built from
+        self._charts = []
+        self._by_name = {}
+        self.version = 0
+        self.built = None
+
+    def _protocol_stamp(self):
+        try:
+            stat = (self.output_dir / "protocol.json").stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_json(self, path):
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+    def refresh(self):
+        """Re-read protocol.json and the summaries whose files changed since the last build."""
+        with self._lock:
+            stamp = self._protocol_stamp()
+            protocol = self._read_json(self.output_dir / "protocol.json") if stamp is not None else None
+            if stamp is not None and not isinstance(protocol, dict):
+                # Unreadable protocol.json: keep serving the last good index and retry next request.
+                return
+            charts = []
+            stamps = {}
+            for entry in (protocol or {}).get("charts", []):
+                if not isinstance(entry, dict) or "name" not in entry:
+                    continue
+                entry = dict(entry)
+                stats = None
+                summary = entry.get("summary")
+                if summary:
+                    summary_path = self.output_dir / summary
+                    try:
+                        summary_stat = summary_path.stat()
+                        summary_stamp = (summary_stat.st_mtime_ns, summary_stat.st_size)
+                    except OSError:
+                        summary_stamp = None
+                    previous = self._by_name.get(entry["name"])
+                    if previous is not None and summary_stamp is not None and previous[0] == summary_stamp:
+                        stats = previous[1]["stats"]
+                    elif summary_stamp is not None:
+                        stats = self._read_json(summary_path)
+                    if stats is not None:
+                        # Only remember stamps of summaries that parsed, so a bad one is re-read.
+                        stamps[entry["name"]] = summary_stamp
+                entry["stats"] = stats
+                charts.append(entry)
+            self._by_name = {entry["name"]: (stamps.get(entry["name"]), entry) for entry in charts}
+            self._charts = charts
+            self._stamp = stamp
+            self.version += 1
+            self.built = time.time()
+        instrument.count("server.catalog_refreshes")
+
+    def _ensure_current(self):
+        if self.built is None or self._protocol_stamp() != self._stamp:
+            self.refresh()
+
+    def page(self, offset=0, limit=CATALOG_DEFAULT_LIMIT, fields=None, names=None):
+        """One page of the catalog; ``fields`` keeps only those keys (``name`` is always kept)."""
+        self._ensure_current()
+        with self._lock:
+            charts = self._charts
+            if names is not None:
+                charts = [entry for entry in charts if entry["name"] in names]
+            total = len(charts)
+            selected = charts[offset:offset + limit]
+            if fields is not None:
+                keep = set(fields) | {"name"}
+                selected = [{key: value for key, value in entry.items() if key in keep} for entry in selected]
+            else:
+                selected = list(selected)
+            next_offset = offset + limit if offset + limit < total else None
+            return {
+                "version": self.version,
+                "built": self.built,
+                "total": total,
+                "offset": offset,
+                "limit": limit,
+                "next_offset": next_offset,
+                "charts": selected,
+            }
+
+
+class _StaticEntry:
+    __slots__ = ("stamp", "etag", "gzip")
+
+    def __init__(self, stamp, etag):
+        self.stamp = stamp
+        self.etag = etag
+        self.gzip = None
+
+
+class StaticFileCache:
+    """Content-hash ETags and gzip bodies for static files, keyed by path.
+
+    An entry stays valid while the file's (mtime_ns, size) is unchanged, so a
+    file is hashed and compressed once per change rather than once per request.
+    Compressed bodies are kept in LRU order up to ``max_gzip_bytes``.
+    """
+
+    def __init__(self, max_gzip_bytes=GZIP_CACHE_BYTES):
+        self.max_gzip_bytes = max_gzip_bytes
+        self._lock = Lock()
+        self._entries = OrderedDict()
+        self._gzip_bytes = 0
+
+    @staticmethod
+    def _hash_file(path):
+        digest = hashlib.sha256()
+        with open(path, "rb") as handle:
+            for block in iter(partial(handle.read, 1 << 20), b""):
+                digest.update(block)
+        return f'"{digest.hexdigest()[:32]}"'
+
+    def lookup(self, path, stat):
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.stamp == stamp:
+                self._entries.move_to_end(path)
+                return entry
+        entry = _StaticEntry(stamp, self._hash_file(path))
+        with self._lock:
+            self._drop(path)
+            self._entries[path] = entry
+        return entry
+
+    def gzip_body(self, path, entry):
+        """gzip bytes for ``entry`` (compressed on first use)."""
+        with self._lock:
+            if entry.gzip is not None:
+                self._entries.move_to_end(path)
+                return entry.gzip
+        with open(path, "rb") as handle:
+            body = gzip.compress(handle.read(), compresslevel=6, mtime=0)
+        with self._lock:
+            if self._entries.get(path) is entry and entry.gzip is None:
+                entry.gzip = body
+                self._gzip_bytes += len(body)
+                while self._gzip_bytes > self.max_gzip_bytes and len(self._entries) > 1:
+                    oldest = next(iter(self._entries))
+                    if oldest == path:
+                        break
+                    self._drop(oldest)
+        return body
+
+    def _drop(self, path):
+        entry = self._entries.pop(path, None)
+        if entry is not None and entry.gzip is not None:
+            self._gzip_bytes -= len(entry.gzip)
+
+
+class _RangeReader(io.RawIOBase):
+    """File object limited to ``length`` bytes from ``start``, for copyfile()."""
+
+    def __init__(self, handle, start, length):
+        self._handle = handle
+        self._remaining = length
+        handle.seek(start)
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        if self._remaining <= 0:
+            return b""
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._handle.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def close(self):
+        self._handle.close()
+        super().close()
+
+
+def _parse_range(header, size):
+    """(start, end) inclusive for a single ``bytes=`` range, None to ignore it, or "unsatisfiable"."""
+    match = _RANGE_PATTERN.match(header.strip())
+    if match is None:
+        # multiple ranges or another unit: serve the whole file
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        suffix = int(last)
+        if suffix == 0:
+            return "unsatisfiable"
+        return max(0, size - suffix), size - 1
+    start = int(first)
+    if start >= size:
+        return "unsatisfiable"
+    end = int(last) if last else size - 1
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+STATIC_FILES = StaticFileCache()
+
+
+class _QueueWriter(io.TextIOBase):
+    """stdout replacement inside the worker: forwards each printed line to the server."""
+
+    def __init__(self, events):
+        self._events = events
+        self._buffer = ""
+        self.lines = []
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        self._buffer += text
+        while "\n" in self._buffer:
+            line, self._buffer = self._buffer.split("\n", 1)
+            self._emit(line)
+        return len(text)
+
+    def flush(self):
+        if self._buffer:
+            self._emit(self._buffer)
+            self._buffer = ""
+
+    def _emit(self, line):
+        self.lines.append(line)
+        self._events.put(("output", line))
+
+
+def _analysis_worker_main(requests, events):
+    """Entry point of the analysis worker process: import chart_analysis once, then serve runs."""
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    chart_analysis = importlib.import_module("chart_analysis.chart_analysis")
+    # chart_analysis imports matplotlib lazily; load it now so the first run is warm too
+    chart_analysis.load_plotting()
+    # forward spans and counters so the server's /metrics covers the analysis runs
+    instrument.add_listener(lambda record: events.put(("trace", record)))
+    parent = multiprocessing.parent_process()
+    while True:
+        try:
+            request = requests.get(timeout=1.0)
+        except queue.Empty:
+            # exit with the server even if it was killed without calling stop()
+            if parent is not None and not parent.is_alive():
+                break
+            continue
+        if request is None:
+            break
+        writer = _QueueWriter(events)
+        try:
+            with contextlib.redirect_stdout(writer):
+                chart_analysis.run_analysis(
+                    jobs=request.get("jobs", 1),
+                    force=request.get("force", False),
+                    progress=lambda event: events.put(("progress", event)),
+                )
+            writer.flush()
+            output = "\n".join(writer.lines).strip()
+            events.put(("result", True, output or "chart_analysis finished"))
+        except Exception as exc:
+            writer.flush()
+            events.put(("result", False, f"chart_analysis failed: {exc}"))
+
+
+class AnalysisWorker:
+    """Warm, long-lived child process that runs chart_analysis on request.
+
+    matplotlib/numpy and the figure templates are loaded once per worker
+    instead of once per request. If the worker dies, the current run fails
+    and the next run starts a fresh one; the HTTP server is unaffected.
+    """
+
+    def __init__(self, jobs=1):
+        self.jobs = jobs
+        self._ctx = multiprocessing.get_context("spawn")
+        self._lock = Lock()
+        self._proc = None
+        self._requests = None
+        self._events = None
+
+    def start(self):
+        with self._lock:
+            self._ensure_started()
+
+    def stop(self):
+        with self._lock:
+            if self._proc is not None and self._proc.is_alive():
+                self._requests.put(None)
+                self._proc.join(timeout=5)
+                if self._proc.is_alive():
+                    self._proc.terminate()
+            self._proc = None
+
+    def _ensure_started(self):
+        if self._proc is not None and self._proc.is_alive():
+            return
+        self._requests = self._ctx.Queue()
+        self._events = self._ctx.Queue()
+        # not a daemon: the worker may start its own process pool for --analysis-jobs > 1
+        self._proc = self._ctx.Process(
+            target=_analysis_worker_main,
+            args=(self._requests, self._events),
+            name="chart-analysis-worker",
+        )
+        self._proc.start()
+        print(f"[server] analysis worker started (pid {self._proc.pid})")
+
+    def run(self, on_progress=None, on_output=None, on_trace=None, force=False):
+        with self._lock:
+            self._ensure_started()
+            self._requests.put({"jobs": self.jobs, "force": force})
+            while True:
+                try:
+                    message = self._events.get(timeout=1.0)
+                except queue.Empty:
+                    if not self._proc.is_alive():
+                        code = self._proc.exitcode
+                        self._proc = None
+                        print(f"[server] analysis worker exited unexpectedly (code {code})")
+                        return False, f"analysis worker exited unexpectedly (code {code})"
+                    continue
+                kind = message[0]
+                if kind == "progress" and on_progress is not None:
+                    on_progress(message[1])
+                elif kind == "output" and on_output is not None:
+                    on_output(message[1])
+                elif kind == "trace":
+                    instrument.ingest(message[1])
+                    if on_trace is not None:
+                        on_trace(message[1])
+                elif kind == "result":
+                    return message[1], message[2]
+
+
+ANALYSIS_WORKER = AnalysisWorker()
+CATALOG = AnalysisCatalog(ANALYSIS_OUTPUT_DIR)
+ANALYSIS_EVENTS = AnalysisEventBus()
+ANALYSIS_JOBS = AnalysisJobManager(ANALYSIS_WORKER.run, on_finished=lambda job: CATALOG.refresh(),
+                                   events=ANALYSIS_EVENTS)
+
+
+@contextlib.contextmanager
+def _analysis_wakeups(listener):
+    """Call ``listener()`` (no arguments, must not block) on every analysis event and job change."""
+    ANALYSIS_EVENTS.add_listener(listener)
+    ANALYSIS_JOBS.add_listener(listener)
+    try:
+        yield
+    finally:
+        ANALYSIS_JOBS.remove_listener(listener)
+        ANALYSIS_EVENTS.remove_listener(listener)
+
+
+def _route(path):
+    """Metric label for a request path: the API endpoint, or "static" for files."""
+    if path.startswith(JOBS_PATH):
+        return JOBS_PATH
+    return path if path in API_ROUTES else "static"
+
+
 class FrontendHandler(SimpleHTTPRequestHandler):
+    def do_GET(self):
+        with self._request_span("GET"):
+            self._dispatch_get()
+
     def do_POST(self):
+        with self._request_span("POST"):
+            self._dispatch_post()
+
+    @contextlib.contextmanager
+    def _request_span(self, method):
+        path = urllib.parse.urlparse(self.path).path
+        route = _route(path)
+        instrument.count("server.requests", method=method, route=route)
+        with instrument.span(f"server.request {method} {route}", path=path):
+            yield
+
+    def log_request(self, code="-", size="-"):
+        instrument.count("server.responses", status=getattr(code, "value", code))
+        super().log_request(code, size)
+
+    def _dispatch_get(self):
+        parsed = urllib.parse.urlparse(self.path)
+        if parsed.path.startswith(JOBS_PATH):
+            self._handle_chart_analysis_job(parsed)
+            return
+        if parsed.path == METRICS_PATH:
+            self._handle_metrics(parsed)
+            return
+        if parsed.path == CATALOG_PATH:
+            self._handle_chart_analysis_catalog(parsed)
+            return
+        if parsed.path == EVENTS_PATH:
+            self._handle_chart_analysis_events(parsed)
+            return
+        super().do_GET()
+
+    def _dispatch_post(self):
         parsed = urllib.parse.urlparse(self.path)
         if parsed.path == "/quartus/open":
             self._handle_open_quartus()
             return
         if parsed.path == "/chart_engine/process":
-            self._respond_json({"success": True, "message": "process stub"})
+            self._handle_chart_engine_process()
             return
         if parsed.path == "/chart_engine/generate_random":
-            self._respond_json({"success": True, "message": "generate_random stub"})
+            self._handle_chart_engine_generate()
             return
         if parsed.path == "/chart_analysis/run":
             self._handle_chart_analysis_run()
@@ -56,46 +910,708 @@ class FrontendHandler(SimpleHTTPRequestHandler):
         status = 200 if ok else 500
         self._respond_json({"success": ok, "message": msg}, status=status)
 
+    def _long_poll(self, ready, wait, respond):
+        """Call ``respond()`` once ``ready()`` is true or ``wait`` seconds have passed (None: no limit).
+
+        This handler's thread sleeps until an analysis event or job change; _AsyncRequestHandler
+        leaves the wait to the event loop instead, so a long poll holds no executor thread.
+        """
+        deadline = None if wait is None else time.monotonic() + wait
+        wake = Event()
+        with _analysis_wakeups(wake.set):
+            while True:
+                wake.clear()
+                if ready():
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                wake.wait(remaining)
+        respond()
+
+    def _accepts_gzip(self):
+        return "gzip" in self.headers.get("Accept-Encoding", "")
+
     def _respond_json(self, payload, status=200):
         data = json.dumps(payload).encode("utf-8")
+        compress = len(data) >= GZIP_MIN_BYTES and self._accepts_gzip()
+        if compress:
+            data = gzip.compress(data, compresslevel=6)
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
+        self.send_header("Cache-Control", "no-store")
+        self.send_header("Vary", "Accept-Encoding")
+        if compress:
+            self.send_header("Content-Encoding", "gzip")
         self.send_header("Content-Length", str(len(data)))
         self.end_headers()
         self.wfile.write(data)
 
+    def send_head(self):
+        """Static files with ETag/304, gzip for text types and single byte ranges.
+
+        Directories (redirects, index lookup, listings) are left to SimpleHTTPRequestHandler.
+        """
+        path = self.translate_path(self.path)
+        if os.path.isdir(path) and urllib.parse.urlsplit(self.path).path.endswith("/"):
+            for index in ("index.html", "index.htm"):
+                if os.path.isfile(os.path.join(path, index)):
+                    path = os.path.join(path, index)
+                    break
+        if path.endswith("/") or not os.path.isfile(path):
+            return super().send_head()
+        try:
+            handle = open(path, "rb")
+            stat = os.fstat(handle.fileno())
+            entry = STATIC_FILES.lookup(path, stat)
+        except OSError:
+            self.send_error(404, "File not found")
+            return None
+
+        ctype = self.guess_type(path)
+        compressible = (
+            (ctype.startswith("text/") or ctype in GZIP_TYPES)
+            and GZIP_MIN_BYTES <= stat.st_size <= GZIP_MAX_FILE_BYTES
+        )
+        use_gzip = compressible and self._accepts_gzip()
+        etag = entry.etag[:-1] + '-gz"' if use_gzip else entry.etag
+        last_modified = self.date_time_string(stat.st_mtime)
+
+        def common_headers():
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            suffix = os.path.splitext(path)[1].lower()
+            self.send_header("Cache-Control", LONG_CACHE_CONTROL if suffix in LONG_CACHE_SUFFIXES
+                             else DEFAULT_CACHE_CONTROL)
+            if compressible:
+                self.send_header("Vary", "Accept-Encoding")
+            else:
+                self.send_header("Accept-Ranges", "bytes")
+
+        if self._not_modified(etag, stat.st_mtime):
+            handle.close()
+            instrument.count("server.static", result="not_modified")
+            self.send_response(304)
+            common_headers()
+            self.end_headers()
+            return None
+
+        if use_gzip:
+            handle.close()
+            body = STATIC_FILES.gzip_body(path, entry)
+            instrument.count("server.static", result="gzip")
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            common_headers()
+            self.end_headers()
+            return io.BytesIO(body)
+
+        byte_range = None
+        range_header = self.headers.get("Range")
+        if range_header and not compressible and self.headers.get("If-Range", etag) in (etag, last_modified):
+            byte_range = _parse_range(range_header, stat.st_size)
+        if byte_range == "unsatisfiable":
+            handle.close()
+            instrument.count("server.static", result="unsatisfiable")
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{stat.st_size}")
+            self.send_header("Content-Length", "0")
+            common_headers()
+            self.end_headers()
+            return None
+        if byte_range is not None:
+            start, end = byte_range
+            instrument.count("server.static", result="partial")
+            self.send_response(206)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{stat.st_size}")
+            self.send_header("Content-Length", str(end - start + 1))
+            common_headers()
+            self.end_headers()
+            return _RangeReader(handle, start, end - start + 1)
+
+        instrument.count("server.static", result="full")
+        self.send_response(200)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(stat.st_size))
+        common_headers()
+        self.end_headers()
+        return handle
+
+    def _not_modified(self, etag, mtime):
+        """If-None-Match (weak comparison) takes precedence over If-Modified-Since."""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            tags = {tag.strip()[2:] if tag.strip().startswith("W/") else tag.strip()
+                    for tag in if_none_match.split(",")}
+            return "*" in tags or etag in tags
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since is None:
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=datetime.timezone.utc)
+        return since.timestamp() >= int(mtime)
+
+    def _read_params(self):
+        """Merge query-string parameters with an optional JSON object body."""
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+        params = {key: values[-1] for key, values in query.items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            body = json.loads(self.rfile.read(length).decode("utf-8") or "{}")
+            if not isinstance(body, dict):
+                raise ValueError("JSON body must be an object")
+            params.update(body)
+        return params
+
+    def _run_engine(self, keys, func, *args):
+        try:
+            ok, message = ENGINE.run(keys, func, *args)
+        except EngineBusy as exc:
+            self._respond_json({"success": False, "message": str(exc)}, status=503)
+            return
+        except Exception as exc:  # pragma: no cover - surface unexpected engine errors
+            self._respond_json({"success": False, "message": f"chart_engine error: {exc}"}, status=500)
+            return
+        self._respond_json({"success": ok, "message": message}, status=200 if ok else 500)
+
+    def _handle_chart_engine_process(self):
+        try:
+            params = self._read_params()
+            leave_bank = _bool_param(params, "leave_bank")
+        except ValueError as exc:
+            self._respond_json({"success": False, "message": f"invalid request: {exc}"}, status=400)
+            return
+        name = _safe_name(params.get("name"))
+        output = _safe_name(params.get("output", "ROM.v"), suffix=".v")
+        if name is None or output is None:
+            self._respond_json({"success": False, "message": "name and output (*.v) must be plain file names"},
+                               status=400)
+            return
+        if not (CHARTS_DIR / name / f"{name}.txt").exists():
+            self._respond_json({"success": False, "message": f"chart {name} not found"}, status=404)
+            return
+        if musedash_banked() and not leave_bank:
+            self._respond_json({"success": False, "message": BANK_MODE_MESSAGE, "banked": True}, status=409)
+            return
+        print(f"[server] chart_engine process {name} -> {output}")
+        self._run_engine([f"chart:{name}", f"output:{output}", HARDWARE_KEY], _engine_process,
+                         name, output, leave_bank)
+
+    def _handle_chart_engine_generate(self):
+        try:
+            params = self._read_params()
+            name = _safe_name(params.get("name", RANDOM_CHART))
+            bpm = _int_param(params, "bpm", 120)
+            length = _int_param(params, "length", 200)
+            seed = _int_param(params, "seed")
+            overwrite = _bool_param(params, "overwrite")
+            leave_bank = _bool_param(params, "leave_bank")
+            output = params.get("output")
+            if output is not None:
+                output = _safe_name(output, suffix=".v")
+                if output is None:
+                    raise ValueError("output must be a plain *.v file name")
+        except (TypeError, ValueError) as exc:
+            self._respond_json({"success": False, "message": f"invalid request: {exc}"}, status=400)
+            return
+        if name is None or bpm <= 0 or length <= 0:
+            self._respond_json({"success": False, "message": "name must be a plain name, bpm/length positive"},
+                               status=400)
+            return
+        if name != RANDOM_CHART and (CHARTS_DIR / name / f"{name}.txt").exists() and not overwrite:
+            # hand-authored charts have no backup: only replace them when asked to explicitly
+            self._respond_json({"success": False,
+                                "message": f"chart {name} already exists; send \"overwrite\": true to replace it"},
+                               status=409)
+            return
+        if output is not None and musedash_banked() and not leave_bank:
+            self._respond_json({"success": False, "message": BANK_MODE_MESSAGE, "banked": True}, status=409)
+            return
+        print(f"[server] chart_engine generate_random {name} bpm={bpm} length={length} seed={seed}")
+        keys = [f"chart:{name}"] + ([f"output:{output}", HARDWARE_KEY] if output else [])
+        self._run_engine(keys, _engine_generate, name, bpm, length, seed, output, leave_bank)
+
     def _handle_chart_analysis_run(self):
         if not CHART_ANALYSIS_SCRIPT.exists():
             self._respond_json({"success": False, "message": f"{CHART_ANALYSIS_SCRIPT.name} not found"}, status=500)
             return
-        if not ANALYSIS_LOCK.acquire(blocking=False):
-            self._respond_json({"success": False, "message": "chart_analysis already running"}, status=409)
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+        job, merged = ANALYSIS_JOBS.submit()
+        print(f"[server] chart_analysis requested from {self.client_address} -> job {job.id}"
+              f"{' (merged)' if merged else ''}")
+        if query.get("wait", ["0"])[0] not in ("", "0"):
+            # blocking mode for scripts: answer once the job has finished
+            def respond():
+                state = ANALYSIS_JOBS.snapshot(job)
+                self._respond_json({"success": bool(state["success"]), "message": state["message"], "job": state},
+                                   status=200 if state["success"] else 500)
+
+            self._long_poll(lambda: job.done, None, respond)
             return
+        self._respond_json(
+            {
+                "success": True,
+                "job_id": job.id,
+                "merged": merged,
+                "status_url": f"{JOBS_PATH}{job.id}",
+                "events_since": job.events_since,
+                "events_url": f"{EVENTS_PATH}?since={job.events_since}",
+                "job": ANALYSIS_JOBS.snapshot(job),
+            },
+            status=202,
+        )
+
+    def _handle_chart_analysis_job(self, parsed):
+        job_id = parsed.path[len(JOBS_PATH):].strip("/")
+        job = ANALYSIS_JOBS.get(job_id)
+        if job is None:
+            self._respond_json({"success": False, "message": f"unknown job {job_id}"}, status=404)
+            return
+        query = urllib.parse.parse_qs(parsed.query)
         try:
-            print(f"[server] chart_analysis requested from {self.client_address}")
-            success, message = run_chart_analysis_script()
-            status = 200 if success else 500
-            self._respond_json({"success": success, "message": message}, status=status)
-        finally:
-            ANALYSIS_LOCK.release()
+            since = int(query["since"][0]) if "since" in query else None
+            wait = float(query.get("wait", ["0"])[0] or 0)
+        except ValueError:
+            self._respond_json({"success": False, "message": "invalid since/wait"}, status=400)
+            return
+        self._long_poll(lambda: since is None or job.version > since or job.done,
+                        max(0.0, min(wait, MAX_POLL_WAIT)),
+                        lambda: self._respond_json({"success": True, "job": ANALYSIS_JOBS.snapshot(job)}))
+
+    def _handle_chart_analysis_catalog(self, parsed):
+        """protocol.json plus every summary in one response, paginated with offset/limit."""
+        query = urllib.parse.parse_qs(parsed.query)
+
+        def _list(key):
+            values = [item.strip() for value in query.get(key, []) for item in value.split(",")]
+            values = [value for value in values if value]
+            return values or None
+
+        try:
+            offset = int(query.get("offset", ["0"])[0] or 0)
+            limit = int(query.get("limit", [str(CATALOG_DEFAULT_LIMIT)])[0] or CATALOG_DEFAULT_LIMIT)
+        except ValueError:
+            self._respond_json({"success": False, "message": "invalid offset/limit"}, status=400)
+            return
+        if offset < 0 or not 0 < limit <= CATALOG_MAX_LIMIT:
+            self._respond_json(
+                {"success": False, "message": f"offset must be >= 0 and limit in 1..{CATALOG_MAX_LIMIT}"},
+                status=400)
+            return
+        names = _list("names")
+        page = CATALOG.page(offset, limit, fields=_list("fields"), names=set(names) if names else None)
+        self._respond_json({"success": True, **page})
 
+    def _handle_chart_analysis_events(self, parsed):
+        """Analysis events after ``since`` / Last-Event-ID (default: only new ones).
 
-def run_chart_analysis_script():
+        Server-Sent Events by default; ``?format=json&wait=<s>`` long-polls and returns a JSON batch.
+        """
+        query = urllib.parse.parse_qs(parsed.query)
+        try:
+            last_id, wait = _events_cursor(query, self.headers)
+        except ValueError:
+            self._respond_json({"success": False, "message": "invalid since/wait"}, status=400)
+            return
+        if query.get("format", [""])[0] == "json":
+            def respond():
+                events = ANALYSIS_EVENTS.since(last_id)
+                self._respond_json({
+                    "success": True,
+                    "last_id": events[-1][0] if events else max(last_id, 0),
+                    "events": [{"id": seq, "event": kind, "data": data} for seq, kind, data in events],
+                })
+
+            self._long_poll(lambda: bool(ANALYSIS_EVENTS.since(last_id)), max(0.0, min(wait, MAX_POLL_WAIT)),
+                            respond)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-store")
+        self.send_header("X-Accel-Buffering", "no")
+        # the stream only ends when the client goes away
+        self.send_header("Connection", "close")
+        self.end_headers()
+        try:
+            self.wfile.write(b"retry: 3000\n\n")
+            self.wfile.flush()
+            while True:
+                events = ANALYSIS_EVENTS.since(last_id, wait=SSE_HEARTBEAT)
+                if not events:
+                    self.wfile.write(b": ping\n\n")
+                for seq, kind, data in events:
+                    self.wfile.write(_sse_frame(seq, kind, data))
+                    last_id = seq
+                self.wfile.flush()
+        except ConnectionError:
+            return
+
+    def _handle_metrics(self, parsed):
+        """Counters and span timings; Prometheus text by default, ?format=json for a JSON snapshot."""
+        query = urllib.parse.parse_qs(parsed.query)
+        if query.get("format", [""])[0] == "json":
+            self._respond_json(instrument.snapshot())
+            return
+        data = instrument.format_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def run_chart_analysis_script(on_progress=None, on_output=None, on_trace=None):
+    """Run chart_analysis.py, reporting PROGRESS/TRACE lines and other output as they arrive."""
     python_exe = sys.executable or "python"
-    cmd = [python_exe, str(CHART_ANALYSIS_SCRIPT)]
+    cmd = [python_exe, "-u", str(CHART_ANALYSIS_SCRIPT), "--progress-json", "--trace-json"]
     try:
         print(f"[server] running: {' '.join(cmd)}")
-        proc = subprocess.run(cmd, cwd=str(ROOT), capture_output=True, text=True)
+        proc = subprocess.Popen(
+            cmd, cwd=str(ROOT), stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, encoding="utf-8", errors="replace",
+        )
     except Exception as exc:
         print(f"[server] failed to spawn chart_analysis: {exc}")
         return False, f"failed to spawn chart_analysis: {exc}"
-    output = (proc.stdout or proc.stderr or "").strip()
-    message = output if output else f"chart_analysis exited with {proc.returncode}"
-    print(f"[server] chart_analysis finished rc={proc.returncode}")
-    return proc.returncode == 0, message
+    lines = []
+    for raw_line in proc.stdout:
+        line = raw_line.rstrip("\n")
+        if line.startswith(PROGRESS_PREFIX):
+            if on_progress is not None:
+                try:
+                    on_progress(json.loads(line[len(PROGRESS_PREFIX):]))
+                except ValueError:
+                    pass
+            continue
+        if line.startswith(TRACE_PREFIX):
+            try:
+                record = json.loads(line[len(TRACE_PREFIX):])
+            except ValueError:
+                continue
+            instrument.ingest(record)
+            if on_trace is not None:
+                on_trace(record)
+            continue
+        lines.append(line)
+        if on_output is not None:
+            on_output(line)
+    returncode = proc.wait()
+    output = "\n".join(lines).strip()
+    message = output if output else f"chart_analysis exited with {returncode}"
+    print(f"[server] chart_analysis finished rc={returncode}")
+    return returncode == 0, message
+
+
+class _LoopWriter(io.RawIOBase):
+    """``wfile`` for a handler on an executor thread: each write is handed to the event loop and
+    waits until the transport has drained, so large files stream with backpressure."""
+
+    def __init__(self, loop, writer):
+        self._loop = loop
+        self._writer = writer
+        self.written = False
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        if data:
+            self.written = True
+            asyncio.run_coroutine_threadsafe(self._send(data), self._loop).result()
+        return len(data)
+
+    async def _send(self, data):
+        if self._writer.is_closing():
+            raise BrokenPipeError("client disconnected")
+        self._writer.write(data)
+        try:
+            await asyncio.wait_for(self._writer.drain(), SEND_TIMEOUT)
+        except asyncio.TimeoutError:
+            self._writer.close()
+            raise BrokenPipeError("client stopped reading") from None
+
+
+class _AsyncRequestHandler(FrontendHandler):
+    """FrontendHandler for one request the event loop has already read into memory.
+
+    Speaks HTTP/1.1 so the connection stays open between requests; responses on a
+    connection that stays open announce the keep-alive timeout, the others carry
+    ``Connection: close``.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def __init__(self, raw, wfile, client_address, server):
+        # no socket to set up: read the buffered request, write through the event loop
+        self.directory = str(ROOT)
+        self.rfile = io.BytesIO(raw)
+        self.wfile = wfile
+        self.client_address = client_address
+        self.server = server
+        self.request = None
+        self.close_connection = True
+        # (ready, wait, respond) of a long poll the event loop finishes, see FrontendHandler._long_poll
+        self.long_poll = None
+
+    def _long_poll(self, ready, wait, respond):
+        self.long_poll = (ready, wait, respond)
+
+    def handle_expect_100(self):
+        # the event loop already sent "100 Continue" before reading the body
+        return True
+
+    def send_response(self, code, message=None):
+        super().send_response(code, message)
+        if self.server.keep_alive <= 0:
+            self.send_header("Connection", "close")
+
+    def end_headers(self):
+        # decided last: send_error and handlers may still have added "Connection: close"
+        if not self.close_connection:
+            self.send_header("Keep-Alive", f"timeout={int(self.server.keep_alive)}")
+        super().end_headers()
+
+
+class AsyncFrontendServer:
+    """asyncio front end with the same routes as the threaded server.
+
+    The event loop owns every connection, so idle keep-alive connections, open SSE
+    streams and JSON long polls waiting for news hold no thread. Each request is read
+    on the loop and then handled by FrontendHandler on a fixed executor (static files,
+    JSON APIs, the response of a long poll), so slow file or engine work never blocks
+    the loop and no thread is created per connection.
+    """
+
+    def __init__(self, host, port, max_connections=DEFAULT_MAX_CONNECTIONS, keep_alive=DEFAULT_KEEP_ALIVE,
+                 workers=DEFAULT_HTTP_WORKERS):
+        self.host = host
+        self.port = port
+        self.max_connections = max_connections
+        self.keep_alive = keep_alive
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="http")
+        self._slots = None
+
+    def serve_forever(self):
+        asyncio.run(self._serve())
+
+    async def _serve(self):
+        self._slots = asyncio.Semaphore(self.max_connections)
+        server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                            limit=REQUEST_HEAD_LIMIT)
+        async with server:
+            await server.serve_forever()
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            await asyncio.wait_for(self._slots.acquire(), CONNECTION_WAIT)
+        except asyncio.TimeoutError:
+            instrument.count("server.connections", result="rejected")
+            await self._error_response(writer, 503, "too many connections, try again later")
+            writer.close()
+            return
+        instrument.count("server.connections", result="accepted")
+        try:
+            await self._serve_connection(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            pass
+        finally:
+            self._slots.release()
+            writer.close()
+
+    async def _serve_connection(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        client_address = writer.get_extra_info("peername") or ("-", 0)
+        timeout = REQUEST_TIMEOUT
+        while True:
+            try:
+                head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout)
+            except (asyncio.LimitOverrunError, ValueError):
+                await self._error_response(writer, 431, "request header too large")
+                return
+            except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                return  # client closed the connection or stayed idle past the keep-alive timeout
+            # later requests on this connection get the keep-alive idle timeout
+            timeout = self.keep_alive
+            request_line, _, header_block = head.partition(b"\r\n")
+            try:
+                headers = http.client.parse_headers(io.BytesIO(header_block))
+            except http.client.HTTPException:
+                await self._error_response(writer, 431, "too many or too long header lines")
+                return
+            if headers.get("Transfer-Encoding"):
+                await self._error_response(writer, 411, "request bodies must carry Content-Length")
+                return
+            try:
+                length = int(headers.get("Content-Length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                await self._error_response(writer, 400, "invalid Content-Length")
+                return
+            if length > MAX_REQUEST_BODY:
+                await self._error_response(writer, 413, f"request body larger than {MAX_REQUEST_BODY} bytes")
+                return
+            if length and headers.get("Expect", "").lower() == "100-continue":
+                writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+            body = await asyncio.wait_for(reader.readexactly(length), REQUEST_TIMEOUT) if length else b""
+
+            last_id = self._event_stream_cursor(request_line, headers)
+            if last_id is not None:
+                await self._stream_events(writer, last_id)
+                return
+            handler = _AsyncRequestHandler(head + body, _LoopWriter(loop, writer), client_address, self)
+            close = await loop.run_in_executor(self._executor, self._run_handler, handler)
+            if handler.long_poll is not None:
+                close = await self._finish_long_poll(handler)
+            if close or self.keep_alive <= 0:
+                return
+
+    async def _finish_long_poll(self, handler):
+        """Wait for a long poll's condition on the loop, then run its response on the executor."""
+        loop = asyncio.get_running_loop()
+        ready, wait, respond = handler.long_poll
+        deadline = None if wait is None else loop.time() + wait
+        wake = asyncio.Event()
+
+        def notify():
+            loop.call_soon_threadsafe(wake.set)
+
+        with _analysis_wakeups(notify):
+            while True:
+                wake.clear()
+                if ready():
+                    break
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(wake.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+        return await loop.run_in_executor(self._executor, self._run_handler, handler, respond)
+
+    @staticmethod
+    def _run_handler(handler, step=None):
+        """Handle one request (or finish a long poll with ``step``) on an executor thread;
+        True when the connection must be closed."""
+        try:
+            if step is None:
+                handler.handle_one_request()
+            else:
+                step()
+                handler.wfile.flush()
+        except ConnectionError:
+            return True
+        except Exception as exc:  # pragma: no cover - drop the connection, keep serving others
+            print(f"[server] error handling {getattr(handler, 'requestline', '?')!r}: {exc}")
+            if not handler.wfile.written:
+                with contextlib.suppress(Exception):
+                    handler.send_error(500, "Internal server error")
+            return True
+        return handler.close_connection
+
+    @staticmethod
+    def _event_stream_cursor(request_line, headers):
+        """last_id for a valid SSE request (served on the loop), otherwise None (left to the handler)."""
+        parts = request_line.decode("latin-1").split()
+        if len(parts) != 3 or parts[0] != "GET":
+            return None
+        parsed = urllib.parse.urlparse(parts[1])
+        if parsed.path != EVENTS_PATH:
+            return None
+        query = urllib.parse.parse_qs(parsed.query)
+        if query.get("format", [""])[0] == "json":
+            return None
+        try:
+            return _events_cursor(query, headers)[0]
+        except ValueError:
+            return None
+
+    async def _stream_events(self, writer, last_id):
+        """SSE on the event loop: AnalysisEventBus wakes the stream instead of a thread blocked in since()."""
+        loop = asyncio.get_running_loop()
+        wake = asyncio.Event()
+
+        def notify():
+            loop.call_soon_threadsafe(wake.set)
+
+        instrument.count("server.requests", method="GET", route=EVENTS_PATH)
+        instrument.count("server.responses", status=200)
+        ANALYSIS_EVENTS.add_listener(notify)
+        try:
+            with instrument.span(f"server.request GET {EVENTS_PATH}", path=EVENTS_PATH):
+                writer.write(b"HTTP/1.1 200 OK\r\n"
+                             b"Content-Type: text/event-stream; charset=utf-8\r\n"
+                             b"Cache-Control: no-store\r\n"
+                             b"X-Accel-Buffering: no\r\n"
+                             b"Connection: close\r\n\r\n"
+                             b"retry: 3000\n\n")
+                while True:
+                    await asyncio.wait_for(writer.drain(), SEND_TIMEOUT)
+                    wake.clear()
+                    events = ANALYSIS_EVENTS.since(last_id)
+                    if not events:
+                        try:
+                            await asyncio.wait_for(wake.wait(), SSE_HEARTBEAT)
+                        except asyncio.TimeoutError:
+                            writer.write(b": ping\n\n")
+                        continue
+                    for seq, kind, data in events:
+                        writer.write(_sse_frame(seq, kind, data))
+                        last_id = seq
+        except (ConnectionError, asyncio.TimeoutError):
+            return
+        finally:
+            ANALYSIS_EVENTS.remove_listener(notify)
+
+    @staticmethod
+    async def _error_response(writer, status, message):
+        """JSON error written directly by the loop (request could not be handed to FrontendHandler)."""
+        body = json.dumps({"success": False, "message": message}).encode("utf-8")
+        instrument.count("server.responses", status=status)
+        head = (f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                + ("Retry-After: 1\r\n" if status == 503 else "")
+                + "Connection: close\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        with contextlib.suppress(ConnectionError, asyncio.TimeoutError):
+            await asyncio.wait_for(writer.drain(), SEND_TIMEOUT)
 
 
-def run_server(host: str, port: int):
+def run_server(host: str, port: int, analysis_jobs: int = 1, spawn_analysis: bool = False,
+               engine_workers: int = 4, trace_log=None, server_mode: str = "threaded",
+               max_connections: int = DEFAULT_MAX_CONNECTIONS, keep_alive: float = DEFAULT_KEEP_ALIVE,
+               http_workers: int = DEFAULT_HTTP_WORKERS):
+    global ENGINE
+    if trace_log:
+        # the analysis worker / script inherits the variable and appends its own records
+        os.environ["MUSEDASH_TRACE"] = str(Path(trace_log).resolve()) if trace_log != "-" else "-"
+        instrument.configure_log(os.environ["MUSEDASH_TRACE"])
+    ENGINE = ChartEngineService(workers=engine_workers)
+    if spawn_analysis:
+        ANALYSIS_JOBS.runner = run_chart_analysis_script
+    else:
+        # warm the worker up front so the first request skips interpreter/matplotlib startup
+        ANALYSIS_WORKER.jobs = analysis_jobs
+        ANALYSIS_WORKER.start()
+        atexit.register(ANALYSIS_WORKER.stop)
+    if server_mode == "asyncio":
+        server = AsyncFrontendServer(host, port, max_connections=max_connections, keep_alive=keep_alive,
+                                     workers=http_workers)
+        print(f"Serving {ROOT} on http://{host}:{port} (asyncio, up to {max_connections} connections, "
+              f"keep-alive {keep_alive:g}s, {http_workers} handler threads)")
+        server.serve_forever()
+        return
     handler_cls = partial(FrontendHandler, directory=str(ROOT))
     httpd = ThreadingHTTPServer((host, port), handler_cls)
     print(f"Serving {ROOT} on http://{host}:{port}")
@@ -106,8 +1622,30 @@ def main():
     parser = argparse.ArgumentParser(description="Serve frontend with simple API helpers")
     parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
     parser.add_argument("--port", type=int, default=8000, help="Port to listen on (default: 8000)")
+    parser.add_argument("--analysis-jobs", type=int, default=1,
+                        help="Processes used by the analysis worker per run (default: 1)")
+    parser.add_argument("--spawn-analysis", action="store_true",
+                        help="Spawn a fresh chart_analysis.py per request instead of the warm worker")
+    parser.add_argument("--engine-workers", type=int, default=4,
+                        help="Threads for /chart_engine/* requests (default: 4)")
+    parser.add_argument("--trace-log", metavar="PATH",
+                        help="Append structured span/counter records as JSON lines ('-' for stderr)")
+    parser.add_argument("--server-mode", choices=("threaded", "asyncio"), default="threaded",
+                        help="threaded: one thread per connection (ThreadingHTTPServer); asyncio: event loop "
+                             "with keep-alive and a fixed handler pool (default: threaded)")
+    parser.add_argument("--max-connections", type=int, default=DEFAULT_MAX_CONNECTIONS,
+                        help=f"asyncio mode: open connections served at once (default: {DEFAULT_MAX_CONNECTIONS})")
+    parser.add_argument("--keep-alive", type=float, default=DEFAULT_KEEP_ALIVE,
+                        help="asyncio mode: idle seconds before a keep-alive connection is closed, "
+                             f"0 closes after every response (default: {DEFAULT_KEEP_ALIVE:g})")
+    parser.add_argument("--http-workers", type=int, default=DEFAULT_HTTP_WORKERS,
+                        help=f"asyncio mode: threads handling requests (default: {DEFAULT_HTTP_WORKERS})")
     args = parser.parse_args()
-    run_server(args.host, args.port)
+    if args.max_connections <= 0 or args.http_workers <= 0 or args.keep_alive < 0:
+        parser.error("--max-connections and --http-workers must be positive, --keep-alive non-negative")
+    run_server(args.host, args.port, analysis_jobs=args.analysis_jobs, spawn_analysis=args.spawn_analysis,
+               engine_workers=args.engine_workers, trace_log=args.trace_log, server_mode=args.server_mode,
+               max_connections=args.max_connections, keep_alive=args.keep_alive, http_workers=args.http_workers)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,28 @@
+import sys
+import threading
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+# 测试以仓库根目录为导入根，与 python -m chart_engine.chart_engine 一致
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture
+def frontend_server(tmp_path):
+    """在临时目录上启动 FrontendHandler（端口 0），返回 (base_url, 静态根目录)"""
+    import server
+
+    root = tmp_path / "www"
+    root.mkdir()
+    httpd = server.ThreadingHTTPServer(("127.0.0.1", 0), partial(server.FrontendHandler, directory=str(root)))
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}", root
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
@@ -0,0 +1,93 @@
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+import chart_analysis.chart_analysis as analysis
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+NAMES = ["Cthugha", "Cyaegha"]
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """charts/ 与 outputs/ 都指向临时目录；图表渲染替换为写占位 PNG，并记录被渲染的谱面"""
+    charts_dir = tmp_path / "charts"
+    for name in NAMES:
+        (charts_dir / name).mkdir(parents=True)
+        shutil.copy(REPO_ROOT / "charts" / name / f"{name}.txt", charts_dir / name / f"{name}.txt")
+    output_dir = tmp_path / "outputs"
+    monkeypatch.setattr(analysis, "CHARTS_DIR", charts_dir)
+    monkeypatch.setattr(analysis, "OUTPUT_DIR", output_dir)
+
+    rendered = []
+
+    def fake_render(chart_name, stats, suffix, method_name):
+        output_dir.mkdir(parents=True, exist_ok=True)
+        file_name = f"{chart_name}{suffix}"
+        for name in (file_name, analysis.thumbnail_name(file_name)):
+            (output_dir / name).write_bytes(b"png")
+        rendered.append(chart_name)
+
+    monkeypatch.setattr(analysis, "render_figure", fake_render)
+    return charts_dir, output_dir, rendered
+
+
+def run(output_dir):
+    """一次完整的增量分析：读 manifest、逐个处理、写回 manifest，返回各谱面状态"""
+    cache = analysis.AnalysisCache.load(output_dir / "manifest.json")
+    statuses = {name: analysis._process_chart(name, cache) for name in NAMES}
+    cache.save()
+    return statuses
+
+
+def test_unchanged_charts_are_skipped(workspace):
+    _, output_dir, rendered = workspace
+    assert run(output_dir) == dict.fromkeys(NAMES, analysis.STATUS_OK)
+    assert len(rendered) == len(NAMES) * len(analysis.CHART_FIGURES)
+
+    rendered.clear()
+    assert run(output_dir) == dict.fromkeys(NAMES, analysis.STATUS_SKIPPED)
+    assert rendered == []
+
+
+def test_edited_chart_invalidates_only_its_entry(workspace):
+    charts_dir, output_dir, _ = workspace
+    run(output_dir)
+    chart_file = charts_dir / "Cthugha" / "Cthugha.txt"
+    chart_file.write_text(chart_file.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    assert run(output_dir) == {"Cthugha": analysis.STATUS_OK, "Cyaegha": analysis.STATUS_SKIPPED}
+
+
+@pytest.mark.parametrize("version", ["ANALYZER_VERSION", "RENDERER_VERSION"])
+def test_version_bump_invalidates_every_entry(workspace, monkeypatch, version):
+    _, output_dir, _ = workspace
+    run(output_dir)
+    monkeypatch.setattr(analysis, version, getattr(analysis, version) + 1)
+    assert run(output_dir) == dict.fromkeys(NAMES, analysis.STATUS_OK)
+    assert run(output_dir) == dict.fromkeys(NAMES, analysis.STATUS_SKIPPED)
+
+
+@pytest.mark.parametrize("thumbnail", [False, True])
+def test_missing_output_invalidates_only_its_entry(workspace, thumbnail):
+    _, output_dir, _ = workspace
+    run(output_dir)
+    file_name = f"Cyaegha{analysis.CHART_FIGURES[2][0]}"
+    (output_dir / (analysis.thumbnail_name(file_name) if thumbnail else file_name)).unlink()
+    assert run(output_dir) == {"Cthugha": analysis.STATUS_SKIPPED, "Cyaegha": analysis.STATUS_OK}
+
+
+def test_manifest_is_replaced_atomically(workspace, monkeypatch):
+    _, output_dir, _ = workspace
+    replaced = []
+    real_replace = os.replace
+
+    def spy(src, dst):
+        replaced.append(Path(dst).name)
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", spy)
+    run(output_dir)
+    assert "manifest.json" in replaced
+    assert [path.name for path in output_dir.iterdir() if path.name.endswith(".tmp")] == []
@@ -0,0 +1,100 @@
+import pytest
+
+from chart_engine.chart_engine import (
+    BANK_ALIGN, BANK_ENTRY_WORDS, BANK_HEADER_WORDS, BANK_MAX, ROM_LEN, TAP, Chart,
+    bpm_to_div_cnt, build_bank_image, build_rom_image, parse_chart, read_bank_header,
+)
+
+REPO_CHARTS = ("Cthugha", "Cyaegha", "Random")
+
+
+def make_chart(events, bpm=120, name="test"):
+    chart = Chart(name, None, bpm)
+    for time_val, code, track in events:
+        chart.times.append(time_val)
+        chart.types.append(code)
+        chart.tracks.append(track)
+    return chart
+
+
+def nibbles(rom, addr, width):
+    value = 0
+    for word in rom[addr:addr + width]:
+        value = (value << 4) | word
+    return value
+
+
+@pytest.fixture(scope="module")
+def repo_charts():
+    charts = []
+    for name in REPO_CHARTS:
+        chart, error = parse_chart(name, use_binary=False)
+        assert error is None
+        charts.append(chart)
+    return charts
+
+
+def test_header_roundtrip(repo_charts):
+    rom, entries = build_bank_image(repo_charts, list(REPO_CHARTS))
+    assert [entry.name for entry in entries] == list(REPO_CHARTS)
+    assert read_bank_header(rom) == [(entry.base, entry.length, entry.div_cnt) for entry in entries]
+    for entry, chart in zip(entries, repo_charts):
+        assert entry.bpm == chart.bpm
+        assert entry.div_cnt == bpm_to_div_cnt(chart.bpm)
+
+
+def test_header_layout(repo_charts):
+    rom, entries = build_bank_image(repo_charts, list(REPO_CHARTS))
+    # 地址 0~1：bank 数；之后每个 bank 16 个字：base 4、length 4、div_cnt 7、保留 1，高位在前
+    assert nibbles(rom, 0, BANK_HEADER_WORDS) == len(entries)
+    for idx, entry in enumerate(entries):
+        addr = BANK_HEADER_WORDS + BANK_ENTRY_WORDS * idx
+        assert nibbles(rom, addr, 4) == entry.base
+        assert nibbles(rom, addr + 4, 4) == entry.length
+        assert nibbles(rom, addr + 8, 7) == entry.div_cnt
+        assert rom[addr + 15] == 0
+    header_end = BANK_HEADER_WORDS + BANK_ENTRY_WORDS * len(entries)
+    assert all(word == 0 for word in rom[header_end:entries[0].base])
+    assert all(word < 16 for word in rom)
+
+
+def test_chart_placement(repo_charts):
+    rom, entries = build_bank_image(repo_charts, list(REPO_CHARTS))
+    header_end = BANK_HEADER_WORDS + BANK_ENTRY_WORDS * len(entries)
+    previous_end = header_end
+    for entry, chart in zip(entries, repo_charts):
+        assert entry.base % BANK_ALIGN == 0 and entry.base >= previous_end
+        # 每个 bank 为谱面的稠密镜像加一个结尾空字
+        assert entry.length == chart.duration + 2
+        dense = build_rom_image(chart)
+        assert rom[entry.base:entry.base + entry.length] == dense[:entry.length]
+        assert rom[entry.base + entry.length - 1] == 0
+        previous_end = entry.base + entry.length
+    # 镜像长度为容纳全部谱面的最小 2 的幂（不小于 ROM_LEN）
+    assert len(rom) >= max(ROM_LEN, previous_end) and len(rom) & (len(rom) - 1) == 0
+    assert len(rom) == ROM_LEN or len(rom) // 2 < previous_end
+
+
+def test_image_grows_past_rom_len():
+    long_chart = make_chart([(0, TAP, 0), (ROM_LEN + 100, TAP, 1)])
+    rom, entries = build_bank_image([long_chart], ["long"])
+    assert len(rom) == 2 * ROM_LEN
+    assert read_bank_header(rom) == [(entries[0].base, ROM_LEN + 102, bpm_to_div_cnt(120))]
+    assert rom[entries[0].base + ROM_LEN + 100] == TAP << 2
+
+
+def test_rejects_invalid_banks():
+    chart = make_chart([(0, TAP, 0)])
+    assert build_bank_image([], []) is None
+    assert build_bank_image([chart] * (BANK_MAX + 1), ["c"] * (BANK_MAX + 1)) is None
+    assert build_bank_image([make_chart([(0, TAP, 0)], bpm=0)], ["zero"]) is None
+    # div_cnt 超过 25 位
+    assert build_bank_image([make_chart([(0, TAP, 0)], bpm=1)], ["slow"]) is None
+
+
+def test_max_banks():
+    charts = [make_chart([(idx, TAP, idx % 2)], bpm=100 + idx) for idx in range(BANK_MAX)]
+    rom, entries = build_bank_image(charts, [f"c{idx}" for idx in range(BANK_MAX)])
+    table = read_bank_header(rom)
+    assert len(table) == BANK_MAX
+    assert [div_cnt for _, _, div_cnt in table] == [bpm_to_div_cnt(100 + idx) for idx in range(BANK_MAX)]
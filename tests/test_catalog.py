@@ -0,0 +1,98 @@
+import json
+import os
+import urllib.error
+import urllib.request
+
+import pytest
+
+import server
+
+
+def write_output(output_dir, names):
+    """按 generate_protocol 的格式写 protocol.json 与各谱面 summary"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    charts = []
+    for index, name in enumerate(names):
+        summary = f"{name}_summary.json"
+        (output_dir / summary).write_text(json.dumps({"bpm": 100 + index, "total_notes": index}), encoding="utf-8")
+        charts.append({"name": name, "files": [f"{name}_timeline.png"], "thumbnails": [], "summary": summary})
+    (output_dir / "protocol.json").write_text(json.dumps({"charts": charts}), encoding="utf-8")
+
+
+def bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def catalog(tmp_path, monkeypatch):
+    catalog = server.AnalysisCatalog(tmp_path / "outputs")
+    write_output(catalog.output_dir, [f"chart{index}" for index in range(5)])
+    monkeypatch.setattr(server, "CATALOG", catalog)
+    return catalog
+
+
+def test_page_offset_limit_next_offset(catalog):
+    first = catalog.page(0, 2)
+    assert [entry["name"] for entry in first["charts"]] == ["chart0", "chart1"]
+    assert (first["total"], first["offset"], first["limit"], first["next_offset"]) == (5, 0, 2, 2)
+    assert first["charts"][1]["stats"] == {"bpm": 101, "total_notes": 1}
+
+    last = catalog.page(4, 2)
+    assert [entry["name"] for entry in last["charts"]] == ["chart4"]
+    assert last["next_offset"] is None
+    assert catalog.page(10, 2)["charts"] == []
+
+
+def test_page_fields_and_names(catalog):
+    page = catalog.page(0, 10, fields=["summary"], names={"chart1", "chart3", "missing"})
+    assert page["total"] == 2
+    assert page["charts"] == [
+        {"name": "chart1", "summary": "chart1_summary.json"},
+        {"name": "chart3", "summary": "chart3_summary.json"},
+    ]
+
+
+def test_unreadable_protocol_keeps_last_index(catalog):
+    built = catalog.page()
+    protocol = catalog.output_dir / "protocol.json"
+    protocol.write_text('{"charts": [{"name": "chart0"', encoding="utf-8")  # 写了一半
+    bump_mtime(protocol)
+
+    page = catalog.page()
+    assert page["version"] == built["version"]
+    assert [entry["name"] for entry in page["charts"]] == [f"chart{index}" for index in range(5)]
+
+    # 写完整后重新建立索引
+    write_output(catalog.output_dir, ["chart0", "other"])
+    bump_mtime(protocol)
+    page = catalog.page()
+    assert page["version"] == built["version"] + 1
+    assert [entry["name"] for entry in page["charts"]] == ["chart0", "other"]
+
+
+def test_unreadable_summary_is_reread(catalog):
+    summary = catalog.output_dir / "chart2_summary.json"
+    summary.write_text("{", encoding="utf-8")
+    assert catalog.page(2, 1)["charts"][0]["stats"] is None
+
+    summary.write_text(json.dumps({"bpm": 150}), encoding="utf-8")
+    bump_mtime(summary)
+    bump_mtime(catalog.output_dir / "protocol.json")
+    assert catalog.page(2, 1)["charts"][0]["stats"] == {"bpm": 150}
+
+
+def test_catalog_endpoint(catalog, frontend_server):
+    base_url, _ = frontend_server
+    url = f"{base_url}{server.CATALOG_PATH}?offset=1&limit=2&fields=bpm,summary&names=chart1,chart2,chart4"
+    with urllib.request.urlopen(url) as response:
+        body = json.load(response)
+    assert body["success"] is True
+    assert (body["total"], body["offset"], body["next_offset"]) == (3, 1, None)
+    assert [entry["name"] for entry in body["charts"]] == ["chart2", "chart4"]
+    assert set(body["charts"][0]) == {"name", "summary"}
+
+    for query in ("offset=-1", "limit=0", f"limit={server.CATALOG_MAX_LIMIT + 1}", "offset=x"):
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(f"{base_url}{server.CATALOG_PATH}?{query}")
+        assert excinfo.value.code == 400
@@ -0,0 +1,73 @@
+import os
+import shutil
+from array import array
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from chart_engine.chart_engine import (
+    binary_chart_path, load_chart_binary, parse_chart, validate_chart, write_chart_binary,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def chart_file(tmp_path):
+    path = tmp_path / "Cyaegha.txt"
+    shutil.copy(REPO_ROOT / "charts" / "Cyaegha" / "Cyaegha.txt", path)
+    chart, error = parse_chart("Cyaegha", path, use_binary=False)
+    assert error is None and validate_chart(chart)
+    assert write_chart_binary(chart) == binary_chart_path(path)
+    return path
+
+
+def test_roundtrip(chart_file):
+    text, _ = parse_chart("Cyaegha", chart_file, use_binary=False)
+    chart = load_chart_binary("Cyaegha", chart_file)
+    assert isinstance(chart.times, memoryview)
+    assert chart.validated and chart.bpm == text.bpm
+    assert list(chart.events()) == list(text.events())
+    chart.close()
+
+
+def test_mtime_only_change_reuses_binary(chart_file):
+    stat = chart_file.stat()
+    os.utime(chart_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    chart = load_chart_binary("Cyaegha", chart_file)
+    assert chart is not None
+    chart.close()
+
+
+def test_same_size_edit_invalidates_binary(chart_file):
+    # 改一个数字而长度与 mtime 不变：size/mtime 判断不出，内容哈希可以
+    stat = chart_file.stat()
+    content = chart_file.read_text(encoding="utf-8")
+    assert "\n(2,tap,0)\n" in content
+    chart_file.write_text(content.replace("\n(2,tap,0)\n", "\n(3,tap,0)\n", 1), encoding="utf-8")
+    os.utime(chart_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert chart_file.stat().st_size == stat.st_size
+    assert load_chart_binary("Cyaegha", chart_file) is None
+    chart, _ = parse_chart("Cyaegha", chart_file)
+    assert isinstance(chart.times, array) and not chart.validated
+    assert chart.times[0] == 3
+
+
+def test_close_releases_mapping(chart_file):
+    chart, _ = parse_chart("Cyaegha", chart_file)
+    expected = list(chart.events())
+    with chart:
+        assert isinstance(chart.times, memoryview)
+    # 解除映射后谱面仍可用，旁路文件可替换或删除
+    assert isinstance(chart.times, array) and list(chart.events()) == expected
+    chart.close()
+    assert write_chart_binary(chart) is not None
+    binary_chart_path(chart_file).unlink()
+
+
+def test_close_with_exported_buffer(chart_file):
+    chart = load_chart_binary("Cyaegha", chart_file)
+    types = np.frombuffer(chart.types, dtype=np.int8)
+    chart.close()
+    assert list(chart.types) == types.tolist()
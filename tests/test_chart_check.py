@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import pytest
+
+import chart_engine.chart_engine as engine
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# 每行一处错误（第 3/4/5/7/9 行），第 10 行的 hold_start 到文件末尾仍未闭合
+FAULTY = Path(__file__).parent / "data" / "faulty_chart.txt"
+FAULTY_DIAGNOSTICS = [
+    (3, "trace"),
+    (4, "monotonic"),
+    (5, "hold_mid"),
+    (7, "format"),
+    (9, "type"),
+    (10, "hold_unclosed"),
+]
+
+
+def test_iter_chart_diagnostics_reports_every_fault():
+    diagnostics = list(engine.iter_chart_diagnostics("faulty", FAULTY))
+    assert [(diag.line, diag.rule) for diag in diagnostics] == FAULTY_DIAGNOSTICS
+    # 行号同时出现在信息中（未闭合的长条只报告轨道）
+    for diag in diagnostics[:-1]:
+        assert f"第 {diag.line} 行" in diag.message
+
+
+def test_collect_diagnostics_limit():
+    assert engine.collect_diagnostics("faulty", FAULTY) == list(engine.iter_chart_diagnostics("faulty", FAULTY))
+    assert [(diag.line, diag.rule) for diag in engine.collect_diagnostics("faulty", FAULTY, limit=2)] == \
+        FAULTY_DIAGNOSTICS[:2]
+
+
+def test_chart_check_collect_all_prints_every_fault(capsys):
+    assert engine.chart_check("faulty", FAULTY, collect_all=True) is False
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == len(FAULTY_DIAGNOSTICS)
+    assert all(line.startswith("[chart_check] ") for line in lines)
+
+
+@pytest.mark.parametrize("content, message", [
+    # 逐条摘自流式校验之前的 chart_check 输出
+    (FAULTY.read_text(encoding="utf-8"), "第 3 行 trace 仅允许 0/1: 2"),
+    ("bpm=120\n(10,tap,0)\n(5,tap,1)\n(20,hold_mid,0)\n", "时间需整体单调不减：第 3 行 5 < 上一行 10"),
+    ("bpm=x\n(1,tap,0)\n", "BPM 必须为整数"),
+    ("bpm=120\n(1,tap,0)\n(3,hold_start,1)\n", "轨道 1 的 hold_start 未闭合"),
+])
+def test_chart_check_default_stops_at_first_error(tmp_path, capsys, content, message):
+    path = tmp_path / "chart.txt"
+    path.write_text(content, encoding="utf-8")
+    assert engine.chart_check("chart", path) is False
+    assert capsys.readouterr().out == f"[chart_check] {message}\n"
+
+
+@pytest.mark.parametrize("name", ["Cthugha", "Cyaegha", "Random"])
+def test_fixture_charts_pass(name):
+    assert engine.chart_check(name, REPO_ROOT / "charts" / name / f"{name}.txt", collect_all=True)
+    assert engine.collect_diagnostics(name, REPO_ROOT / "charts" / name / f"{name}.txt") == []
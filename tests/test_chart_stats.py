@@ -0,0 +1,33 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import chart_analysis.chart_analysis as analysis
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# 逐音符元组实现（向量化之前）对 charts/ 样例谱面给出的 stats
+EXPECTED = json.loads((Path(__file__).parent / "data" / "expected_stats.json").read_text(encoding="utf-8"))
+
+
+def as_json(value):
+    """与 summary 写出时相同的 JSON 形式：整数键变为字符串，键顺序保留"""
+    return json.loads(json.dumps(value, ensure_ascii=False))
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED))
+def test_analyze_matches_reference(name):
+    parser = analysis.ChartParser(REPO_ROOT / "charts" / name / f"{name}.txt")
+    assert parser.parse()
+    analyzer = analysis.ChartAnalyzer(name, parser)
+    analyzer.analyze()
+    stats = as_json(analyzer.stats)
+    expected = EXPECTED[name]
+
+    assert list(stats) == list(expected)
+    for key, value in expected.items():
+        # 逐项比较；浮点值（难度曲线的加权和、密度均值）要求逐位相等
+        assert stats[key] == value, key
+        if isinstance(value, dict):
+            # note_types / track_distribution / 曲线按首次出现顺序排列
+            assert list(stats[key]) == list(value), key
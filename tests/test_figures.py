@@ -0,0 +1,26 @@
+import pytest
+from PIL import Image
+
+import chart_analysis.chart_analysis as analysis
+
+plt = analysis.load_plotting()
+
+
+def test_thumbnail_from_single_render(tmp_path, monkeypatch):
+    fig, ax = plt.subplots(figsize=(9, 6))
+    ax.plot([0, 1, 2], [0, 2, 1])
+    draws = []
+    draw = fig.canvas.draw
+    monkeypatch.setattr(fig.canvas, "draw", lambda: draws.append(1) or draw())
+    monkeypatch.setattr(fig, "savefig", lambda *args, **kwargs: pytest.fail("savefig 不应被调用"))
+    try:
+        analysis._save_with_thumbnail(fig, tmp_path / "chart_x.png", analysis.FIGURE_DPI)
+    finally:
+        plt.close(fig)
+
+    assert draws == [1]
+    with Image.open(tmp_path / "chart_x.png") as full:
+        assert full.size == (9 * analysis.FIGURE_DPI, 6 * analysis.FIGURE_DPI)
+    with Image.open(tmp_path / analysis.thumbnail_name("chart_x.png")) as thumbnail:
+        assert thumbnail.size == (9 * analysis.THUMBNAIL_DPI, 6 * analysis.THUMBNAIL_DPI)
+        assert thumbnail.mode == "P"
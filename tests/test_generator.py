@@ -0,0 +1,92 @@
+import itertools
+
+import pytest
+
+import chart_engine.chart_engine as engine
+from chart_engine.generator import (
+    ChartConstraints, _check_constraints, chart_seeds, format_chart, generate_charts, write_chart,
+)
+
+
+def columns(chart):
+    return chart.times.tolist(), chart.types.tolist(), chart.tracks.tolist()
+
+
+def test_same_seed_regardless_of_count_split():
+    constraints = ChartConstraints(max_ticks=400)
+    whole = generate_charts(10, seed=1234, constraints=constraints)
+    # 同一主种子的前 i 个谱面与批量大小无关
+    assert [columns(chart) for chart in generate_charts(4, seed=1234, constraints=constraints)] == \
+        [columns(chart) for chart in whole[:4]]
+    # 按 (3, 3, 4) 切分给不同的“工作者”，各自用派生种子的一段
+    seeds = chart_seeds(10, 1234)
+    parts = []
+    for start, stop in ((0, 3), (3, 6), (6, 10)):
+        parts.extend(generate_charts(stop - start, seeds=seeds[start:stop], constraints=constraints))
+    assert [columns(chart) for chart in parts] == [columns(chart) for chart in whole]
+    # 不同谱面之间确实不同
+    assert len({format_chart(chart) for chart in whole}) == len(whole)
+
+
+def test_seeds_length_must_match_count():
+    with pytest.raises(ValueError):
+        generate_charts(3, seeds=chart_seeds(2, 0))
+
+
+SWEEP = list(itertools.product(
+    (0.0, 1.0),          # hold_ratio
+    (0.0, 1.0),          # track_balance
+    (0.3, 5.0),          # density（5.0 远超每轨最小间隔允许的上限）
+    (0, 1, 2, 300),      # max_ticks
+))
+
+
+@pytest.mark.parametrize("hold_ratio, track_balance, density, max_ticks", SWEEP)
+def test_constraint_sweep_passes_chart_check(tmp_path, capsys, hold_ratio, track_balance, density, max_ticks):
+    constraints = ChartConstraints(density=density, hold_ratio=hold_ratio, hold_length=(2, 5),
+                                   track_balance=track_balance, max_ticks=max_ticks)
+    for seed in range(3):
+        chart = generate_charts(1, seeds=[seed], constraints=constraints)[0]
+        path = write_chart(chart, tmp_path / f"chart_{seed}.txt")
+        assert engine.chart_check("chart", path, collect_all=True), capsys.readouterr().out
+
+        times, types, tracks = columns(chart)
+        assert all(0 <= time_val < max(max_ticks, 1) for time_val in times)
+        if max_ticks <= 1 or density == 0:
+            assert times == []
+        if hold_ratio == 0.0:
+            assert engine.HOLD_START not in types and engine.HOLD_MID not in types
+        elif times:
+            assert engine.TAP not in types
+        # track_balance 为 0 / 1 时所有音符落在同一轨
+        if times and track_balance in (0.0, 1.0):
+            assert set(tracks) == {int(track_balance)}
+
+
+def test_zero_density_is_empty(tmp_path):
+    chart = generate_charts(1, seed=0, constraints=ChartConstraints(density=0.0))[0]
+    assert len(chart) == 0
+    assert engine.chart_check("chart", write_chart(chart, tmp_path / "empty.txt"))
+
+
+@pytest.mark.parametrize("hold_length", [(1, 4), (0, 0), (5, 3), (-2, 3)])
+def test_check_constraints_rejects_hold_length(hold_length):
+    constraints = ChartConstraints(hold_length=hold_length)
+    with pytest.raises(ValueError, match="hold_length"):
+        _check_constraints(constraints)
+    with pytest.raises(ValueError, match="hold_length"):
+        generate_charts(1, seed=0, constraints=constraints)
+
+
+@pytest.mark.parametrize("overrides", [
+    dict(hold_ratio=1.5), dict(hold_ratio=-0.1), dict(track_balance=2.0), dict(density=-1.0), dict(max_ticks=-1),
+])
+def test_check_constraints_rejects_out_of_range(overrides):
+    with pytest.raises(ValueError):
+        _check_constraints(ChartConstraints(**overrides))
+
+
+def test_generate_random_chart_reports_bad_constraints(tmp_path, capsys):
+    assert engine.generate_random_chart(tmp_path, seed=0, hold_length=(1, 1)) is None
+    assert "hold_length" in capsys.readouterr().out
+    assert not (tmp_path / "Random.txt").exists()
@@ -0,0 +1,115 @@
+import asyncio
+import json
+import socket
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import server
+
+
+def get_json(url, data=None, timeout=10):
+    with urllib.request.urlopen(url, data=data, timeout=timeout) as response:
+        return json.load(response)
+
+
+@pytest.fixture
+def async_server(tmp_path):
+    """AsyncFrontendServer with a single handler thread, run on its own event loop"""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    frontend = server.AsyncFrontendServer("127.0.0.1", port, workers=1)
+    loop = asyncio.new_event_loop()
+    task = loop.create_task(frontend._serve())
+
+    def run_loop():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(asyncio.wait([task]))
+        # 收尾：取消仍在处理中的连接协程
+        pending = asyncio.all_tasks(loop)
+        for pending_task in pending:
+            pending_task.cancel()
+        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.close()
+
+    thread = threading.Thread(target=run_loop, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 5
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            break
+        except OSError:
+            assert time.monotonic() < deadline
+            time.sleep(0.02)
+    try:
+        yield base_url
+    finally:
+        loop.call_soon_threadsafe(task.cancel)
+        thread.join(5)
+        frontend._executor.shutdown(wait=False)
+
+
+@pytest.fixture
+def fake_analysis(monkeypatch):
+    """分析任务的 runner 换成等待 release 的假实现"""
+    release = threading.Event()
+
+    def runner(on_progress, on_output, on_trace):
+        release.wait(10)
+        return True, "done"
+
+    monkeypatch.setattr(server.ANALYSIS_JOBS, "runner", runner)
+    monkeypatch.setattr(server.ANALYSIS_JOBS, "on_finished", None)
+    return release
+
+
+def test_json_long_polls_hold_no_handler_thread(async_server, fake_analysis):
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        before = server.ANALYSIS_EVENTS.last_id
+        run = pool.submit(get_json, f"{async_server}/chart_analysis/run?wait=1", b"")
+        deadline = time.monotonic() + 5
+        while server.ANALYSIS_EVENTS.last_id == before:  # 任务进入 running
+            assert time.monotonic() < deadline
+            time.sleep(0.02)
+        since = server.ANALYSIS_EVENTS.last_id
+        events_url = f"{async_server}{server.EVENTS_PATH}?format=json&wait=10&since={since}"
+        polls = [pool.submit(get_json, events_url) for _ in range(2)]
+        time.sleep(0.3)
+        assert not any(future.done() for future in polls + [run])
+
+        # 唯一的处理线程仍然空闲：普通请求立即得到响应
+        started = time.monotonic()
+        assert get_json(f"{async_server}{server.EVENTS_PATH}?format=json&since={since}")["events"] == []
+        assert time.monotonic() - started < 2
+
+        fake_analysis.set()
+        result = run.result(10)
+        assert result["success"] is True and result["job"]["status"] == "succeeded"
+        for future in polls:
+            body = future.result(10)
+            assert body["events"][0]["id"] == since + 1
+            assert body["events"][0]["data"]["status"] == "succeeded"
+
+
+def test_json_long_poll_times_out_empty(async_server):
+    since = server.ANALYSIS_EVENTS.last_id
+    started = time.monotonic()
+    body = get_json(f"{async_server}{server.EVENTS_PATH}?format=json&wait=0.3&since={since}")
+    assert body == {"success": True, "last_id": since, "events": []}
+    assert 0.25 <= time.monotonic() - started < 5
+
+
+def test_threaded_job_poll_wakes_on_change(frontend_server, fake_analysis):
+    base_url, _ = frontend_server
+    job = get_json(f"{base_url}/chart_analysis/run", b"")["job"]
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        poll = pool.submit(get_json, f"{base_url}{server.JOBS_PATH}{job['id']}?since={job['version']}&wait=10")
+        time.sleep(0.3)
+        fake_analysis.set()
+        assert poll.result(10)["job"]["version"] > job["version"]
@@ -0,0 +1,95 @@
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+import chart_engine.chart_engine as engine
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def verilog_dir(tmp_path, monkeypatch):
+    """verilog/ 的副本，process_chart 等改写的 MuseDash.v / ROM.v 都落在这里"""
+    target = tmp_path / "verilog"
+    shutil.copytree(REPO_ROOT / "verilog", target)
+    monkeypatch.setattr(engine, "VERILOG_DIR", target)
+    return target
+
+
+def load_copy(tmp_path, name):
+    """从 TXT 副本解析谱面，二进制旁路文件写在临时目录"""
+    path = tmp_path / f"{name}.txt"
+    shutil.copy(REPO_ROOT / "charts" / name / f"{name}.txt", path)
+    chart, error = engine.parse_chart(name, path, use_binary=False)
+    assert error is None
+    return chart
+
+
+def hardware_state(verilog_dir):
+    musedash = (verilog_dir / "MuseDash.v").read_text(encoding="utf-8")
+    div_cnt = int(re.search(r"parameter\s+div_cnt\s*=\s*(\d+)", musedash).group(1))
+    loaded = re.search(r'"\.\./verilog/([^"]+)"', (verilog_dir / "ROM.v").read_text(encoding="utf-8")).group(1)
+    return div_cnt, loaded
+
+
+def test_concurrent_process_keeps_rom_and_div_cnt_together(tmp_path, verilog_dir):
+    charts = [load_copy(tmp_path, "Cthugha"), load_copy(tmp_path, "Cyaegha")]
+    assert charts[0].bpm != charts[1].bpm
+    expected = {f"{chart.name}_ROM.hex": engine.bpm_to_div_cnt(chart.bpm) for chart in charts}
+
+    for _ in range(10):
+        barrier = threading.Barrier(len(charts))
+        results = []
+
+        def run(chart):
+            barrier.wait()
+            results.append(engine.process_chart(chart.name, f"{chart.name}_ROM.v", chart=chart))
+
+        threads = [threading.Thread(target=run, args=(chart,)) for chart in charts]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == [True, True]
+        div_cnt, loaded = hardware_state(verilog_dir)
+        assert expected[loaded] == div_cnt
+
+
+@pytest.mark.skipif(engine.fcntl is None, reason="进程间文件锁的检查用 fcntl")
+def test_hardware_lock_excludes_other_processes(verilog_dir):
+    probe = (
+        "import fcntl, sys\n"
+        f"handle = open({str(verilog_dir / '.hardware.lock')!r}, 'a+b')\n"
+        "try:\n"
+        "    fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)\n"
+        "except BlockingIOError:\n"
+        "    sys.exit(1)\n"
+    )
+    with engine.hardware_lock():
+        with engine.hardware_lock():  # 同一线程可重入
+            pass
+        assert subprocess.run([sys.executable, "-c", probe]).returncode == 1
+    assert subprocess.run([sys.executable, "-c", probe]).returncode == 0
+
+
+def test_rom_install_replaces_atomically(tmp_path, verilog_dir, monkeypatch):
+    # 副本中 div_cnt 为 Cyaegha 的值，处理 Cthugha 会改写 MuseDash.v
+    chart = load_copy(tmp_path, "Cthugha")
+    replaced = []
+    real_replace = os.replace
+
+    def spy(src, dst):
+        replaced.append(Path(dst).name)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(engine.os, "replace", spy)
+    assert engine.process_chart(chart.name, "Cthugha_ROM.v", chart=chart)
+    assert {"MuseDash.v", "Cthugha_ROM.hex", "ROM.v"} <= set(replaced)
+    assert not list(verilog_dir.glob(".*.tmp"))
+    assert hardware_state(verilog_dir) == (engine.bpm_to_div_cnt(chart.bpm), "Cthugha_ROM.hex")
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from chart_engine.chart_engine import HOLD_MID, HOLD_START, TAP, Chart, parse_chart
+from chart_engine.generator import ChartConstraints, generate_charts
+from chart_engine.simulator import (
+    LFSR_RESET, NO_NOTE, simulate_reference, simulate_replays, synthesize_presses,
+)
+
+LFSR_SEEDS = (LFSR_RESET, 0x1ABC)
+
+
+def repo_chart(name):
+    chart, error = parse_chart(name, use_binary=False)
+    assert error is None
+    return chart
+
+
+def assert_matches_reference(chart, pressed, samples_per_tick, div_cnt):
+    fast = simulate_replays(chart, pressed, samples_per_tick=samples_per_tick, div_cnt=div_cnt,
+                            lfsr_seed=np.array(LFSR_SEEDS[:len(pressed)]))
+    assert fast is not None
+    for idx, lfsr_seed in enumerate(LFSR_SEEDS[:len(pressed)]):
+        ref = simulate_reference(chart, pressed[idx], samples_per_tick=samples_per_tick, div_cnt=div_cnt,
+                                 lfsr_seed=lfsr_seed)
+        assert ref is not None
+        np.testing.assert_array_equal(fast.windows[idx], ref.windows[0])
+        np.testing.assert_array_equal(fast.note_results[idx], ref.note_results[0])
+        np.testing.assert_array_equal(fast.counts[idx], ref.counts[0])
+        assert fast.score[idx] == ref.score[0]
+    return fast
+
+
+@pytest.mark.parametrize("name, seed", [("Cthugha", 1), ("Cyaegha", 2), ("Random", 3)])
+def test_repo_charts_match_reference(name, seed):
+    chart = repo_chart(name)
+    pressed = synthesize_presses(chart, 2, timing_sigma=0.6, miss_rate=0.1, seed=seed)
+    fast = assert_matches_reference(chart, pressed, samples_per_tick=4, div_cnt=24)
+    # 回放确实产生了判定，而不是全为 NO_NOTE
+    assert (fast.windows != NO_NOTE).any()
+
+
+@pytest.mark.parametrize("samples_per_tick, div_cnt", [(1, 18), (2, 13), (4, 30), (8, 48)])
+def test_sample_rates_and_clock_ratios(samples_per_tick, div_cnt):
+    chart = repo_chart("Cyaegha")
+    pressed = synthesize_presses(chart, 1, samples_per_tick=samples_per_tick, timing_sigma=0.8,
+                                 miss_rate=0.1, seed=div_cnt)
+    assert_matches_reference(chart, pressed, samples_per_tick=samples_per_tick, div_cnt=div_cnt)
+
+
+@pytest.mark.parametrize("seed", [11, 12, 13])
+def test_generated_charts_match_reference(seed):
+    constraints = ChartConstraints(density=0.4, hold_ratio=0.3, max_ticks=600)
+    (chart,) = generate_charts(1, seed=seed, constraints=constraints)
+    pressed = synthesize_presses(chart, 2, timing_sigma=1.0, miss_rate=0.2, seed=seed)
+    assert_matches_reference(chart, pressed, samples_per_tick=4, div_cnt=24)
+
+
+def test_random_presses_match_reference():
+    # 与谱面无关的随机按键：覆盖乱按、连按与长按中途松开
+    chart = Chart("mixed", None, 120)
+    events = [(1, TAP, 0), (3, HOLD_START, 1), (4, HOLD_MID, 1), (5, HOLD_MID, 1), (5, TAP, 0),
+              (9, TAP, 1), (11, HOLD_START, 0), (12, HOLD_MID, 0), (13, HOLD_MID, 0), (13, TAP, 1)]
+    for time_val, code, track in events:
+        chart.times.append(time_val)
+        chart.types.append(code)
+        chart.tracks.append(track)
+    rng = np.random.default_rng(5)
+    pressed = rng.random((2, 200, 2)) < 0.5
+    assert_matches_reference(chart, pressed, samples_per_tick=4, div_cnt=24)
+
+
+def test_rejects_odd_sample_rate():
+    chart = repo_chart("Random")
+    pressed = synthesize_presses(chart, 1, samples_per_tick=3, seed=0)
+    assert simulate_replays(chart, pressed, samples_per_tick=3, div_cnt=36) is None
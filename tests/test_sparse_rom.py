@@ -0,0 +1,139 @@
+import pytest
+
+from chart_engine.chart_engine import (
+    HOLD_MID, HOLD_START, ROM_LEN, SPARSE_END, SPARSE_MAX_DEPTH, TAP, Chart,
+    build_rom_image, build_sparse_image, build_sparse_words, check_sparse_roundtrip,
+    decode_sparse, encode_sparse, format_sparse_hex, parse_chart, set_verilog_parameters,
+)
+
+REPO_CHARTS = ("Cthugha", "Cyaegha", "Random")
+
+
+def make_chart(events, bpm=120):
+    chart = Chart("test", None, bpm)
+    for time_val, code, track in events:
+        chart.times.append(time_val)
+        chart.types.append(code)
+        chart.tracks.append(track)
+    return chart
+
+
+def run_sparse_rom(entries, ticks):
+    """按 Sparse_ROM.v 的寄存器行为逐 clk_div 输出 {noteup, notedown}"""
+    rom = bytes(entries)
+    ptr = gap = 0
+    out = bytearray()
+    for _ in range(ticks):
+        entry = rom[ptr]
+        done = entry == SPARSE_END
+        hit = gap == entry >> 4
+        out.append(entry & 0xF if hit and not done else 0)
+        if done:
+            continue
+        if hit:
+            ptr += 1
+            gap = 0
+        else:
+            gap += 1
+    return out
+
+
+def assert_matches_dense(chart):
+    dense = build_rom_image(chart)
+    entries = build_sparse_image(chart)
+    assert entries is not None
+    assert entries[-1] == SPARSE_END and SPARSE_END not in entries[:-1]
+    decoded = decode_sparse(entries)
+    assert decoded + bytes(ROM_LEN - len(decoded)) == dense
+    assert run_sparse_rom(entries, ROM_LEN) == dense
+    return entries
+
+
+@pytest.mark.parametrize("name", REPO_CHARTS)
+def test_repo_charts_roundtrip(name):
+    chart, error = parse_chart(name, use_binary=False)
+    assert error is None
+    entries = assert_matches_dense(chart)
+    assert check_sparse_roundtrip(chart)
+    # 表项只覆盖非空字与补齐项，8 位表项的总位数应小于稠密 ROM
+    assert len(entries) * 8 < ROM_LEN * 4
+
+
+@pytest.mark.parametrize("gap", [0, 1, 14, 15, 16, 17, 31, 32, 33, 100])
+def test_gap_lengths(gap):
+    chart = make_chart([(0, TAP, 0), (gap + 1, TAP, 1)])
+    entries = assert_matches_dense(chart)
+    fillers = gap // 16
+    assert len(entries) == 2 + fillers + 1
+    assert entries[1 + fillers] >> 4 == gap - 16 * fillers
+
+
+def test_exact_gap_boundaries():
+    # 15 个空字用一个 delta=15 的表项；16 / 31 个空字需要一个 {15, 0} 补齐项
+    assert encode_sparse(bytes(15) + b"\x01") == bytes([0xF1, SPARSE_END])
+    assert encode_sparse(bytes(16) + b"\x01") == bytes([0xF0, 0x01, SPARSE_END])
+    assert encode_sparse(bytes(31) + b"\x01") == bytes([0xF0, 0xF1, SPARSE_END])
+
+
+def test_event_at_zero():
+    chart = make_chart([(0, HOLD_START, 0), (1, HOLD_MID, 0), (0, TAP, 1)])
+    entries = assert_matches_dense(chart)
+    assert entries[0] == (TAP << 2 | HOLD_START)
+
+
+def test_leading_gap():
+    entries = assert_matches_dense(make_chart([(40, TAP, 0)]))
+    assert list(entries) == [0xF0, 0xF0, 0x81, SPARSE_END]
+
+
+def test_empty_chart():
+    chart = make_chart([])
+    assert build_sparse_words(chart) == bytearray()
+    entries = assert_matches_dense(chart)
+    assert entries == bytes([SPARSE_END])
+    assert format_sparse_hex(entries) == "00\n"
+
+
+def test_long_chart_beyond_dense_rom():
+    chart = make_chart([(0, TAP, 0), (ROM_LEN * 3, TAP, 1)])
+    assert build_rom_image(chart) is None
+    entries = build_sparse_image(chart)
+    words = build_sparse_words(chart)
+    assert decode_sparse(entries) == words
+    assert run_sparse_rom(entries, len(words) + 16) == words + bytes(16)
+    assert check_sparse_roundtrip(chart)
+
+
+def test_overflow_past_max_depth():
+    # 每隔一个 tick 一个音符：每个事件一个表项，加结束标记
+    fits = make_chart([(2 * i, TAP, 0) for i in range(SPARSE_MAX_DEPTH - 1)])
+    entries = build_sparse_image(fits)
+    assert len(entries) == SPARSE_MAX_DEPTH
+    overflow = make_chart([(2 * i, TAP, 0) for i in range(SPARSE_MAX_DEPTH)])
+    assert build_sparse_image(overflow) is None
+
+
+def test_sparse_hex_is_unpadded():
+    entries = encode_sparse(bytes(20) + b"\x05\x00\x0a")
+    text = format_sparse_hex(entries)
+    assert text.splitlines() == ["f0", "45", "1a", "00"]
+    assert bytes(int(line, 16) for line in text.split()) == entries
+
+
+def test_set_verilog_parameters():
+    source = (
+        "module MuseDash #(\n"
+        "    parameter div_cnt = 1875000,\n"
+        "    parameter SPARSE = 0,\n"
+        '    parameter SPARSE_INIT = "../verilog/ROM.sparse.hex",\n'
+        "    parameter SPARSE_DEPTH = 2048\n"
+        ") ();\n"
+    )
+    updated = set_verilog_parameters(source, {
+        "SPARSE": 1, "SPARSE_INIT": "../verilog/Cthugha_ROM.sparse.hex", "SPARSE_DEPTH": 981,
+    })
+    assert "parameter SPARSE = 1," in updated
+    assert 'parameter SPARSE_INIT = "../verilog/Cthugha_ROM.sparse.hex",' in updated
+    assert "parameter SPARSE_DEPTH = 981\n" in updated
+    assert "parameter div_cnt = 1875000," in updated
+    assert set_verilog_parameters(updated, {"SPARSE_DEPTH": 981}) == updated
@@ -0,0 +1,105 @@
+import gzip
+import http.client
+import urllib.parse
+
+import pytest
+
+BINARY = bytes(range(256)) * 16  # 4096 字节，image/png 不压缩，支持 Range
+TEXT = ("const notes = [];\n" * 200).encode("utf-8")  # 3600 字节，application/javascript 走 gzip
+
+
+@pytest.fixture
+def static_root(frontend_server):
+    base_url, root = frontend_server
+    (root / "cover.png").write_bytes(BINARY)
+    (root / "app.js").write_bytes(TEXT)
+    return urllib.parse.urlsplit(base_url).netloc
+
+
+def fetch(netloc, path, **headers):
+    """返回 (状态码, 响应头, 响应体)；304/416 等状态不抛异常"""
+    connection = http.client.HTTPConnection(netloc, timeout=10)
+    try:
+        connection.request("GET", path, headers=headers)
+        response = connection.getresponse()
+        return response.status, response.headers, response.read()
+    finally:
+        connection.close()
+
+
+def test_full_response_carries_validators(static_root):
+    status, headers, body = fetch(static_root, "/cover.png")
+    assert status == 200
+    assert body == BINARY
+    assert headers["Accept-Ranges"] == "bytes"
+    assert headers["ETag"].startswith('"') and headers["Last-Modified"]
+
+
+def test_if_none_match_gives_304(static_root):
+    etag = fetch(static_root, "/cover.png")[1]["ETag"]
+    status, headers, body = fetch(static_root, "/cover.png", **{"If-None-Match": f'"other", W/{etag}'})
+    assert (status, body) == (304, b"")
+    assert headers["ETag"] == etag
+    assert fetch(static_root, "/cover.png", **{"If-None-Match": '"other"'})[0] == 200
+
+
+def test_etag_follows_content(frontend_server, static_root):
+    _, root = frontend_server
+    etag = fetch(static_root, "/cover.png")[1]["ETag"]
+    (root / "cover.png").write_bytes(BINARY[::-1])
+    status, headers, body = fetch(static_root, "/cover.png", **{"If-None-Match": etag})
+    assert status == 200 and body == BINARY[::-1]
+    assert headers["ETag"] != etag
+
+
+@pytest.mark.parametrize("header, start, end", [
+    ("bytes=0-99", 0, 99),
+    ("bytes=4000-", 4000, 4095),
+    ("bytes=-10", 4086, 4095),
+    ("bytes=4090-9999", 4090, 4095),
+])
+def test_range_gives_206(static_root, header, start, end):
+    status, headers, body = fetch(static_root, "/cover.png", Range=header, **{"Accept-Encoding": "gzip"})
+    assert status == 206
+    assert headers["Content-Range"] == f"bytes {start}-{end}/{len(BINARY)}"
+    assert headers["Content-Length"] == str(end - start + 1)
+    assert "Content-Encoding" not in headers
+    assert body == BINARY[start:end + 1]
+
+
+@pytest.mark.parametrize("header", ["bytes=4096-", "bytes=5000-6000", "bytes=-0"])
+def test_unsatisfiable_range_gives_416(static_root, header):
+    status, headers, body = fetch(static_root, "/cover.png", Range=header)
+    assert (status, body) == (416, b"")
+    assert headers["Content-Range"] == f"bytes */{len(BINARY)}"
+
+
+@pytest.mark.parametrize("header", ["bytes=0-1,5-6", "items=0-1", "bytes=10-5"])
+def test_ignored_range_gives_full_body(static_root, header):
+    status, _, body = fetch(static_root, "/cover.png", Range=header)
+    assert (status, body) == (200, BINARY)
+
+
+def test_if_range(static_root):
+    etag = fetch(static_root, "/cover.png")[1]["ETag"]
+    status, _, body = fetch(static_root, "/cover.png", Range="bytes=0-9", **{"If-Range": etag})
+    assert (status, body) == (206, BINARY[:10])
+    # 验证器不匹配（文件已变化）：返回完整的 200
+    status, headers, body = fetch(static_root, "/cover.png", Range="bytes=0-9", **{"If-Range": '"stale"'})
+    assert (status, body) == (200, BINARY)
+    assert "Content-Range" not in headers
+
+
+def test_gzip_never_combined_with_range(static_root):
+    status, headers, body = fetch(static_root, "/app.js", **{"Accept-Encoding": "gzip"})
+    assert status == 200 and headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(body) == TEXT
+    assert headers["ETag"].endswith('-gz"')
+
+    # 可压缩的文件不支持 Range：不论是否接受 gzip 都返回完整内容，而不是压缩后的片段
+    status, headers, body = fetch(static_root, "/app.js", Range="bytes=0-9", **{"Accept-Encoding": "gzip"})
+    assert status == 200 and "Content-Range" not in headers
+    assert gzip.decompress(body) == TEXT
+    status, headers, body = fetch(static_root, "/app.js", Range="bytes=0-9")
+    assert (status, body) == (200, TEXT)
+    assert "Content-Encoding" not in headers and "Content-Range" not in headers
@@ -1,18 +1,36 @@
-module Address_Generator (
+module Address_Generator #(
+    parameter ADDR_WIDTH = 12
+) (
     input clk_div,
     input rst_n,
+    input [2:0] bank,
 
-    output reg [11:0] address
+    output [ADDR_WIDTH-1:0] address,
+    output reg [24:0] div_cnt
 );
 
+// bank 表（由 chart_engine 生成）：base 为谱面起始地址，last 为最后一个字的偏移
+reg [ADDR_WIDTH-1:0] base;
+reg [ADDR_WIDTH-1:0] last;
+reg [ADDR_WIDTH-1:0] offset;
+
+always @(*) begin
+    case(bank)
+        3'd0: begin base = 'd0; last = 'd4095; div_cnt = 25'd0; end
+        default: begin base = 'd0; last = 'd4095; div_cnt = 25'd0; end
+    endcase
+end
+
 always @(posedge clk_div or negedge rst_n) begin
     if(!rst_n) begin
-        address <= 12'd0;
-    end else if(address == 12'd4095) begin
-        address <= address;
+        offset <= 'd0;
+    end else if(offset == last) begin
+        offset <= offset;
     end else begin
-        address <= address + 12'd1;
+        offset <= offset + 'd1;
     end
 end
-    
-endmodule
\ No newline at end of file
+
+assign address = base + offset;
+
+endmodule
@@ -1,9 +1,9 @@
-module Clk_Div #(
-    parameter div_cnt = 2500000 // 50MHz to 10Hz (100ms)
-    // div_cnt = 50,000,000 / (bpm * 4 / 60) / 2 = 375,000,000 / bpm;
-)(
+module Clk_Div (
     input clk,
     input rst_n,
+    input [24:0] div_cnt, // 50MHz to 10Hz (100ms): 2500000
+    // div_cnt = 50,000,000 / (bpm * 4 / 60) / 2 = 375,000,000 / bpm;
+    // 运行时可切换（多谱面 bank），用 >= 比较，切换到更小的值时不会溢出回绕
 
     output reg clk_div
 );
@@ -15,7 +15,7 @@ always @(posedge clk or negedge rst_n) begin
         cnt <= 'd0;
         clk_div <= 'd0;
     end
-    else if(cnt == div_cnt - 1) begin
+    else if(cnt >= div_cnt - 1) begin
         clk_div <= ~clk_div;
         cnt <= 'd0;
     end
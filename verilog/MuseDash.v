@@ -1,12 +1,18 @@
 module MuseDash #(
-    parameter div_cnt = 1875000 
+    parameter div_cnt = 1875000, 
     // div_cnt = 50,000,000 / (bpm * 4 / 60) / 2 = 375,000,000 / bpm;
+    parameter BANKED = 0,       // 1: 多谱面 ROM，div_cnt 取自 Address_Generator 的 bank 表
+    parameter ADDR_WIDTH = 12,  // ROM 地址位宽，与生成的 ROM.v / Address_Generator.v 一致
+    parameter SPARSE = 0,       // 1: 谱面由 Sparse_ROM 解码 SPARSE_INIT，替代 Address_Generator + ROM
+    parameter SPARSE_INIT = "../verilog/ROM.sparse.hex",
+    parameter SPARSE_DEPTH = 2048  // SPARSE_INIT 的表项数，由 chart_engine 写入
 ) (
     input           clk,
     input           rst_n,//rst_n要不用开关吧
     input           restart,
     input           clickup,
     input           clickdown,
+    input [2:0]     bank_sel,        //bank（曲目）选择，restart 期间锁存
 
     output          LCD_E,           //1602使能引脚，1时读取信息，1->0（下降沿）执行命令  
     output          LCD_RS,          //1602数据——H/命令——L  选择端  
@@ -59,26 +65,37 @@ wire [1:0] next_noteup;
 wire [1:0] next_notedown;
 wire [15:0] total_score;
 wire [15:0] cur_score;
-wire [11:0] rom_addr;
+wire [ADDR_WIDTH-1:0] rom_addr;
+wire [24:0] bank_div_cnt;
+reg [2:0] bank;
 
 //clk_div
-Clk_Div #(
-    .div_cnt(div_cnt)
-) clock_divider (
+Clk_Div clock_divider (
     .clk (clk),
     .rst_n (rst_n),
+    .div_cnt (BANKED ? bank_div_cnt : div_cnt),
 
     .clk_div (clk_div)
 );
 
 //address
-Address_Generator addr_gen(
+Address_Generator #(
+    .ADDR_WIDTH(ADDR_WIDTH)
+) addr_gen (
     .clk_div (clk_div),
     .rst_n (address_rst_n),
+    .bank (bank),
 
-    .address (rom_addr)
+    .address (rom_addr),
+    .div_cnt (bank_div_cnt)
 );
 
+//bank：restart（或复位）期间跟随开关，松开后保持，换曲只需拨开关再 restart
+always @(posedge clk) begin
+    if(restart_and_rst_n_debounced)
+        bank <= bank_sel;
+end
+
 //7seg
 CurrentJudge7Seg cur_judgeup_7seg(
     .judgement (cur_resultup),
@@ -187,12 +204,27 @@ Queue note_queue(
 );
 
 //ROM
-ROM chart(
-    .addr (rom_addr),
-    
-    .noteup (rom_noteup),
-    .notedown (rom_notedown)
-);
+generate
+if (SPARSE) begin : sparse_chart
+    Sparse_ROM #(
+        .INIT_FILE (SPARSE_INIT),
+        .DEPTH (SPARSE_DEPTH)
+    ) chart(
+        .clk_div (clk_div),
+        .rst_n (address_rst_n),
+
+        .noteup (rom_noteup),
+        .notedown (rom_notedown)
+    );
+end else begin : dense_chart
+    ROM chart(
+        .addr (rom_addr),
+        
+        .noteup (rom_noteup),
+        .notedown (rom_notedown)
+    );
+end
+endgenerate
 
 // logic
 assign prev_noteup = {queue_noteup_bit1[0],queue_noteup_bit0[0]};
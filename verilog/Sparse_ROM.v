@@ -0,0 +1,45 @@
+module Sparse_ROM #(
+    parameter INIT_FILE = "../verilog/ROM.sparse.hex",
+    parameter DEPTH = 2048      // 表项数（含结束标记），与 INIT_FILE 的行数一致
+) (
+    input clk_div,
+    input rst_n,
+
+    output [1:0] noteup,
+    output [1:0] notedown
+);
+
+// 稀疏谱面（由 chart_engine 以 sparse 格式生成），替代 Address_Generator + ROM：
+// 每个表项 {delta[3:0], word[3:0]}，先输出 delta 个空字，再输出 word；8'h00 为结束标记，之后一直输出空字
+localparam PTR_WIDTH = (DEPTH > 1) ? $clog2(DEPTH) : 1;
+
+reg [7:0] ROM [0:DEPTH-1];
+
+initial begin
+    $readmemh(INIT_FILE, ROM);
+end
+
+reg [PTR_WIDTH-1:0] ptr;
+reg [3:0] gap;
+
+wire [7:0] entry = ROM[ptr];
+wire done = (entry == 8'h00);
+wire hit = (gap == entry[7:4]);
+
+assign {noteup, notedown} = (hit && !done) ? entry[3:0] : 4'b0000;
+
+always @(posedge clk_div or negedge rst_n) begin
+    if(!rst_n) begin
+        ptr <= 'd0;
+        gap <= 'd0;
+    end else if(done) begin
+        ptr <= ptr;
+    end else if(hit) begin
+        ptr <= ptr + 1'b1;
+        gap <= 'd0;
+    end else begin
+        gap <= gap + 1'b1;
+    end
+end
+
+endmodule